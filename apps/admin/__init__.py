@@ -1,5 +1,7 @@
-from apps.admin.analytics import UserActivityAdmin
+from apps.admin.analytics import JobRunAdmin, RequestSampleAdmin, UserActivityAdmin
 from apps.admin.exercises import ExerciseAdmin
-from apps.admin.payments import PaymentAdmin, SubscriptionAdmin
+from apps.admin.media import ImageDerivativeAdmin, ImageDerivativeJobAdmin, TranscodeJobAdmin
+from apps.admin.payments import PaymentAdmin, PaymentMethodAdmin, SubscriptionAdmin
+from apps.admin.telegram import BroadcastAdmin, OutboxMessageAdmin, TelegramUpdateAdmin
 from apps.admin.users import UserProfileAdmin
 from apps.admin.workouts import EditionAdmin, ProgramAdmin
@@ -1,4 +1,4 @@
-from apps.models import UserActivity
+from apps.models import JobRun, RequestSample, UserActivity
 from django.contrib import admin
 
 
@@ -8,3 +8,19 @@ class UserActivityAdmin(admin.ModelAdmin):
     list_filter = ['event', 'created_at']
     search_fields = ['user__telegram_id']
     readonly_fields = ['created_at']
+
+
+@admin.register(RequestSample)
+class RequestSampleAdmin(admin.ModelAdmin):
+    list_display = ['url_name', 'method', 'status_code', 'duration_ms', 'sql_count', 'template_ms', 'created_at']
+    list_filter = ['url_name', 'method', 'status_code']
+    date_hierarchy = 'created_at'
+
+
+@admin.register(JobRun)
+class JobRunAdmin(admin.ModelAdmin):
+    list_display = ['name', 'scheduled_for', 'status', 'rows_affected', 'duration_ms', 'finished_at']
+    list_filter = ['name', 'status']
+    date_hierarchy = 'scheduled_for'
+    readonly_fields = ['name', 'scheduled_for', 'status', 'rows_affected', 'duration_ms', 'error', 'started_at',
+                       'finished_at']
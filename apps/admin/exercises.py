@@ -1,5 +1,6 @@
-from apps.models import Exercise, ExerciseInstruction, Workout
+from apps.models import Exercise, ExerciseInstruction, TranscodeJob, VideoRendition, Workout
 from django.contrib import admin
+from django.db.models import OuterRef, Subquery
 
 
 class ExerciseInstructionInline(admin.TabularInline):
@@ -7,10 +8,44 @@ class ExerciseInstructionInline(admin.TabularInline):
     extra = 1
 
 
+class TranscodeJobInline(admin.TabularInline):
+    model = TranscodeJob
+    fields = ['status', 'progress', 'attempts', 'source', 'output', 'last_error', 'created_at', 'finished_at']
+    readonly_fields = fields
+    extra = 0
+    max_num = 0
+    can_delete = False
+    show_change_link = True
+
+
+class VideoRenditionInline(admin.TabularInline):
+    model = VideoRendition
+    fields = ['kind', 'height', 'width', 'bitrate', 'size', 'file', 'created_at']
+    readonly_fields = fields
+    extra = 0
+    max_num = 0
+    can_delete = False
+
+
 @admin.register(Exercise)
 class ExerciseAdmin(admin.ModelAdmin):
-    list_display = ("id", "name", "primary_body_part", "calory")
+    list_display = ("id", "name", "primary_body_part", "calory", "video_status")
     list_filter = ("primary_body_part",)
     search_fields = ("name",)
-    inlines = [ExerciseInstructionInline]
+    inlines = [ExerciseInstructionInline, TranscodeJobInline, VideoRenditionInline]
+
+    def get_queryset(self, request):
+        # Oxirgi transcode holati bitta so'rovda - ro'yxatda N+1 bo'lmaydi
+        latest = TranscodeJob.objects.filter(exercise=OuterRef('pk')).order_by('-created_at')
+        return super().get_queryset(request).annotate(
+            transcode_status=Subquery(latest.values('status')[:1]),
+            transcode_progress=Subquery(latest.values('progress')[:1]),
+        )
 
+    @admin.display(description="Video")
+    def video_status(self, obj):
+        if obj.transcode_status is None:
+            return '-'
+        if obj.transcode_status == TranscodeJob.StatusChoices.PROCESSING:
+            return f"{obj.transcode_progress:.0f}%"
+        return TranscodeJob.StatusChoices(obj.transcode_status).label
@@ -0,0 +1,41 @@
+from apps.models import ImageDerivative, ImageDerivativeJob, TranscodeJob
+from django.contrib import admin
+from django.utils import timezone
+
+
+@admin.register(TranscodeJob)
+class TranscodeJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'exercise', 'status', 'progress', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status']
+    search_fields = ['exercise__name', 'source']
+    list_select_related = ['exercise']
+    readonly_fields = ['exercise', 'source', 'output', 'status', 'progress', 'attempts', 'last_error',
+                       'available_at', 'locked_at', 'created_at', 'started_at', 'finished_at']
+    actions = ['retry']
+
+    @admin.action(description="Qayta navbatga qo'yish")
+    def retry(self, request, queryset):
+        updated = queryset.exclude(status=TranscodeJob.StatusChoices.PROCESSING).update(
+            status=TranscodeJob.StatusChoices.PENDING,
+            attempts=0,
+            progress=0,
+            available_at=timezone.now(),
+            finished_at=None,
+        )
+        self.message_user(request, f"{updated} ta job navbatga qo'yildi")
+
+
+@admin.register(ImageDerivativeJob)
+class ImageDerivativeJobAdmin(admin.ModelAdmin):
+    list_display = ['id', 'source', 'status', 'attempts', 'created_at', 'finished_at']
+    list_filter = ['status']
+    search_fields = ['source']
+    readonly_fields = ['source', 'status', 'attempts', 'last_error', 'available_at', 'locked_at', 'created_at',
+                       'finished_at']
+
+
+@admin.register(ImageDerivative)
+class ImageDerivativeAdmin(admin.ModelAdmin):
+    list_display = ['source', 'format', 'width', 'height', 'size', 'created_at']
+    list_filter = ['format', 'width']
+    search_fields = ['source']
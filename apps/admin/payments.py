@@ -1,4 +1,4 @@
-from apps.models import Payment, Subscription
+from apps.models import Payment, PaymentMethod, Subscription
 from django.contrib import admin
 
 from apps.models.payments import SubscriptionPlan
@@ -6,13 +6,23 @@ from apps.models.payments import SubscriptionPlan
 
 @admin.register(Subscription)
 class SubscriptionAdmin(admin.ModelAdmin):
-    list_display = ['user', 'start_date', 'end_date', 'is_active']
+    list_display = ['user', 'start_date', 'end_date', 'is_active', 'auto_renew', 'renewal_attempts']
+    list_filter = ['is_active', 'auto_renew']
 
 
 @admin.register(Payment)
 class PaymentAdmin(admin.ModelAdmin):
-    list_display = ['user', 'status', 'is_auto_payment', 'auto_payment_attempt', 'created_at', 'completed_at']
+    list_display = ['user', 'plan', 'amount', 'status', 'is_auto_payment', 'auto_payment_attempt', 'created_at',
+                    'completed_at']
+    search_fields = ['click_trans_id', 'transaction_id']
 
 @admin.register(SubscriptionPlan)
 class SubscriptionPlanAdmin(admin.ModelAdmin):
     pass
+
+
+@admin.register(PaymentMethod)
+class PaymentMethodAdmin(admin.ModelAdmin):
+    list_display = ['user', 'card_last_four', 'expires_at', 'is_active', 'created_at']
+    list_filter = ['is_active']
+    exclude = ['card_token']
@@ -0,0 +1,28 @@
+from apps.models import Broadcast, OutboxMessage, TelegramUpdate
+from django.contrib import admin
+
+
+@admin.register(Broadcast)
+class BroadcastAdmin(admin.ModelAdmin):
+    list_display = ['id', 'audience', 'status', 'sent_count', 'blocked_count', 'failed_count', 'created_at']
+    list_filter = ['status', 'audience']
+    readonly_fields = [
+        'status', 'last_profile_id', 'sent_count', 'blocked_count', 'failed_count', 'retried_count', 'errors',
+        'started_at', 'finished_at',
+    ]
+
+
+@admin.register(TelegramUpdate)
+class TelegramUpdateAdmin(admin.ModelAdmin):
+    list_display = ['update_id', 'status', 'attempts', 'received_at', 'processed_at']
+    list_filter = ['status']
+    search_fields = ['update_id']
+    readonly_fields = ['update_id', 'payload', 'attempts', 'last_error', 'received_at', 'processed_at']
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    list_display = ['id', 'chat_id', 'status', 'attempts', 'created_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['chat_id']
+    readonly_fields = ['attempts', 'last_error', 'created_at', 'sent_at']
@@ -10,6 +10,7 @@ class AppsConfig(AppConfig):
         """
         Django ishga tushishi bilan avtomatik webhook o‘rnatadi.
         """
+        from apps import signals  # noqa: F401
 
         if not BOT_TOKEN or not WEBAPP_URL:
             print("❌ BOT_TOKEN yoki WEBHOOK_URL topilmadi (.env ni tekshiring)")
@@ -0,0 +1,393 @@
+"""
+Shablonlardagi inline <style>/<script> bloklar uchun asset pipeline: manbalar ASSETS_SOURCE_DIR da
+(assets/css/<nom>.css, assets/js/<nom>.js), build_assets ularni minify qiladi va kontent hash li nomlar bilan
+ASSETS_BUILD_DIR ga yozadi (manifest.json). Shablonlar {% css_bundle %} / {% js_bundle %} orqali ulanadi -
+brauzer bundle ni bir marta yuklab keshlaydi, HTML esa har navigatsiyada shuncha kichik.
+"""
+import gzip
+import hashlib
+import json
+import os
+import re
+import textwrap
+import threading
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+KINDS = ('css', 'js')
+MANIFEST_NAME = 'manifest.json'
+# Build natijasi static papkada: static('bundles/<fayl>')
+STATIC_PREFIX = 'bundles'
+
+_lock = threading.Lock()
+_manifest = (None, {})  # (mtime_ns, ma'lumot)
+
+
+# ---------------------------------------------------------------- minify
+
+CSS_PART = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|/\*.*?\*/|[^"\'/]+|/', re.S)
+
+
+def minify_css(source):
+    """Izohlar va ortiqcha bo'shliqlar olib tashlanadi; satrlar va calc() dagi +/- atrofi tegilmaydi."""
+    parts = ['']
+    for match in CSS_PART.finditer(source):
+        token = match.group()
+        if token[0] in '"\'':
+            parts += [token, '']
+        else:
+            # Izoh o'rniga bo'shliq: a/**/b -> a b
+            parts[-1] += ' ' if token.startswith('/*') else token
+    for index in range(0, len(parts), 2):
+        code = re.sub(r'\s+', ' ', parts[index])
+        code = re.sub(r' ?([{};,]) ?', r'\1', code)
+        parts[index] = code.replace(': ', ':').replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+# Bulardan keyin "/" regex boshlaydi, bo'linish emas
+REGEX_AFTER_CHARS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_AFTER_WORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw',
+                     'instanceof', 'yield', 'await'}
+# Yangi qatordan oldin/keyin kelganda qator tashlanishi ASI ga ta'sir qilmaydi
+JS_JOIN_AFTER = set('{;,(')
+JS_JOIN_BEFORE = set('})')
+JS_WORD = re.compile(r'[\w$\u0080-\uffff]+')
+
+
+def _read_string(source, i, quote):
+    j = i + 1
+    while j < len(source) and source[j] != quote:
+        j += 2 if source[j] == '\\' else 1
+    return j + 1
+
+
+def _read_regex(source, i):
+    j, in_class = i + 1, False
+    while j < len(source) and (source[j] != '/' or in_class):
+        if source[j] == '\\':
+            j += 1
+        elif source[j] in '[]':
+            in_class = source[j] == '['
+        j += 1
+    # Flag lar: /.../gi
+    flags = JS_WORD.match(source, j + 1)
+    return flags.end() if flags else j + 1
+
+
+def _read_template(source, j):
+    """` yoki ${} ifoda oxiridan keyin: keyingi ` yoki ${ gacha. Returns: (oxiri, ${ ochildimi)."""
+    while j < len(source):
+        if source[j] == '\\':
+            j += 2
+        elif source[j] == '`':
+            return j + 1, False
+        elif source.startswith('${', j):
+            return j + 2, True
+        else:
+            j += 1
+    return j, False
+
+
+def _read_blank(source, i):
+    """Bo'shliqlar va izohlar ketma-ketligi oxiri."""
+    n = len(source)
+    while i < n:
+        if source[i].isspace():
+            i += 1
+        elif source.startswith('//', i):
+            end = source.find('\n', i)
+            i = n if end == -1 else end
+        elif source.startswith('/*', i):
+            end = source.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+        else:
+            break
+    return i
+
+
+def _regex_allowed(previous):
+    if not previous:
+        return True
+    if JS_WORD.fullmatch(previous):
+        return previous in REGEX_AFTER_WORDS
+    return previous in REGEX_AFTER_CHARS
+
+
+def js_tokens(source):
+    """(tur, matn) lar: 'literal' (satr, template, regex), 'space', 'newline' va 'code' (so'z yoki belgi)."""
+    # Ochiq ${ ... } ifodalar: har biri uchun ichidagi ochiq figurali qavslar soni
+    templates = []
+    previous = ''
+    i, n = 0, len(source)
+    while i < n:
+        char = source[i]
+        if char in '"\'':
+            j, kind = _read_string(source, i, char), 'literal'
+        elif char == '`' or (char == '}' and templates and templates[-1] == 0):
+            if char == '}':
+                templates.pop()
+            j, opened = _read_template(source, i + 1)
+            if opened:
+                templates.append(0)
+            kind = 'literal'
+        elif char.isspace() or source.startswith(('//', '/*'), i):
+            j = _read_blank(source, i)
+            kind = 'newline' if '\n' in source[i:j] else 'space'
+        elif char == '/' and _regex_allowed(previous):
+            j, kind = _read_regex(source, i), 'literal'
+        else:
+            word = JS_WORD.match(source, i)
+            j, kind = (word.end() if word else i + 1), 'code'
+            if templates and char in '{}':
+                templates[-1] += 1 if char == '{' else -1
+        text = source[i:j]
+        if kind in ('literal', 'code'):
+            previous = text
+        yield kind, text
+        i = j
+
+
+def _needs_space(previous, following):
+    if JS_WORD.match(previous) and (JS_WORD.match(following) or (following == '.' and previous.isdigit())):
+        return True
+    # a + +b, a - -b
+    return previous in '+-' and following == previous
+
+
+def minify_js(source):
+    """
+    Konservativ minify: izohlar va ortiqcha bo'shliqlar olib tashlanadi. Satrlar, template literal lar va
+    regex lar o'zgarmaydi; ASI ga ta'sir qilishi mumkin bo'lgan yangi qatorlar qoldiriladi.
+    """
+    result = []
+    pending = None
+    for kind, text in js_tokens(source):
+        if kind in ('space', 'newline'):
+            pending = 'newline' if 'newline' in (pending, kind) else kind
+            continue
+        if pending and result:
+            previous, following = result[-1][-1], text[0]
+            if pending == 'newline' and previous not in JS_JOIN_AFTER and following not in JS_JOIN_BEFORE:
+                result.append('\n')
+            elif _needs_space(previous, following):
+                result.append(' ')
+        pending = None
+        result.append(text)
+    return ''.join(result)
+
+
+MINIFIERS = {'css': minify_css, 'js': minify_js}
+
+
+# ---------------------------------------------------------------- build
+
+def source_dir():
+    return str(settings.ASSETS_SOURCE_DIR)
+
+
+def build_dir():
+    return str(settings.ASSETS_BUILD_DIR)
+
+
+def manifest_path():
+    return os.path.join(build_dir(), MANIFEST_NAME)
+
+
+def sources():
+    """Returns: {(nom, tur): fayl yo'li}, masalan assets/css/users/settings.css -> ('users/settings', 'css')."""
+    found = {}
+    for kind in KINDS:
+        root = os.path.join(source_dir(), kind)
+        for directory, _, files in os.walk(root):
+            for filename in files:
+                if filename.endswith('.' + kind):
+                    path = os.path.join(directory, filename)
+                    name = os.path.relpath(path, root)[:-len(kind) - 1].replace(os.sep, '/')
+                    found[(name, kind)] = path
+    return found
+
+
+def write_atomic(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = f'{path}.{os.getpid()}.tmp'
+    with open(temporary, 'wb') as f:
+        f.write(content)
+    os.replace(temporary, path)
+
+
+def build():
+    """Barcha bundle larni minify qilib hash li nomlar bilan yozadi. Returns: manifest."""
+    manifest = {}
+    for (name, kind), path in sorted(sources().items()):
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        content = MINIFIERS[kind](source).encode()
+        digest = hashlib.sha256(content).hexdigest()[:12]
+        filename = f'{name}.{digest}.{kind}'
+        output = os.path.join(build_dir(), filename)
+        if not os.path.exists(output):
+            write_atomic(output, content)
+        manifest[f'{name}.{kind}'] = {
+            'file': filename,
+            'source': len(source.encode()),
+            'minified': len(content),
+            'gzip': len(gzip.compress(content, compresslevel=9, mtime=0)),
+        }
+
+    # Eski build lardan qolgan fayllar
+    current = {entry['file'] for entry in manifest.values()}
+    for directory, _, files in os.walk(build_dir()):
+        for filename in files:
+            relative = os.path.relpath(os.path.join(directory, filename), build_dir()).replace(os.sep, '/')
+            if relative != MANIFEST_NAME and relative not in current:
+                os.remove(os.path.join(directory, filename))
+
+    write_atomic(manifest_path(), json.dumps(manifest, indent=2, sort_keys=True).encode())
+    return manifest
+
+
+def is_stale():
+    try:
+        built = os.stat(manifest_path()).st_mtime_ns
+    except FileNotFoundError:
+        return True
+    with open(manifest_path(), encoding='utf-8') as f:
+        names = set(json.load(f))
+    found = sources()
+    if names != {f'{name}.{kind}' for name, kind in found}:
+        return True
+    return any(os.stat(path).st_mtime_ns > built for path in found.values())
+
+
+def load_manifest():
+    """DEBUG da manbalar o'zgargan bo'lsa qayta build qilinadi; productionda build_assets oldindan ishlatiladi."""
+    global _manifest
+    with _lock:
+        if settings.DEBUG and is_stale():
+            build()
+        try:
+            mtime = os.stat(manifest_path()).st_mtime_ns
+        except FileNotFoundError:
+            raise ImproperlyConfigured(
+                "Asset manifest topilmadi: collectstatic dan oldin 'python manage.py build_assets' ishlating"
+            )
+        if _manifest[0] != mtime:
+            with open(manifest_path(), encoding='utf-8') as f:
+                _manifest = (mtime, json.load(f))
+        return _manifest[1]
+
+
+def bundle_path(name, kind):
+    """Returns: static() uchun yo'l, masalan 'bundles/base.1a2b3c4d5e6f.css'."""
+    entry = load_manifest().get(f'{name}.{kind}')
+    if entry is None:
+        raise ValueError(f"Bundle topilmadi: {name}.{kind} ({source_dir()}/{kind}/{name}.{kind})")
+    return f"{STATIC_PREFIX}/{entry['file']}"
+
+
+# ---------------------------------------------------------------- extract
+
+INLINE_BLOCK = re.compile(r'(?P<indent>[ \t]*)<(?P<tag>style|script)(?P<attrs>[^>]*)>(?P<body>.*?)</(?P=tag)>', re.S)
+TEMPLATE_SYNTAX = re.compile(r'\{\{|\{%')
+# {# ... #} render da bo'sh satr
+TEMPLATE_COMMENT = re.compile(r'\{#.*?#\}')
+LOAD_TAG = re.compile(r'\{% *(?P<tag>load|extends) (?P<args>[^%]*?) *%\}')
+KIND_BY_TAG = {'style': 'css', 'script': 'js'}
+TAG_BY_KIND = {'css': 'css_bundle', 'js': 'js_bundle'}
+
+
+def extract_template(path, name, existing):
+    """
+    Shablondagi statik inline bloklarni assets/ ga ko'chiradi va bundle tegi bilan almashtiradi.
+    Django tegi/o'zgaruvchisi bor bloklar (server qiymatlari) joyida qoladi.
+    existing: {kontent hash: (nom, tur)} - bir xil kontentli bloklar bitta bundle ni ishlatadi.
+    Returns: (ko'chirilgan [(nom, tur, bayt)], qoldirilgan [(tur, bayt)]).
+    """
+    with open(path, encoding='utf-8') as f:
+        template = f.read()
+    moved, kept = [], []
+    counters = {}
+
+    def replace(match):
+        kind = KIND_BY_TAG[match['tag']]
+        body = TEMPLATE_COMMENT.sub('', match['body'])
+        if 'src=' in match['attrs'] or not body.strip():
+            return match.group()
+        if TEMPLATE_SYNTAX.search(body):
+            kept.append((kind, len(body.encode())))
+            return match.group()
+
+        content = textwrap.dedent(body).strip() + '\n'
+        digest = hashlib.sha256(content.encode()).hexdigest()
+        if (digest, kind) in existing:
+            bundle = existing[(digest, kind)]
+        else:
+            counters[kind] = counters.get(kind, 0) + 1
+            bundle = name if counters[kind] == 1 else f'{name}-{counters[kind]}'
+            target = os.path.join(source_dir(), kind, f'{bundle}.{kind}')
+            write_atomic(target, content.encode())
+            existing[(digest, kind)] = bundle
+        moved.append((bundle, kind, len(body.encode())))
+        return f"{match['indent']}{{% {TAG_BY_KIND[kind]} '{bundle}' %}}"
+
+    template = INLINE_BLOCK.sub(replace, template)
+    if moved and not re.search(r'\{% *load [^%]*\bassets\b', template):
+        template = add_load(template)
+    if moved:
+        write_atomic(path, template.encode())
+    return moved, kept
+
+
+def add_load(template):
+    """Oxirgi {% load ... %} ga qo'shiladi, bo'lmasa {% extends %} dan keyin (yoki boshiga) yangi qator."""
+    tags = list(LOAD_TAG.finditer(template[:2000]))
+    loads = [tag for tag in tags if tag['tag'] == 'load']
+    if loads:
+        tag = loads[-1]
+        return f"{template[:tag.start()]}{{% load {tag['args']} assets %}}{template[tag.end():]}"
+    if tags:
+        position = tags[-1].end()
+        return f"{template[:position]}\n{{% load assets %}}{template[position:]}"
+    return '{% load assets %}\n' + template
+
+
+def existing_sources():
+    existing = {}
+    for (name, kind), path in sources().items():
+        with open(path, 'rb') as f:
+            existing[(hashlib.sha256(f.read()).hexdigest(), kind)] = name
+    return existing
+
+
+# ---------------------------------------------------------------- hisobot
+
+BUNDLE_TAG = re.compile(r"\{% *(css|js)_bundle ['\"]([^'\"]+)['\"] *%\}")
+EXTENDS_TAG = re.compile(r"\{% *extends ['\"]([^'\"]+)['\"] *%\}")
+
+
+def page_bundles(templates_dir):
+    """Returns: {shablon: [(nom, tur), ...]} - {% extends %} orqali meros bo'lgan bundle lar bilan."""
+    direct, parents = {}, {}
+    for directory, _, files in os.walk(templates_dir):
+        for filename in files:
+            if not filename.endswith('.html'):
+                continue
+            path = os.path.join(directory, filename)
+            name = os.path.relpath(path, templates_dir).replace(os.sep, '/')
+            with open(path, encoding='utf-8') as f:
+                template = f.read()
+            direct[name] = [(bundle, kind) for kind, bundle in BUNDLE_TAG.findall(template)]
+            extends = EXTENDS_TAG.search(template)
+            parents[name] = extends.group(1) if extends else None
+
+    pages = {}
+    for name in direct:
+        bundles, current, seen = [], name, set()
+        while current in direct and current not in seen:
+            seen.add(current)
+            bundles = direct[current] + bundles
+            current = parents[current]
+        pages[name] = list(dict.fromkeys(bundles))
+    return pages
@@ -1,4 +1,7 @@
 import telebot
-from root.settings import BOT_TOKEN
+from telebot import apihelper
+from root.settings import BOT_TOKEN, TELEGRAM_API_URL
+
+apihelper.API_URL = TELEGRAM_API_URL.rstrip('/') + "/bot{0}/{1}"
 
 bot = telebot.TeleBot(BOT_TOKEN, parse_mode="HTML")
@@ -1,11 +1,14 @@
 import logging
 
 from apps.bot.bot import bot
+from apps.bot.queue import enqueue_update
+from django.utils.crypto import constant_time_compare
+from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from root.settings import ADMIN_ID, WEBAPP_URL
-from telebot.types import InlineKeyboardButton, InlineKeyboardMarkup, Update, WebAppInfo
+from root.settings import ADMIN_ID, TELEGRAM_WEBHOOK_SECRET, WEBAPP_URL
+from telebot.types import InlineKeyboardButton, InlineKeyboardMarkup, WebAppInfo
 
 # Logging
 logging.basicConfig(
@@ -58,9 +61,21 @@ def help_cmd(message):
 
 
 class TelegramWebhookView(APIView):
+    """
+    Update faqat navbatga yoziladi va darhol javob qaytariladi -
+    handlerlar run_telegram_worker da bajariladi.
+    """
     permission_classes = [AllowAny]
 
     def post(self, request, *args, **kwargs):
-        update = Update.de_json(request.data)
-        bot.process_new_updates([update])
+        secret = request.headers.get('X-Telegram-Bot-Api-Secret-Token', '')
+        if TELEGRAM_WEBHOOK_SECRET and not constant_time_compare(secret, TELEGRAM_WEBHOOK_SECRET):
+            return Response({"status": "forbidden"}, status=status.HTTP_403_FORBIDDEN)
+
+        update_id = request.data.get('update_id') if isinstance(request.data, dict) else None
+        if not isinstance(update_id, int):
+            return Response({"status": "invalid update"}, status=status.HTTP_400_BAD_REQUEST)
+
+        if not enqueue_update(request.data):
+            logger.info("Telegram update %s takroriy - o'tkazib yuborildi", update_id)
         return Response({"status": "ok"})
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from collections import Counter
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from apps.bot.client import AsyncTelegramClient, TelegramAPIError
+from apps.models import Broadcast, UserProfile
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 500
+MAX_RETRIES = 3
+
+
+def recipients_queryset(broadcast):
+    profiles = UserProfile.objects.filter(telegram_id__isnull=False, id__gt=broadcast.last_profile_id)
+    if broadcast.audience == Broadcast.AudienceChoices.PREMIUM:
+        profiles = profiles.filter(is_premium=True)
+    elif broadcast.audience == Broadcast.AudienceChoices.FREE:
+        profiles = profiles.filter(is_premium=False)
+    return profiles.order_by('id').values_list('id', 'telegram_id')
+
+
+def iter_recipient_chunks(broadcast, chunk_size=CHUNK_SIZE):
+    """PostgreSQL da iterator() server-side cursor ishlatadi - butun ro'yxat xotiraga yuklanmaydi."""
+    chunk = []
+    for row in recipients_queryset(broadcast).iterator(chunk_size=2000):
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def deliver(api, broadcast, telegram_id):
+    """Returns: (outcome, error, retries) - outcome: sent | blocked | failed"""
+    retries = 0
+    error = None
+    while retries <= MAX_RETRIES:
+        try:
+            await api.send_message(telegram_id, broadcast.text, parse_mode=broadcast.parse_mode or None)
+            return 'sent', None, retries
+        except TelegramAPIError as exc:
+            if exc.error_code == 429:
+                # Flood limit: butun bucket retry_after ga to'xtatiladi
+                api.bucket.pause(exc.retry_after or 1)
+                error = 'Too Many Requests'
+            elif exc.is_blocked:
+                return 'blocked', exc.description, retries
+            else:
+                return 'failed', exc.description, retries
+        except requests.RequestException as exc:
+            error = type(exc).__name__
+            await asyncio.sleep(2 ** retries)
+        retries += 1
+    return 'failed', error, retries - 1
+
+
+def save_checkpoint(broadcast, last_profile_id, outcomes, errors, retries):
+    broadcast.last_profile_id = last_profile_id
+    broadcast.sent_count += outcomes['sent']
+    broadcast.blocked_count += outcomes['blocked']
+    broadcast.failed_count += outcomes['failed']
+    broadcast.retried_count += retries
+    for description, count in errors.items():
+        broadcast.errors[description] = broadcast.errors.get(description, 0) + count
+    broadcast.save(update_fields=[
+        'last_profile_id', 'sent_count', 'blocked_count', 'failed_count', 'retried_count', 'errors',
+    ])
+
+
+async def _run(broadcast, api, chunk_size):
+    chunks = iter_recipient_chunks(broadcast, chunk_size)
+    # thread_sensitive - generator (cursor) va checkpoint bitta DB ulanish threadida ishlaydi
+    next_chunk = sync_to_async(lambda: next(chunks, None), thread_sensitive=True)
+    checkpoint = sync_to_async(save_checkpoint, thread_sensitive=True)
+
+    while (chunk := await next_chunk()) is not None:
+        results = await asyncio.gather(*(deliver(api, broadcast, telegram_id) for _, telegram_id in chunk))
+        outcomes = Counter(outcome for outcome, _, _ in results)
+        errors = Counter(error for outcome, error, _ in results if outcome != 'sent' and error)
+        await checkpoint(broadcast, chunk[-1][0], outcomes, errors, sum(retries for _, _, retries in results))
+        logger.info("Broadcast #%s: %s ta yuborildi (checkpoint %s)", broadcast.pk, broadcast.processed_count,
+                    broadcast.last_profile_id)
+
+
+def run_broadcast(broadcast, concurrency=None, rate=None, chunk_size=CHUNK_SIZE, client=None):
+    """
+    Broadcast ni last_profile_id checkpointidan davom ettiradi. Har chunk tugagach checkpoint saqlanadi,
+    shuning uchun uzilishda ko'pi bilan bitta chunk qayta yuborilishi mumkin.
+    Returns: broadcast.report()
+    """
+    broadcast.status = Broadcast.StatusChoices.RUNNING
+    broadcast.started_at = broadcast.started_at or timezone.now()
+    broadcast.save(update_fields=['status', 'started_at'])
+
+    async def main():
+        api = AsyncTelegramClient(
+            client,
+            concurrency=concurrency or settings.BROADCAST_CONCURRENCY,
+            rate=rate or settings.BROADCAST_RATE,
+        )
+        try:
+            await _run(broadcast, api, chunk_size)
+        finally:
+            api.close()
+
+    try:
+        asyncio.run(main())
+    except Exception:
+        broadcast.status = Broadcast.StatusChoices.FAILED
+        broadcast.save(update_fields=['status'])
+        raise
+
+    broadcast.status = Broadcast.StatusChoices.COMPLETED
+    broadcast.finished_at = timezone.now()
+    broadcast.save(update_fields=['status', 'finished_at'])
+    return broadcast.report()
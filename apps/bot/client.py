@@ -0,0 +1,126 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TIMEOUT = (5, 15)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+class TelegramAPIError(Exception):
+    def __init__(self, error_code, description, retry_after=None):
+        super().__init__(f"{error_code}: {description}")
+        self.error_code = error_code
+        self.description = description
+        self.retry_after = retry_after
+
+    @property
+    def is_blocked(self):
+        """Foydalanuvchi botni bloklagan yoki akkaunti o'chirilgan."""
+        return self.error_code == 403
+
+
+class TelegramClient:
+    """
+    Bot API uchun yagona HTTP klient: bitta requests.Session (keep-alive, connection pool).
+    TELEGRAM_API_URL orqali lokal fake serverga yo'naltirish mumkin.
+    """
+
+    def __init__(self, token, api_url=None, pool_size=32, timeout=DEFAULT_TIMEOUT):
+        self.base_url = f"{(api_url or 'https://api.telegram.org').rstrip('/')}/bot{token}/"
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def call(self, method, **params):
+        response = self.session.post(self.base_url + method, json=params, timeout=self.timeout)
+        try:
+            data = response.json()
+        except ValueError:
+            raise TelegramAPIError(response.status_code, response.text[:200])
+
+        if not data.get('ok'):
+            raise TelegramAPIError(
+                data.get('error_code', response.status_code),
+                data.get('description', ''),
+                (data.get('parameters') or {}).get('retry_after'),
+            )
+        return data['result']
+
+    def send_message(self, chat_id, text, parse_mode='HTML', **params):
+        return self.call('sendMessage', chat_id=chat_id, text=text, parse_mode=parse_mode, **params)
+
+
+def get_client() -> TelegramClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = TelegramClient(settings.BOT_TOKEN, settings.TELEGRAM_API_URL)
+    return _client
+
+
+class TokenBucket:
+    """
+    asyncio uchun token bucket: sekundiga rate ta so'rov, capacity gacha portlash.
+    pause() - 429 retry_after kelganda barcha yuboruvchilarni to'xtatadi.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+        self.tokens = 0
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                if now < self.paused_until:
+                    await asyncio.sleep(self.paused_until - now)
+                    continue
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncTelegramClient:
+    """
+    TelegramClient ustidan asyncio interfeysi: so'rovlar concurrency o'lchamli thread poolda,
+    bir vaqtdagi so'rovlar semaphore bilan, tezlik TokenBucket bilan cheklanadi.
+    """
+
+    def __init__(self, client=None, concurrency=20, rate=25):
+        self.client = client or get_client()
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.bucket = TokenBucket(rate)
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='tg-http')
+
+    async def call(self, method, **params):
+        async with self.semaphore:
+            await self.bucket.acquire()
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self.executor, lambda: self.client.call(method, **params))
+
+    async def send_message(self, chat_id, text, parse_mode='HTML', **params):
+        return await self.call('sendMessage', chat_id=chat_id, text=text, parse_mode=parse_mode, **params)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
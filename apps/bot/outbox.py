@@ -0,0 +1,120 @@
+import asyncio
+import logging
+from collections import Counter
+from datetime import timedelta
+
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from apps.bot.client import AsyncTelegramClient, TelegramAPIError
+from apps.bot.queue import MAX_ATTEMPTS, claim_rows, retry_delay
+from apps.models import OutboxMessage
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue_message(chat_id, text, parse_mode='HTML') -> OutboxMessage:
+    """Joriy tranzaksiya ichida yoziladi - drain_outbox xabarni faqat commit dan keyin oladi."""
+    return OutboxMessage.objects.create(chat_id=chat_id, text=text, parse_mode=parse_mode)
+
+
+def enqueue_messages(messages, parse_mode='HTML'):
+    """[(chat_id, text), ...] - bitta INSERT bilan. Returns: yozilgan xabarlar soni"""
+    created = OutboxMessage.objects.bulk_create(
+        [OutboxMessage(chat_id=chat_id, text=text, parse_mode=parse_mode) for chat_id, text in messages],
+        batch_size=1000,
+    )
+    return len(created)
+
+
+def claim_messages(limit):
+    return claim_rows(OutboxMessage, limit)
+
+
+def has_unsent():
+    return OutboxMessage.objects.filter(
+        status__in=[OutboxMessage.StatusChoices.PENDING, OutboxMessage.StatusChoices.PROCESSING],
+    ).exists()
+
+
+async def send_one(api, message):
+    """Returns: None yoki xato"""
+    try:
+        await api.send_message(message.chat_id, message.text, parse_mode=message.parse_mode or None)
+    except TelegramAPIError as exc:
+        if exc.error_code == 429:
+            api.bucket.pause(exc.retry_after or 1)
+        return exc
+    except requests.RequestException as exc:
+        return exc
+    return None
+
+
+def finish_batch(messages, results):
+    """Natijalarni bitta bulk_update bilan yozadi. Returns: Counter(sent, retry, failed)"""
+    now = timezone.now()
+    outcomes = Counter()
+    for message, error in zip(messages, results):
+        message.locked_at = None
+        if error is None:
+            message.status = OutboxMessage.StatusChoices.SENT
+            message.sent_at = now
+            message.last_error = ''
+            outcomes['sent'] += 1
+            continue
+
+        message.last_error = repr(error)[:2000]
+        permanent = isinstance(error, TelegramAPIError) and error.error_code in (400, 403)
+        if permanent or message.attempts >= MAX_ATTEMPTS:
+            message.status = OutboxMessage.StatusChoices.FAILED
+            outcomes['failed'] += 1
+            logger.error("Outbox #%s (%s) yuborilmadi: %s", message.pk, message.chat_id, error)
+        else:
+            retry_after = getattr(error, 'retry_after', None)
+            message.status = OutboxMessage.StatusChoices.PENDING
+            delay = timedelta(seconds=retry_after) if retry_after else retry_delay(message.attempts)
+            message.available_at = now + delay
+            outcomes['retry'] += 1
+
+    OutboxMessage.objects.bulk_update(messages, ['status', 'sent_at', 'available_at', 'locked_at', 'last_error'])
+    return outcomes
+
+
+def drain_outbox(batch_size=100, poll_interval=1.0, once=False, concurrency=None, rate=None, should_stop=None,
+                 on_batch=None):
+    """
+    Outboxni batchlab bo'shatadi: claim -> parallel yuborish (token bucket) -> bulk_update.
+    Returns: jami Counter(sent, retry, failed)
+    """
+    totals = Counter()
+    claim = sync_to_async(claim_messages, thread_sensitive=True)
+    finish = sync_to_async(finish_batch, thread_sensitive=True)
+    unsent = sync_to_async(has_unsent, thread_sensitive=True)
+
+    async def main():
+        api = AsyncTelegramClient(
+            concurrency=concurrency or settings.BROADCAST_CONCURRENCY,
+            rate=rate or settings.BROADCAST_RATE,
+        )
+        try:
+            while not (should_stop and should_stop()):
+                messages = await claim(batch_size)
+                if not messages:
+                    # once: qayta urinish kutayotgan xabarlar ham yuborilgach to'xtaydi
+                    if once and not await unsent():
+                        break
+                    await asyncio.sleep(poll_interval)
+                    continue
+
+                results = await asyncio.gather(*(send_one(api, message) for message in messages))
+                outcomes = await finish(messages, results)
+                totals.update(outcomes)
+                if on_batch:
+                    on_batch(outcomes, totals)
+        finally:
+            api.close()
+
+    asyncio.run(main())
+    return totals
@@ -0,0 +1,171 @@
+import logging
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Exists, F, Min, OuterRef, Q
+from django.utils import timezone
+from telebot.types import Update
+
+from apps.models import TelegramUpdate
+
+logger = logging.getLogger(__name__)
+
+MAX_ATTEMPTS = 5
+MAX_BACKOFF_SECONDS = 300
+VISIBILITY_TIMEOUT = timedelta(minutes=5)
+RETENTION = timedelta(days=1)
+
+
+def enqueue_update(payload) -> bool:
+    """Update ni navbatga qo'shadi. Telegram qayta yuborgan (dublikat) update_id uchun False."""
+    try:
+        with transaction.atomic():
+            TelegramUpdate.objects.create(
+                update_id=payload['update_id'],
+                payload=payload,
+                chat_key=str(chat_key(payload)),
+            )
+    except IntegrityError:
+        return False
+    return True
+
+
+def claim_rows(model, limit, now=None, order_by='pk', condition=None):
+    """
+    Navbat jadvalidan (status/available_at/locked_at/attempts maydonlari bor model)
+    limit tagacha tayyor qatorni oladi va processing holatiga o'tkazadi.
+    skip_locked - bir nechta worker bir xil qatorni olmaydi; VISIBILITY_TIMEOUT dan
+    ko'p processing da qolgan (worker o'lgan) qatorlar qayta olinadi. condition - qo'shimcha filtr.
+    """
+    now = now or timezone.now()
+    ready = Q(status=model.StatusChoices.PENDING, available_at__lte=now)
+    ready |= Q(status=model.StatusChoices.PROCESSING, locked_at__lt=now - VISIBILITY_TIMEOUT)
+    rows = model.objects.select_for_update(skip_locked=True).filter(ready)
+    if condition is not None:
+        rows = rows.filter(condition)
+    with transaction.atomic():
+        rows = list(rows.order_by(order_by)[:limit])
+        model.objects.filter(pk__in=[row.pk for row in rows]).update(
+            status=model.StatusChoices.PROCESSING,
+            locked_at=now,
+            attempts=F('attempts') + 1,
+        )
+    for row in rows:
+        row.attempts += 1
+    return rows
+
+
+def claim_updates(limit, now=None):
+    """
+    claim_rows + chat tartibi: chatning oldingi update i hali tugamagan bo'lsa (boshqa batch/worker da processing,
+    retry kutmoqda, skip_locked yoki limit tufayli olinmagan) keyingilari olinmaydi va pending da qoladi.
+    Oldingi update done yoki butunlay failed bo'lgach navbat davom etadi.
+    """
+    now = now or timezone.now()
+    # Uzoq kutadigan to'siqlar SQL da: aks holda bloklangan chat qatorlari har safar limitni to'ldirib qo'yadi
+    unfinished = Q(status=TelegramUpdate.StatusChoices.PROCESSING, locked_at__gte=now - VISIBILITY_TIMEOUT)
+    unfinished |= Q(status=TelegramUpdate.StatusChoices.PENDING, available_at__gt=now)
+    waiting = TelegramUpdate.objects.filter(
+        unfinished,
+        chat_key=OuterRef('chat_key'),
+        update_id__lt=OuterRef('update_id'),
+    )
+    with transaction.atomic():
+        rows = claim_rows(TelegramUpdate, limit, now, order_by='update_id', condition=~Exists(waiting))
+        blockers = dict(
+            TelegramUpdate.objects
+            .filter(
+                chat_key__in={row.chat_key for row in rows if row.chat_key},
+                status__in=(TelegramUpdate.StatusChoices.PENDING, TelegramUpdate.StatusChoices.PROCESSING),
+            )
+            .exclude(pk__in=[row.pk for row in rows])
+            .order_by()
+            .values_list('chat_key')
+            .annotate(first=Min('update_id'))
+        )
+        held = [row for row in rows if row.chat_key in blockers and row.update_id > blockers[row.chat_key]]
+        release_updates(held)
+    return [row for row in rows if row not in held]
+
+
+def release_updates(updates):
+    """Olingan, lekin qayta ishlanmagan update larni urinish sanamasdan navbatga qaytaradi."""
+    TelegramUpdate.objects.filter(pk__in=[update.pk for update in updates]).update(
+        status=TelegramUpdate.StatusChoices.PENDING,
+        locked_at=None,
+        attempts=F('attempts') - 1,
+    )
+
+
+def retry_delay(attempts):
+    return timedelta(seconds=min(2 ** attempts, MAX_BACKOFF_SECONDS))
+
+
+def chat_key(payload):
+    """Bir chatning update lari ketma-ket qayta ishlanishi uchun kalit."""
+    for field in ('message', 'edited_message', 'callback_query', 'my_chat_member'):
+        item = payload.get(field)
+        if item:
+            chat = item.get('chat') or (item.get('message') or {}).get('chat') or item.get('from') or {}
+            if 'id' in chat:
+                return chat['id']
+    return f"update:{payload.get('update_id')}"
+
+
+def process_update(bot, update) -> bool:
+    """Handlerlarni sinxron chaqiradi (bot.threaded = False). Xatoda backoff bilan qayta navbatga qo'yadi."""
+    try:
+        bot.process_new_updates([Update.de_json(update.payload)])
+    except Exception as exc:
+        mark_failed(update, exc)
+        return False
+
+    TelegramUpdate.objects.filter(pk=update.pk).update(
+        status=TelegramUpdate.StatusChoices.DONE,
+        processed_at=timezone.now(),
+        last_error='',
+    )
+    return True
+
+
+def mark_failed(update, exc):
+    now = timezone.now()
+    if update.attempts >= MAX_ATTEMPTS:
+        status, available_at = TelegramUpdate.StatusChoices.FAILED, now
+        logger.error("Telegram update %s %d urinishdan keyin failed: %s", update.update_id, update.attempts, exc)
+    else:
+        status = TelegramUpdate.StatusChoices.PENDING
+        available_at = now + retry_delay(update.attempts)
+        logger.warning("Telegram update %s xato (urinish %d): %s", update.update_id, update.attempts, exc)
+
+    update.status = status
+    TelegramUpdate.objects.filter(pk=update.pk).update(
+        status=status,
+        available_at=available_at,
+        locked_at=None,
+        last_error=repr(exc)[:2000],
+    )
+
+
+def queue_stats(now=None):
+    """Returns: {'pending', 'processing', 'done', 'failed', 'lag_seconds'}"""
+    now = now or timezone.now()
+    stats = {status: 0 for status in TelegramUpdate.StatusChoices.values}
+    rows = TelegramUpdate.objects.order_by().values_list('status').annotate(n=Count('id'))
+    stats.update(dict(rows))
+
+    oldest = TelegramUpdate.objects.filter(status=TelegramUpdate.StatusChoices.PENDING).aggregate(
+        oldest=Min('received_at'),
+    )['oldest']
+    stats['lag_seconds'] = round((now - oldest).total_seconds(), 1) if oldest else 0
+    return stats
+
+
+def purge_processed(now=None):
+    """RETENTION dan eski done qatorlarni o'chiradi (dublikatlarni tekshirish uchun shu muddat saqlanadi)."""
+    now = now or timezone.now()
+    deleted, _ = TelegramUpdate.objects.filter(
+        status=TelegramUpdate.StatusChoices.DONE,
+        processed_at__lt=now - RETENTION,
+    ).delete()
+    return deleted
@@ -1,12 +1,12 @@
 from telebot import TeleBot
 
-def setup_webhook(token, domain):
+def setup_webhook(token, domain, secret_token=None):
     bot = TeleBot(token)
 
     bot.remove_webhook()
     url = f"{domain}/en/bot/webhook/"
 
-    status = bot.set_webhook(url)
+    status = bot.set_webhook(url, secret_token=secret_token or None)
     print("Webhook:", "OK" if status else "FAILED", url)
 
     return status
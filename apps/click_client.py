@@ -0,0 +1,220 @@
+"""
+Click API uchun umumiy HTTP klient: bitta requests.Session (connection pool, keep-alive),
+connect/read timeoutlar, idempotent so'rovlar uchun jitter bilan cheklangan retry,
+circuit breaker va har bir endpoint bo'yicha latency histogrammasi.
+CLICK_API_URL orqali lokal FakeClickAPI ga yo'naltirish mumkin.
+"""
+import bisect
+import hashlib
+import logging
+import random
+import threading
+import time
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS_MS = (25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+_client = None
+_client_lock = threading.Lock()
+
+
+class PaymentAPIError(Exception):
+    def __init__(self, message, status_code=None, retryable=False):
+        super().__init__(message)
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+class CircuitOpenError(PaymentAPIError):
+    """Ketma-ket xatolardan keyin so'rov yuborilmaydi - tashqi API ga yuk tushmasligi uchun."""
+
+
+class CircuitBreaker:
+    """
+    closed -> failure_threshold ta ketma-ket xatodan keyin open -> reset_timeout o'tgach
+    half-open (bitta sinov so'rovi) -> muvaffaqiyatli bo'lsa closed, aks holda yana open.
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = None
+        self.probing = False
+        self.lock = threading.Lock()
+
+    @property
+    def state(self):
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return 'half-open'
+        return 'open'
+
+    def allow(self):
+        with self.lock:
+            state = self.state
+            if state == 'closed':
+                return True
+            if state == 'half-open' and not self.probing:
+                self.probing = True
+                return True
+            return False
+
+    def record_success(self):
+        with self.lock:
+            self.failures = 0
+            self.opened_at = None
+            self.probing = False
+
+    def record_failure(self):
+        with self.lock:
+            self.failures += 1
+            self.probing = False
+            if self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+
+
+class LatencyHistogram:
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total_ms = 0.0
+        self.errors = 0
+        self.lock = threading.Lock()
+
+    def observe(self, duration_ms, error=False):
+        with self.lock:
+            self.counts[bisect.bisect_left(self.buckets, duration_ms)] += 1
+            self.total_ms += duration_ms
+            self.errors += error
+
+    def snapshot(self):
+        with self.lock:
+            count = sum(self.counts)
+            labels = [f'<={bucket}ms' for bucket in self.buckets] + [f'>{self.buckets[-1]}ms']
+            return {
+                'count': count,
+                'errors': self.errors,
+                'avg_ms': round(self.total_ms / count, 1) if count else 0,
+                'buckets': dict(zip(labels, self.counts)),
+            }
+
+
+def not_sent(exc):
+    """So'rov serverga umuman yetib bormagan (connect timeout, ulanish rad etilgan) - qayta yuborish xavfsiz."""
+    if isinstance(exc, requests.ConnectTimeout):
+        return True
+    reason = getattr(exc.args[0], 'reason', None) if exc.args else None
+    return isinstance(exc, requests.ConnectionError) and isinstance(reason, NewConnectionError)
+
+
+class PaymentHTTPClient:
+    def __init__(self, base_url, pool_size=20, timeout=(3.05, 10), retries=2, backoff=0.2, headers=None,
+                 breaker=None):
+        self.base_url = base_url.rstrip('/') + '/'
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.headers = headers
+        self.breaker = breaker or CircuitBreaker()
+        self.histograms = {}
+        self.histograms_lock = threading.Lock()
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def histogram(self, endpoint):
+        with self.histograms_lock:
+            return self.histograms.setdefault(endpoint, LatencyHistogram())
+
+    def stats(self):
+        return {endpoint: histogram.snapshot() for endpoint, histogram in sorted(self.histograms.items())}
+
+    def request(self, method, path, endpoint=None, idempotent=None, **kwargs):
+        """
+        Returns: JSON javob. Xatoda PaymentAPIError (yoki CircuitOpenError).
+        idempotent bo'lmagan so'rov faqat ulanish o'rnatilmagan holatda qayta yuboriladi.
+        """
+        if idempotent is None:
+            idempotent = method.upper() in ('GET', 'HEAD')
+        endpoint = endpoint or path
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                logger.warning("Click circuit breaker ochiq: %s o'tkazib yuborildi", endpoint)
+                raise CircuitOpenError(f"Click API vaqtincha o'chirilgan ({endpoint})")
+            try:
+                return self._send(method, path, endpoint, **kwargs)
+            except PaymentAPIError as exc:
+                client_error = exc.status_code is not None and exc.status_code < 500
+                if client_error or not (idempotent or exc.retryable) or attempt >= self.retries:
+                    raise
+            attempt += 1
+            # Full jitter: parallel workerlar bir vaqtda qayta urinmaydi
+            time.sleep(random.uniform(0, self.backoff * 2 ** attempt))
+
+    def _send(self, method, path, endpoint, **kwargs):
+        headers = self.headers() if callable(self.headers) else self.headers
+        start = time.perf_counter()
+        error = True
+        try:
+            response = self.session.request(method, self.base_url + path.lstrip('/'), headers=headers,
+                                            timeout=self.timeout, **kwargs)
+        except requests.RequestException as exc:
+            self.breaker.record_failure()
+            raise PaymentAPIError(f"{endpoint}: {type(exc).__name__}", retryable=not_sent(exc))
+        else:
+            if response.status_code >= 500:
+                self.breaker.record_failure()
+                raise PaymentAPIError(f"{endpoint}: HTTP {response.status_code}", response.status_code)
+            self.breaker.record_success()
+            try:
+                data = response.json()
+            except ValueError:
+                raise PaymentAPIError(f"{endpoint}: JSON emas", response.status_code)
+            if response.status_code >= 400:
+                raise PaymentAPIError(f"{endpoint}: HTTP {response.status_code} {data}", response.status_code)
+            error = False
+            return data
+        finally:
+            self.histogram(endpoint).observe((time.perf_counter() - start) * 1000, error)
+
+    def get(self, path, **kwargs):
+        return self.request('GET', path, **kwargs)
+
+    def post(self, path, payload, **kwargs):
+        return self.request('POST', path, json=payload, **kwargs)
+
+
+def click_auth_headers():
+    """Click Merchant API: Auth: merchant_user_id:sha1(timestamp + secret_key):timestamp"""
+    timestamp = str(int(time.time()))
+    digest = hashlib.sha1(f"{timestamp}{settings.CLICK_SECRET_KEY}".encode()).hexdigest()
+    return {
+        'Accept': 'application/json',
+        'Auth': f"{settings.CLICK_MERCHANT_USER_ID}:{digest}:{timestamp}",
+    }
+
+
+def get_click_client() -> PaymentHTTPClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PaymentHTTPClient(
+                    settings.CLICK_API_URL,
+                    pool_size=settings.CLICK_POOL_SIZE,
+                    timeout=(settings.CLICK_CONNECT_TIMEOUT, settings.CLICK_READ_TIMEOUT),
+                    retries=settings.CLICK_RETRIES,
+                    headers=click_auth_headers,
+                    breaker=CircuitBreaker(settings.CLICK_BREAKER_THRESHOLD, settings.CLICK_BREAKER_RESET),
+                )
+    return _client
@@ -1,8 +1,14 @@
 import hashlib
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
-import requests
 from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.crypto import constant_time_compare
+
+from apps.click_client import PaymentAPIError, get_click_client
+from apps.models import Payment
+from apps.services.subscriptions import extend_subscription
 
 
 class ClickMerchant:
@@ -15,18 +21,20 @@ class ClickMerchant:
         self.merchant_id = settings.CLICK_MERCHANT_ID
         self.service_id = settings.CLICK_SERVICE_ID
         self.secret_key = settings.CLICK_SECRET_KEY
-        self.prepare_url = "https://api.click.uz/v2/merchant/invoice/create"
+        self.client = get_click_client()
 
     def generate_sign_string(self, params):
         """
         Sign string yaratish (MD5 hash)
         """
-        # Click dokumentatsiyasiga ko'ra tartib
+        # Click dokumentatsiyasiga ko'ra tartib; COMPLETE (action=1) da merchant_prepare_id ham qo'shiladi
+        prepare_id = params.get('merchant_prepare_id', '') if str(params.get('action')) == '1' else ''
         sign_string = (
             f"{params.get('click_trans_id', '')}"
             f"{params.get('service_id', '')}"
             f"{self.secret_key}"
             f"{params.get('merchant_trans_id', '')}"
+            f"{prepare_id}"
             f"{params.get('amount', '')}"
             f"{params.get('action', '')}"
             f"{params.get('sign_time', '')}"
@@ -54,18 +62,28 @@ class ClickMerchant:
         }
 
         try:
-            response = requests.post(self.prepare_url, json=payload)
-            return response.json()
-        except Exception as e:
+            return self.client.post('merchant/invoice/create', payload)
+        except PaymentAPIError as e:
             return {"error": str(e)}
 
     def verify_sign(self, params):
         """
         Sign string tekshirish
         """
-        received_sign = params.get('sign_string', '')
+        received_sign = str(params.get('sign_string', ''))
         calculated_sign = self.generate_sign_string(params)
-        return received_sign == calculated_sign
+        return constant_time_compare(received_sign, calculated_sign)
+
+    @staticmethod
+    def error(code, note):
+        return {"error": code, "error_note": note}
+
+    @staticmethod
+    def amount_matches(params, payment):
+        try:
+            return Decimal(str(params.get('amount'))) == payment.amount
+        except InvalidOperation:
+            return False
 
     def prepare(self, params):
         """
@@ -74,36 +92,23 @@ class ClickMerchant:
         """
         # Sign tekshirish
         if not self.verify_sign(params):
-            return {
-                "error": -1,
-                "error_note": "Sign check failed"
-            }
+            return self.error(-1, "Sign check failed")
 
         # Payment topish
-        from .models import Payment
-
-        merchant_trans_id = params.get('merchant_trans_id')
-        try:
-            payment = Payment.objects.get(id=merchant_trans_id)
-        except Payment.DoesNotExist:
-            return {
-                "error": -5,
-                "error_note": "Payment not found"
-            }
+        merchant_trans_id = str(params.get('merchant_trans_id', ''))
+        payment = Payment.objects.filter(id=merchant_trans_id).first() if merchant_trans_id.isdigit() else None
+        if payment is None:
+            return self.error(-5, "Payment not found")
 
         # Status tekshirish
-        if payment.status == 'completed':
-            return {
-                "error": -4,
-                "error_note": "Already paid"
-            }
+        if payment.status == Payment.PaymentStatus.COMPLETED:
+            return self.error(-4, "Already paid")
+        if payment.status == Payment.PaymentStatus.FAILED:
+            return self.error(-9, "Transaction cancelled")
 
         # Summani tekshirish
-        if Decimal(str(params.get('amount'))) != payment.amount:
-            return {
-                "error": -2,
-                "error_note": "Incorrect amount"
-            }
+        if not self.amount_matches(params, payment):
+            return self.error(-2, "Incorrect amount")
 
         # Muvaffaqiyatli javob
         return {
@@ -114,84 +119,71 @@ class ClickMerchant:
             "merchant_prepare_id": payment.id
         }
 
+    def apply_complete(self, payment, params, click_trans_id):
+        """Qulflangan to'lovga COMPLETE natijasini qo'llaydi. Returns: xato javobi yoki None"""
+        if payment.status == Payment.PaymentStatus.COMPLETED:
+            if payment.click_trans_id != click_trans_id:
+                return self.error(-4, "Already paid")
+        elif payment.status == Payment.PaymentStatus.FAILED:
+            return self.error(-9, "Transaction cancelled")
+        elif str(params.get('error')) != '0':
+            # Xato - Click tomonida bekor qilingan
+            payment.status = Payment.PaymentStatus.FAILED
+            payment.metadata = params
+            payment.save(update_fields=['status', 'metadata', 'updated_at'])
+            return self.error(-9, "Transaction cancelled")
+        elif not self.amount_matches(params, payment):
+            return self.error(-2, "Incorrect amount")
+        elif payment.plan is None:
+            return self.error(-7, "Failed to update user")
+        else:
+            # To'lovni yakunlash va obunani plan bo'yicha uzaytirish
+            payment.subscription = extend_subscription(payment.user_id, payment.plan)
+            payment.status = Payment.PaymentStatus.COMPLETED
+            payment.click_trans_id = click_trans_id
+            payment.completed_at = timezone.now()
+            payment.metadata = params
+            payment.save(update_fields=[
+                'subscription', 'status', 'click_trans_id', 'completed_at', 'metadata', 'updated_at',
+            ])
+        return None
+
     def complete(self, params):
         """
         COMPLETE metodi - to'lovni yakunlash
-        Click serveridan ikkinchi kelgan so'rov
+        Click serveridan ikkinchi kelgan so'rov.
+
+        Payment qatori select_for_update bilan qulflanadi, shuning uchun bir vaqtda kelgan
+        takroriy so'rovlar navbat bilan bajariladi; shu click_trans_id bilan yakunlangan
+        to'lovga qayta muvaffaqiyatli javob qaytadi va obuna ikkinchi marta uzaytirilmaydi.
         """
         # Sign tekshirish
         if not self.verify_sign(params):
-            return {
-                "error": -1,
-                "error_note": "Sign check failed"
-            }
+            return self.error(-1, "Sign check failed")
 
-        from datetime import datetime, timedelta
+        merchant_trans_id = str(params.get('merchant_trans_id', ''))
+        click_trans_id = str(params.get('click_trans_id', ''))
+        if not merchant_trans_id.isdigit():
+            return self.error(-5, "Payment not found")
 
-        from users.models import Subscription
+        with transaction.atomic():
+            payment = Payment.objects.select_for_update().select_related('plan').filter(id=merchant_trans_id).first()
+            if payment is None:
+                return self.error(-5, "Payment not found")
+            if str(params.get('merchant_prepare_id', '')) != str(payment.id):
+                return self.error(-6, "Transaction does not exist")
 
-        from .models import Payment
+            error = self.apply_complete(payment, params, click_trans_id)
+            if error:
+                return error
 
-        merchant_trans_id = params.get('merchant_trans_id')
-
-        try:
-            payment = Payment.objects.get(id=merchant_trans_id)
-        except Payment.DoesNotExist:
-            return {
-                "error": -5,
-                "error_note": "Payment not found"
-            }
-
-        # To'lovni yakunlash
-        if params.get('error') == '0':
-            payment.status = 'completed'
-            payment.transaction_id = params.get('click_trans_id')
-            payment.completed_at = datetime.now()
-            payment.metadata = params
-            payment.save()
-
-            # Obuna yaratish yoki yangilash
-            user = payment.user
-
-            try:
-                subscription = Subscription.objects.get(user=user)
-                # Mavjud obunani uzaytirish
-                if subscription.end_date < datetime.now():
-                    subscription.end_date = datetime.now() + timedelta(days=30)
-                else:
-                    subscription.end_date += timedelta(days=30)
-                subscription.is_active = True
-                subscription.save()
-            except Subscription.DoesNotExist:
-                # Yangi obuna yaratish
-                subscription = Subscription.objects.create(
-                    user=user,
-                    subscription_type='monthly',
-                    end_date=datetime.now() + timedelta(days=30),
-                    price=payment.amount,
-                    is_active=True,
-                    auto_renew=True
-                )
-
-            payment.subscription = subscription
-            payment.save()
-
-            return {
-                "error": 0,
-                "error_note": "Success",
-                "click_trans_id": params.get('click_trans_id'),
-                "merchant_trans_id": merchant_trans_id,
-                "merchant_confirm_id": payment.id
-            }
-        else:
-            # Xato
-            payment.status = 'failed'
-            payment.save()
-
-            return {
-                "error": -9,
-                "error_note": "Transaction cancelled"
-            }
+        return {
+            "error": 0,
+            "error_note": "Success",
+            "click_trans_id": click_trans_id,
+            "merchant_trans_id": merchant_trans_id,
+            "merchant_confirm_id": payment.id
+        }
 
 
 class ClickAutoPayment:
@@ -200,11 +192,11 @@ class ClickAutoPayment:
     Saqlangan karta orqali har oyda to'lov
     """
 
-    def __init__(self):
+    def __init__(self, client=None):
         self.merchant_id = settings.CLICK_MERCHANT_ID
         self.service_id = settings.CLICK_SERVICE_ID
         self.secret_key = settings.CLICK_SECRET_KEY
-        self.auto_pay_url = "https://api.click.uz/v2/card_token/payment"
+        self.client = client or get_click_client()
 
     def charge_card(self, payment_method, amount, payment_id):
         """
@@ -227,7 +219,20 @@ class ClickAutoPayment:
         }
 
         try:
-            response = requests.post(self.auto_pay_url, json=payload)
-            return response.json()
-        except Exception as e:
+            # Pul yechish idempotent emas - faqat so'rov Click ga yetib bormagan bo'lsa qayta yuboriladi
+            return self.client.post('card_token/payment', payload)
+        except PaymentAPIError as e:
+            return {"error": str(e)}
+
+    def payment_status(self, payment_id, date):
+        """
+        merchant_trans_id bo'yicha to'lov holati - charge_card javobi kelmay qolganda tekshirish uchun.
+        GET so'rov, shuning uchun xatoda qayta uriniladi.
+        """
+        try:
+            return self.client.get(
+                f'payment/status_by_mti/{self.service_id}/{payment_id}/{date:%Y-%m-%d}',
+                endpoint='payment/status_by_mti',
+            )
+        except PaymentAPIError as e:
             return {"error": str(e)}
@@ -0,0 +1,185 @@
+"""
+Lokal sinov va benchmark uchun tashqi API larning soddalashtirilgan nusxalari.
+Production kodi faqat URL sozlamasi orqali ularga yo'naltiriladi (TELEGRAM_API_URL, CLICK_API_URL).
+"""
+import json
+import random
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl
+
+
+class FakeAPIHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # Sarlavha va tana alohida yoziladi - Nagle + delayed ACK har javobga ~40ms qo'shadi
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def read_params(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0)).decode()
+        if self.headers.get('Content-Type', '').startswith('application/json'):
+            return json.loads(body or '{}')
+        return dict(parse_qsl(body))
+
+    def reply(self, status, data):
+        payload = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeTelegramHandler(FakeAPIHandler):
+    def do_GET(self):
+        self.do_POST()
+
+    def do_POST(self):
+        method = self.path.rstrip('/').rsplit('/', 1)[-1].split('?')[0]
+        params = self.read_params()
+        status, data = self.server.handle_method(method, params)
+        self.reply(status, data)
+
+
+class FakeTelegramAPI(ThreadingHTTPServer):
+    """
+    Bot API: sendMessage (sekundiga rate_limit dan oshsa 429 retry_after, blocked chatlarga 403),
+    qolgan metodlar {"ok": true}. Yuborilgan xabarlar self.messages da saqlanadi.
+    """
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 8081), rate_limit=30, latency=0.0, blocked=(), retry_after=1):
+        super().__init__(address, FakeTelegramHandler)
+        self.rate_limit = rate_limit
+        self.latency = latency
+        self.blocked = {int(chat_id) for chat_id in blocked}
+        self.retry_after = retry_after
+        self.messages = []
+        self.throttled = 0
+        self.window = deque()
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def handle_method(self, method, params):
+        if method != 'sendMessage':
+            return 200, {'ok': True, 'result': True}
+
+        with self.lock:
+            now = time.monotonic()
+            while self.window and now - self.window[0] >= 1:
+                self.window.popleft()
+            if self.rate_limit and len(self.window) >= self.rate_limit:
+                self.throttled += 1
+                return 429, {
+                    'ok': False,
+                    'error_code': 429,
+                    'description': f"Too Many Requests: retry after {self.retry_after}",
+                    'parameters': {'retry_after': self.retry_after},
+                }
+            self.window.append(now)
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        chat_id = int(params.get('chat_id', 0))
+        if chat_id in self.blocked:
+            return 403, {'ok': False, 'error_code': 403, 'description': "Forbidden: bot was blocked by the user"}
+
+        with self.lock:
+            self.messages.append(params)
+            message_id = len(self.messages)
+        return 200, {
+            'ok': True,
+            'result': {'message_id': message_id, 'date': int(time.time()), 'chat': {'id': chat_id, 'type': 'private'},
+                       'text': params.get('text', '')},
+        }
+
+    def start(self):
+        """Fon threadida ishga tushiradi (testlar/benchmark uchun)."""
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
+
+
+class FakeClickHandler(FakeAPIHandler):
+    def do_GET(self):
+        status, data = self.server.handle_path('GET', self.path, {})
+        self.reply(status, data)
+
+    def do_POST(self):
+        status, data = self.server.handle_path('POST', self.path, self.read_params())
+        self.reply(status, data)
+
+
+class FakeClickAPI(ThreadingHTTPServer):
+    """
+    Click Merchant API: invoice/create, card_token/payment va payment/status_by_mti.
+    error_rate ulushida 500, stall_rate ulushida stall sekund javob bermaydi (osilib qolgan endpoint),
+    declined tokenlar uchun -5017 (mablag' yetarli emas). Har bir merchant_trans_id bo'yicha
+    yechilgan summalar self.charges da saqlanadi - takroriy yechishni tekshirish uchun.
+    """
+    daemon_threads = True
+
+    def __init__(self, address=('127.0.0.1', 8082), latency=0.0, error_rate=0.0, stall_rate=0.0, stall=30.0,
+                 declined=()):
+        super().__init__(address, FakeClickHandler)
+        self.latency = latency
+        self.error_rate = error_rate
+        self.stall_rate = stall_rate
+        self.stall = stall
+        self.declined = set(declined)
+        self.charges = {}
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    @property
+    def url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def duplicate_charges(self):
+        return sum(len(amounts) - 1 for amounts in self.charges.values() if len(amounts) > 1)
+
+    def handle_path(self, method, path, params):
+        with self.lock:
+            self.requests += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if self.stall_rate and random.random() < self.stall_rate:
+            time.sleep(self.stall)
+        if self.error_rate and random.random() < self.error_rate:
+            return 500, {'error_code': -500, 'error_note': "Internal error"}
+
+        parts = path.split('?')[0].strip('/').split('/')
+        if path.startswith('/payment/status_by_mti/') and method == 'GET':
+            merchant_trans_id = parts[3] if len(parts) > 3 else ''
+            if merchant_trans_id not in self.charges:
+                return 200, {'error_code': -16, 'error_note': "Payment not found"}
+            return 200, {'error_code': 0, 'payment_id': merchant_trans_id, 'payment_status': 2}
+        if path.startswith('/merchant/invoice/create'):
+            with self.lock:
+                invoice_id = self.requests
+            return 200, {'error_code': 0, 'error_note': "Success", 'invoice_id': invoice_id}
+        if path.startswith('/card_token/payment'):
+            if params.get('card_token') in self.declined:
+                return 200, {'error_code': -5017, 'error_note': "Insufficient funds"}
+            merchant_trans_id = str(params.get('merchant_trans_id'))
+            with self.lock:
+                self.charges.setdefault(merchant_trans_id, []).append(params.get('amount'))
+                payment_id = len(self.charges)
+            return 200, {'error_code': 0, 'error_note': "Success", 'payment_id': payment_id, 'payment_status': 2}
+        return 404, {'error_code': -404, 'error_note': "Not found"}
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever, daemon=True)
+        thread.start()
+        return self
@@ -0,0 +1,45 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand
+
+from apps.models import ImageDerivative, ImageDerivativeJob
+from apps.services.images import IMAGE_FIELDS, enqueue_images, generate_derivatives
+
+
+class Command(BaseCommand):
+    help = (
+        "Mavjud rasmlar (Exercise.thumbnail, Program.image, UserProfile.avatar) uchun derivative larni navbatga "
+        "qo'yadi. Keyin run_image_worker ishga tushiriladi yoki --sync bilan shu yerning o'zida yaratiladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--force', action='store_true', help="Derivative lari bor rasmlarni ham qayta yaratadi")
+        parser.add_argument('--sync', action='store_true', help="Navbatsiz, shu jarayonda yaratadi")
+
+    def handle(self, *args, **options):
+        sources = []
+        for label, field, _ in IMAGE_FIELDS:
+            model = apps.get_model(label)
+            names = model.objects.exclude(**{field: ''}).exclude(**{f'{field}__isnull': True})
+            sources += names.values_list(field, flat=True).distinct()
+        sources = list(dict.fromkeys(sources))
+
+        if not options['force']:
+            done = set(ImageDerivative.objects.filter(source__in=sources).values_list('source', flat=True))
+            queued = set(ImageDerivativeJob.objects.filter(
+                source__in=sources,
+                status__in=[ImageDerivativeJob.StatusChoices.PENDING, ImageDerivativeJob.StatusChoices.PROCESSING],
+            ).values_list('source', flat=True))
+            sources = [source for source in sources if source not in done | queued]
+
+        if not options['sync']:
+            self.stdout.write(self.style.SUCCESS(f"{enqueue_images(sources)} ta rasm navbatga qo'yildi"))
+            return
+
+        failed = 0
+        for source in sources:
+            try:
+                generate_derivatives(source)
+            except Exception as exc:
+                failed += 1
+                self.stderr.write(f"{source}: {exc!r}")
+        self.stdout.write(self.style.SUCCESS(f"{len(sources) - failed} ta rasm tayyor, {failed} ta xato"))
@@ -0,0 +1,91 @@
+import time
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from apps.click_client import PaymentHTTPClient
+from apps.click_merchant import ClickAutoPayment
+from apps.fakes import FakeClickAPI
+from apps.models import OutboxMessage, Payment, PaymentMethod, Subscription, User, UserProfile
+from apps.models.payments import SubscriptionPlan
+from apps.services.renewals import run_renewals
+
+TELEGRAM_ID_BASE = 9_000_000_000
+
+
+class Command(BaseCommand):
+    help = (
+        "Avtomatik yangilash pipeline ini lokal FakeClickAPI ga qarshi turli parallellikda o'lchaydi. "
+        "Sinov obunalari yaratiladi va oxirida o'chiriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subscriptions', type=int, default=1000)
+        parser.add_argument('--concurrency', default='1,10,50', help="Vergul bilan ajratilgan qiymatlar")
+        parser.add_argument('--chunk-size', type=int, default=200)
+        parser.add_argument('--latency', type=float, default=0.05, help="Click javob kechikishi (sekund)")
+        parser.add_argument('--decline-every', type=int, default=10, help="Har N-karta rad etiladi (0 - yo'q)")
+
+    def handle(self, *args, **options):
+        count = options['subscriptions']
+        every = options['decline_every']
+        declined = {f'bench-{i}' for i in range(count) if every and i % every == 0}
+        fake = FakeClickAPI(('127.0.0.1', 0), latency=options['latency'], declined=declined).start()
+        users, plan = self.seed(count)
+
+        try:
+            for concurrency in (int(value) for value in options['concurrency'].split(',')):
+                self.reset(users)
+                fake.charges.clear()
+                charger = ClickAutoPayment(PaymentHTTPClient(fake.url, pool_size=concurrency))
+
+                start = time.perf_counter()
+                totals = run_renewals(
+                    chunk_size=options['chunk_size'],
+                    concurrency=concurrency,
+                    charger=charger,
+                    queryset=Subscription.objects.filter(plan=plan),
+                )
+                elapsed = time.perf_counter() - start
+
+                processed = totals['renewed'] + totals['failed']
+                if processed != count or fake.duplicate_charges:
+                    raise CommandError(f"Kutilmagan natija: {dict(totals)}, takroriy={fake.duplicate_charges}")
+                stats = charger.client.stats()['card_token/payment']
+                self.stdout.write(
+                    f"concurrency={concurrency:<4} {count} ta obuna {elapsed:6.2f}s  {count / elapsed:7.1f} obuna/s  "
+                    f"renewed={totals['renewed']} failed={totals['failed']}  click avg={stats['avg_ms']}ms"
+                )
+        finally:
+            fake.shutdown()
+            self.cleanup(users, plan)
+
+    def seed(self, count):
+        """Sinov obunalari alohida plan da - run_renewals faqat shularni oladi, haqiqiy obunalarga tegmaydi."""
+        prefix = f'bench-renewal-{time.time_ns()}'
+        users = User.objects.bulk_create([User(username=f'{prefix}-{i}') for i in range(count)])
+        profiles = UserProfile.objects.bulk_create([
+            UserProfile(user=user, telegram_id=TELEGRAM_ID_BASE + i) for i, user in enumerate(users)
+        ])
+        plan = SubscriptionPlan.objects.create(price=67000, period=SubscriptionPlan.PeriodChoices.MONTHLY)
+        Subscription.objects.bulk_create([
+            Subscription(user=profile, plan=plan, end_date=timezone.now()) for profile in profiles
+        ])
+        PaymentMethod.objects.bulk_create([
+            PaymentMethod(user=profile, card_token=f'bench-{i}', card_last_four='0000')
+            for i, profile in enumerate(profiles)
+        ])
+        return users, plan
+
+    def reset(self, users):
+        Subscription.objects.filter(user__user__in=users).update(
+            end_date=timezone.now() + timedelta(hours=1), auto_renew=True, renewal_attempts=0, next_renewal_at=None,
+        )
+
+    def cleanup(self, users, plan):
+        profiles = UserProfile.objects.filter(user__in=users)
+        OutboxMessage.objects.filter(chat_id__in=profiles.values('telegram_id')).delete()
+        Payment.objects.filter(user__in=profiles).delete()
+        User.objects.filter(pk__in=[user.pk for user in users]).delete()
+        plan.delete()
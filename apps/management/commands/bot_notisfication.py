@@ -1,13 +1,25 @@
+import asyncio
 import logging
 
+import requests
 from root.settings import BOT_TOKEN
-from telegram import Bot
-from telegram.error import TelegramError
+
+from apps.bot.client import TelegramAPIError, get_client
 
 logger = logging.getLogger(__name__)
 
 
-async def send_telegram_notification_async(telegram_id: int, message: str):
+def send_telegram_notification_sync(telegram_id: int, message: str):
+    """
+    Sync - umumiy TelegramClient (bitta requests.Session) orqali yuboradi
+
+    Args:
+        telegram_id: Foydalanuvchi telegram ID
+        message: Yuborilishi kerak bo'lgan xabar
+
+    Returns:
+        bool: Muvaffaqiyatli yuborilsa True, aks holda False
+    """
     if not telegram_id:
         logger.warning("Telegram ID not provided")
         return False
@@ -17,47 +29,20 @@ async def send_telegram_notification_async(telegram_id: int, message: str):
         return False
 
     try:
-        bot = Bot(token=BOT_TOKEN)
-        await bot.send_message(
-            chat_id=telegram_id,
-            text=message,
-            parse_mode='HTML'
-        )
+        get_client().send_message(telegram_id, message, parse_mode='HTML')
         logger.info(f"Notification sent to {telegram_id}")
         return True
-    except TelegramError as e:
+    except TelegramAPIError as e:
         logger.error(f"Failed to send telegram notification: {str(e)}")
         return False
-    except Exception as e:
+    except requests.RequestException as e:
         logger.error(f"Unexpected error sending notification: {str(e)}")
         return False
 
 
-def send_telegram_notification_sync(telegram_id: int, message: str):
-    """
-    Sync - Celery tasks uchun (sync version)
-
-    Args:
-        telegram_id: Foydalanuvchi telegram ID
-        message: Yuborilishi kerak bo'lgan xabar
-
-    Returns:
-        bool: Muvaffaqiyatli yuborilsa True, aks holda False
-    """
-    import asyncio
-
-    try:
-        # Async funksiyani sync contextda ishga tushirish
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        result = loop.run_until_complete(
-            send_telegram_notification_async(telegram_id, message)
-        )
-        loop.close()
-        return result
-    except Exception as e:
-        logger.error(f"Error in sync notification: {str(e)}")
-        return False
+async def send_telegram_notification_async(telegram_id: int, message: str):
+    """Async - har xabar uchun yangi Bot/event loop ochilmaydi, sync klient threadda chaqiriladi"""
+    return await asyncio.to_thread(send_telegram_notification_sync, telegram_id, message)
 
 
 # ============================================
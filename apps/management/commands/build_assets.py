@@ -0,0 +1,74 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.assets import build, existing_sources, extract_template, page_bundles
+
+
+def kb(size):
+    return f"{size / 1024:.1f}K"
+
+
+class Command(BaseCommand):
+    help = (
+        "assets/ dagi CSS/JS ni minify qilib hash li bundle lar yozadi (collectstatic dan oldin) va har sahifa "
+        "uchun hajm hisobotini chiqaradi. --extract shablonlardagi statik inline <style>/<script> larni "
+        "assets/ ga ko'chiradi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--extract', action='store_true', help="Inline bloklarni assets/ ga ko'chiradi")
+        parser.add_argument('--quiet', action='store_true', help="Hisobotsiz")
+
+    def handle(self, *args, **options):
+        templates_dir = str(settings.TEMPLATES[0]['DIRS'][0])
+        if options['extract']:
+            self.extract(templates_dir)
+
+        manifest = build()
+        self.stdout.write(self.style.SUCCESS(f"{len(manifest)} ta bundle: {settings.ASSETS_BUILD_DIR}"))
+        if not options['quiet']:
+            self.report(manifest, page_bundles(templates_dir))
+
+    def extract(self, templates_dir):
+        existing = existing_sources()
+        for directory, _, files in sorted(os.walk(templates_dir)):
+            for filename in sorted(files):
+                if not filename.endswith('.html'):
+                    continue
+                path = os.path.join(directory, filename)
+                name = os.path.relpath(path, templates_dir)[:-len('.html')].replace(os.sep, '/')
+                moved, kept = extract_template(path, name, existing)
+                for bundle, kind, size in moved:
+                    self.stdout.write(f"{name}: <{kind}> {kb(size)} -> {kind}/{bundle}.{kind}")
+                for kind, size in kept:
+                    self.stdout.write(self.style.WARNING(
+                        f"{name}: <{kind}> {kb(size)} joyida qoldi (Django teglari bor)"
+                    ))
+
+    def report(self, manifest, pages):
+        """
+        html: sahifa HTML idan chiqarilgan bayt (har navigatsiyada tejaladi), bundle: minify+gzip hajm - bir marta
+        yuklanib keshlanadi, base bundle lari esa base.html dan meros oluvchi barcha sahifalarga umumiy.
+        """
+        self.stdout.write(f"\n{'sahifa':<42}{'html -':>10}{'bundle':>10}{'gzip':>9}  bundle lar")
+        total_saved = 0
+        for page, bundles in sorted(pages.items()):
+            entries = [manifest[f'{name}.{kind}'] for name, kind in bundles if f'{name}.{kind}' in manifest]
+            if not entries:
+                continue
+            saved = sum(entry['source'] for entry in entries)
+            total_saved += saved
+            self.stdout.write(
+                f"{page:<42}{kb(saved):>10}{kb(sum(e['minified'] for e in entries)):>10}"
+                f"{kb(sum(e['gzip'] for e in entries)):>9}  {', '.join(f'{n}.{k}' for n, k in bundles)}"
+            )
+
+        source = sum(entry['source'] for entry in manifest.values())
+        minified = sum(entry['minified'] for entry in manifest.values())
+        gzipped = sum(entry['gzip'] for entry in manifest.values())
+        self.stdout.write(
+            f"\nManbalar {kb(source)} -> minify {kb(minified)} ({100 - 100 * minified // max(source, 1)}% kichik), "
+            f"gzip {kb(gzipped)}. Barcha sahifalar bo'yicha HTML dan {kb(total_saved)} chiqarildi."
+        )
@@ -0,0 +1,250 @@
+import json
+import os
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+from io import StringIO
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.template.base import Node
+from django.test import Client
+from django.test.utils import override_settings, setup_test_environment, teardown_test_environment
+from django.urls import URLPattern, URLResolver, reverse
+from django.utils import timezone, translation
+
+from apps.management.commands.stress_click_callbacks import click_sign
+
+MANIFEST = os.path.join(settings.BASE_DIR, 'apps', 'query_budgets.json')
+FIXTURES = ('program', 'edition', 'exercises', 'workout', 'workoutexercise')
+
+
+def url_names(patterns):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from url_names(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern) and pattern.name:
+            yield pattern.name
+
+
+def call_site(frame):
+    """
+    SQL ni chaqirgan joy: shablon ichidagi teg (template.html:12) yoki loyiha kodidagi birinchi qator.
+    """
+    project_dir = str(settings.BASE_DIR)
+    skip = {os.path.abspath(__file__), os.path.join(project_dir, 'manage.py')}
+    fallback = None
+    while frame is not None:
+        node = frame.f_locals.get('self')
+        # type() - isinstance() LazyObject ni (request.user) yuklab yuborib yana SQL chaqiradi
+        if issubclass(type(node), Node) and getattr(node, 'token', None) is not None and node.origin:
+            return f"{os.path.relpath(node.origin.name, project_dir)}:{node.token.lineno}"
+
+        filename = os.path.abspath(frame.f_code.co_filename)
+        if filename.startswith(project_dir) and filename not in skip and 'site-packages' not in filename:
+            return f"{os.path.relpath(filename, project_dir)}:{frame.f_lineno} in {frame.f_code.co_name}"
+        if fallback is None and f'django{os.sep}db' not in filename:
+            # Middleware (sessiya, request.user) kabi loyihadan tashqaridagi so'rovlar
+            fallback = f"{filename.split('site-packages' + os.sep)[-1]}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback or '<unknown>'
+
+
+class QueryRecorder:
+    """connection.execute_wrapper uchun: har bir SQL ni chaqiruv joyi bilan yozib boradi."""
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((call_site(sys._getframe(1)), sql, params))
+        return execute(sql, params, many, context)
+
+    def grouped(self):
+        sites = defaultdict(list)
+        for site, sql, _ in self.queries:
+            sites[site].append(sql)
+        return sorted(sites.items(), key=lambda item: -len(item[1]))
+
+
+@contextmanager
+def budget_database():
+    """Modellardan yaratilgan vaqtinchalik test bazasi (migratsiyalar repoda saqlanmaydi)."""
+    migration_modules = {app.label: None for app in django_apps.get_app_configs()}
+    setup_test_environment()
+    try:
+        with override_settings(MIGRATION_MODULES=migration_modules), translation.override(settings.LANGUAGE_CODE):
+            old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+            if connection.vendor == 'postgresql':
+                # postgres_search saqlangan search_document ustunlari va GIN indekslariga tayanadi
+                call_command('setup_search_indexes', verbosity=0, stdout=StringIO())
+            try:
+                yield
+            finally:
+                connection.creation.destroy_test_db(old_name, verbosity=0)
+    finally:
+        teardown_test_environment()
+
+
+def load_manifest(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def seed():
+    """
+    Fixturelar va onboardingdan o'tgan premium foydalanuvchi: sevimlilar, progress, yakunlangan sessiya
+    va kutilayotgan to'lov bilan.
+    """
+    from apps.models import Exercise, Favorite, Payment, Subscription, User, Workout
+    from apps.models.favorites import FavoriteCollection
+    from apps.models.my_trainer import WorkoutSession
+    from apps.models.payments import SubscriptionPlan
+    from apps.services import record_progress
+
+    call_command('loaddata', *FIXTURES, verbosity=0)
+
+    user = User.objects.create_user(username='budget', password='budget')
+    profile = user.profile
+    profile.onboarding_completed = True
+    profile.is_premium = True
+    profile.telegram_id = 1
+    profile.save()
+    plan = SubscriptionPlan.objects.create(price=67000, period=SubscriptionPlan.PeriodChoices.MONTHLY)
+    Subscription.objects.create(user=profile, plan=plan)
+    # click_prepare/click_complete manifest yozuvlari shu to'lovga (id=1) imzolangan callback yuboradi
+    Payment.objects.create(user=profile, plan=plan, amount=plan.price)
+
+    collection = FavoriteCollection.objects.create(user=profile, name='Budget')
+    for exercise in Exercise.objects.order_by('id')[:3]:
+        Favorite.objects.create(user=profile, exercise=exercise, collection=collection)
+    for workout in Workout.objects.order_by('id')[:2]:
+        record_progress(profile, workout, total_duration_seconds=600, total_calories=50, exercises_completed=3)
+    # Yakunlangan sessiya - DailyActivity rollupi va streak shundan (signal orqali) yoziladi
+    WorkoutSession.objects.create(
+        user=profile, workout=Workout.objects.order_by('id').first(), status=WorkoutSession.StatusChoices.COMPLETED,
+        duration_seconds=1800, total_calories=200, total_reps=60, total_weight=1200,
+    )
+    return user
+
+
+def request_url(client, name, entry):
+    """Manifest yozuvi bo'yicha URL ni chaqiradi. Returns: (url, method, response, recorder)"""
+    url = reverse(name, kwargs=entry.get('kwargs'))
+    method = entry.get('method', 'get')
+    cache.clear()
+
+    data = dict(entry.get('data', {}))
+    if entry.get('sign') == 'click':
+        data.update(service_id=settings.CLICK_SERVICE_ID, sign_time=timezone.now().strftime('%Y-%m-%d %H:%M:%S'))
+        data['sign_string'] = click_sign(data, settings.CLICK_SECRET_KEY)
+
+    recorder = QueryRecorder()
+    with connection.execute_wrapper(recorder):
+        if 'json' in entry:
+            response = getattr(client, method)(url, entry['json'], content_type='application/json')
+        else:
+            response = getattr(client, method)(url, data)
+    return url, method, response, recorder
+
+
+def response_problem(method, response, expect):
+    """
+    POST limiti view haqiqiy ishni bajarganda o'lchanadi: 2xx va manifestdagi expect maydonlari
+    (masalan Click javobidagi error=0). Xato yo'lidagi so'rovlar soni N+1 ni ko'rsatmaydi.
+    """
+    if method == 'post' and not 200 <= response.status_code < 300:
+        return f"status {response.status_code}"
+    if expect:
+        body = response.json()
+        wrong = {key: body.get(key) for key, value in expect.items() if body.get(key) != value}
+        if wrong:
+            return f"kutilmagan javob {wrong}"
+    return None
+
+
+class Command(BaseCommand):
+    help = (
+        "Har bir apps/urls.py URL ini onboardingdan o'tgan premium foydalanuvchi sifatida chaqiradi va SQL so'rovlar "
+        "sonini apps/query_budgets.json dagi limit bilan solishtiradi. Lokal: DB_ENGINE=sqlite"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--manifest', default=MANIFEST)
+        parser.add_argument('--update', action='store_true',
+                            help="Joriy so'rovlar sonini manifestga limit sifatida yozadi")
+        parser.add_argument('--only', action='append', dest='only', help="Faqat shu URL nomlari")
+
+    def handle(self, *args, **options):
+        manifest = load_manifest(options['manifest'])
+
+        from apps.urls import urlpatterns
+        names = list(dict.fromkeys(url_names(urlpatterns)))
+        missing = [name for name in names if name not in manifest]
+        if missing and not options['update']:
+            raise CommandError(f"Manifestda yo'q URL lar: {', '.join(missing)}")
+        for name in missing:
+            manifest[name] = {'budget': None}
+
+        with budget_database():
+            failures = self.run_budgets(manifest, names, options)
+
+        if options['update'] and failures:
+            raise CommandError(f"{failures} ta view xato javob qaytardi - manifest yangilanmadi")
+        if options['update']:
+            with open(options['manifest'], 'w') as f:
+                json.dump(manifest, f, indent=2, ensure_ascii=False)
+                f.write('\n')
+            self.stdout.write(self.style.SUCCESS(f"Manifest yangilandi: {options['manifest']}"))
+        elif failures:
+            raise CommandError(f"{failures} ta view so'rovlar limitidan oshdi")
+        else:
+            self.stdout.write(self.style.SUCCESS("Barcha viewlar limit ichida"))
+
+    def run_budgets(self, manifest, names, options):
+        client = Client(HTTP_HOST='localhost')
+        user = seed()
+        client.force_login(user)
+
+        failures = 0
+        for name in names:
+            if options['only'] and name not in options['only']:
+                continue
+            entry = manifest[name]
+            if entry.get('skip'):
+                self.stdout.write(f"SKIP {name}: {entry['skip']}")
+                continue
+
+            url, method, response, recorder = request_url(client, name, entry)
+            count = len(recorder.queries)
+            # questionnaire_submit/telegram_auth sessiyaga boshqa foydalanuvchini login qiladi
+            client.force_login(user)
+
+            problem = response_problem(method, response, entry.get('expect'))
+            if problem:
+                failures += 1
+                self.stdout.write(self.style.ERROR(f"FAIL {name} {method.upper()} {url}: {problem}"))
+                continue
+
+            if options['update']:
+                entry['budget'] = count
+                self.stdout.write(f"{name}: {count}")
+                continue
+
+            budget = entry['budget']
+            line = f"{name} {method.upper()} {url} -> {response.status_code}, {count}/{budget} so'rov"
+            if count <= budget:
+                self.stdout.write(f"OK   {line}")
+                continue
+
+            failures += 1
+            self.stdout.write(self.style.ERROR(f"FAIL {line}"))
+            for site, queries in recorder.grouped():
+                self.stdout.write(f"  {len(queries)}x {site}")
+                for sql in dict.fromkeys(queries):
+                    self.stdout.write(f"      {sql[:300]}")
+        return failures
@@ -0,0 +1,41 @@
+import signal
+
+from django.core.management.base import BaseCommand
+
+from apps.bot.outbox import drain_outbox
+
+
+class Command(BaseCommand):
+    help = "OutboxMessage navbatidagi bot xabarlarini batchlab yuboradi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=100)
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+        parser.add_argument('--concurrency', type=int, default=None)
+        parser.add_argument('--rate', type=float, default=None, help="Sekundiga xabarlar")
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtaydi")
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        totals = drain_outbox(
+            batch_size=options['batch_size'],
+            poll_interval=options['poll_interval'],
+            once=options['once'],
+            concurrency=options['concurrency'],
+            rate=options['rate'],
+            should_stop=lambda: self.stopping,
+            on_batch=self.log_batch,
+        )
+        self.stdout.write(f"Jami: sent={totals['sent']} retry={totals['retry']} failed={totals['failed']}")
+
+    def stop(self, signum, frame):
+        self.stopping = True
+
+    def log_batch(self, outcomes, totals):
+        self.stdout.write(
+            f"batch sent={outcomes['sent']} retry={outcomes['retry']} failed={outcomes['failed']} "
+            f"| jami sent={totals['sent']}"
+        )
@@ -0,0 +1,101 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+
+from apps.management.commands.check_query_budgets import (
+    MANIFEST,
+    budget_database,
+    load_manifest,
+    request_url,
+    seed,
+    url_names,
+)
+
+# Bitta qatorli/konstant jadvallar uchun to'liq skan normal holat
+DEFAULT_IGNORE = ('django_session', 'django_content_type', 'apps_subscriptionplan')
+
+
+def explain(sql, params):
+    """Returns: rejaning satrlari (PostgreSQL: EXPLAIN matni, SQLite: EXPLAIN QUERY PLAN detail)."""
+    with transaction.atomic(), connection.cursor() as cursor:
+        if connection.vendor == 'postgresql':
+            # Test bazasi kichik - planner har doim Seq Scan tanlaydi. O'chirilganda ham qolgan
+            # Seq Scan mos indeks yo'qligini bildiradi.
+            cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+        return [row[-1] for row in cursor.fetchall()]
+
+
+def sequential_scans(plan):
+    """Indekssiz to'liq skan qilinadigan jadvallar."""
+    tables = []
+    for line in plan:
+        line = line.strip().lstrip('->').strip()
+        if line.startswith('Seq Scan on '):
+            tables.append(line.split()[3])
+        elif line.startswith('SCAN ') and ' USING ' not in line:
+            table = line.split()[1]
+            # SQLite: FROM (...) subquery va CONSTANT ROW - jadval emas
+            if table not in ('subquery', 'CONSTANT'):
+                tables.append(table)
+    return tables
+
+
+class Command(BaseCommand):
+    help = (
+        "Har bir view ning SELECT so'rovlari uchun EXPLAIN ishlatadi va indekssiz (sequential) skanlarni "
+        "ko'rsatadi. Sxema va ma'lumotlar check_query_budgets bilan bir xil. Lokal: DB_ENGINE=sqlite"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--manifest', default=MANIFEST)
+        parser.add_argument('--only', action='append', dest='only', help="Faqat shu URL nomlari")
+        parser.add_argument('--ignore', action='append', default=list(DEFAULT_IGNORE),
+                            help="E'tiborga olinmaydigan jadval")
+        parser.add_argument('--plans', action='store_true', help="Har bir so'rov rejasini to'liq chiqaradi")
+        parser.add_argument('--fail', action='store_true', help="Seq scan topilsa xato bilan tugaydi")
+
+    def handle(self, *args, **options):
+        manifest = load_manifest(options['manifest'])
+        from apps.urls import urlpatterns
+
+        with budget_database():
+            flagged = self.explain_views(manifest, list(dict.fromkeys(url_names(urlpatterns))), options)
+
+        if not flagged:
+            self.stdout.write(self.style.SUCCESS("Indekssiz skan topilmadi"))
+        elif options['fail']:
+            raise CommandError(f"{flagged} ta so'rovda indekssiz skan")
+        else:
+            self.stdout.write(self.style.WARNING(f"{flagged} ta so'rovda indekssiz skan"))
+
+    def explain_views(self, manifest, names, options):
+        client = Client(HTTP_HOST='localhost')
+        client.force_login(seed())
+        ignore = set(options['ignore'])
+
+        flagged = 0
+        for name in names:
+            entry = manifest.get(name, {})
+            if (options['only'] and name not in options['only']) or entry.get('skip'):
+                continue
+
+            url, method, response, recorder = request_url(client, name, entry)
+            selects = {}
+            for site, sql, params in recorder.queries:
+                if sql.lstrip().upper().startswith('SELECT'):
+                    selects.setdefault(sql, (site, params))
+
+            self.stdout.write(f"{name} {method.upper()} {url} -> {response.status_code}, {len(selects)} ta SELECT")
+            for sql, (site, params) in selects.items():
+                plan = explain(sql, params)
+                scans = [table.strip('"') for table in sequential_scans(plan)]
+                scans = [table for table in scans if table not in ignore]
+                if scans:
+                    flagged += 1
+                    self.stdout.write(self.style.WARNING(f"  SEQ SCAN {', '.join(scans)}  ({site})"))
+                    self.stdout.write(f"      {sql[:300]}")
+                if options['plans']:
+                    for line in plan:
+                        self.stdout.write(f"      | {line}")
+        return flagged
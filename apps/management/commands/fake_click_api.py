@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand
+
+from apps.fakes import FakeClickAPI
+
+
+class Command(BaseCommand):
+    help = "Lokal fake Click Merchant API server (CLICK_API_URL=http://127.0.0.1:8082)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8082)
+        parser.add_argument('--latency', type=float, default=0.05, help="Har bir javob kechikishi (sekund)")
+        parser.add_argument('--error-rate', type=float, default=0.0, help="500 qaytaradigan so'rovlar ulushi")
+        parser.add_argument('--stall-rate', type=float, default=0.0, help="Javob bermaydigan so'rovlar ulushi")
+        parser.add_argument('--stall', type=float, default=30.0, help="Osilib qolish davomiyligi (sekund)")
+        parser.add_argument('--declined', action='append', default=[], help="Rad etiladigan card_token")
+
+    def handle(self, *args, **options):
+        server = FakeClickAPI(
+            (options['host'], options['port']),
+            latency=options['latency'],
+            error_rate=options['error_rate'],
+            stall_rate=options['stall_rate'],
+            stall=options['stall'],
+            declined=options['declined'],
+        )
+        self.stdout.write(f"Fake Click API: {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(
+                f"{server.requests} ta so'rov, {len(server.charges)} ta to'lov, "
+                f"{server.duplicate_charges} ta takroriy yechish"
+            )
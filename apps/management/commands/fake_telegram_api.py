@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from apps.fakes import FakeTelegramAPI
+
+
+class Command(BaseCommand):
+    help = "Lokal fake Telegram Bot API server (TELEGRAM_API_URL=http://127.0.0.1:8081)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1')
+        parser.add_argument('--port', type=int, default=8081)
+        parser.add_argument('--rate-limit', type=int, default=30, help="sendMessage/sekund, undan keyin 429")
+        parser.add_argument('--latency', type=float, default=0.05, help="Har bir javob kechikishi (sekund)")
+        parser.add_argument('--blocked', type=int, action='append', default=[], help="403 qaytaradigan chat_id")
+
+    def handle(self, *args, **options):
+        server = FakeTelegramAPI(
+            (options['host'], options['port']),
+            rate_limit=options['rate_limit'],
+            latency=options['latency'],
+            blocked=options['blocked'],
+        )
+        self.stdout.write(f"Fake Bot API: {server.url}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            self.stdout.write(f"{len(server.messages)} ta xabar qabul qilindi, {server.throttled} ta 429")
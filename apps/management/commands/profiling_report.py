@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from apps.services.profiling import endpoint_report
+
+COLUMNS = ('requests', 'p50', 'p95', 'p99', 'max', 'sql_count_avg', 'sql_ms_p95', 'template_ms_p95', 'cache_hit_ratio')
+
+
+class Command(BaseCommand):
+    help = "RequestSample lar bo'yicha eng sekin endpointlar (vaqtlar ms da)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--hours', type=int, default=24)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--order', default='p95', choices=('p50', 'p90', 'p95', 'p99', 'max', 'requests'))
+
+    def handle(self, *args, **options):
+        report = endpoint_report(options['hours'], order_by=options['order'])[:options['limit']]
+        if not report:
+            self.stdout.write("Namunalar yo'q (PROFILING_ENABLED=true ekanini tekshiring)")
+            return
+
+        width = max(len(row['url_name']) for row in report)
+        self.stdout.write(f"{'url_name':<{width}}  " + '  '.join(f'{column:>15}' for column in COLUMNS))
+        for row in report:
+            values = '  '.join(f"{'-' if row[column] is None else row[column]:>15}" for column in COLUMNS)
+            self.stdout.write(f"{row['url_name']:<{width}}  {values}")
@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from apps.services.rollups import rebuild_daily_activity
+
+
+class Command(BaseCommand):
+    help = "DailyActivity rolluplarini WorkoutSession/WorkoutProgress/ExerciseLog dan qayta quradi (backfill)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', type=int, action='append', dest='users',
+                            help="Faqat shu UserProfile id lar uchun (bir necha marta berish mumkin)")
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        created = rebuild_daily_activity(options['users'], batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f"{created} ta kunlik rollup qatori yozildi"))
+        self.stdout.write("Streaklarni yangilash uchun: python manage.py rebuild_streaks")
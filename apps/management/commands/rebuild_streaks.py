@@ -0,0 +1,64 @@
+from itertools import groupby
+from operator import itemgetter
+
+from django.core.management.base import BaseCommand
+from django.db.models import Exists, OuterRef
+
+from apps.models import DailyActivity, UserStreak
+from apps.services.streaks import local_date, streaks_from_dates
+
+
+class Command(BaseCommand):
+    help = "Barcha foydalanuvchilar uchun streak holatini DailyActivity rollupidan qayta hisoblaydi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def active_days(self):
+        return (
+            DailyActivity.objects
+            .filter(sessions__gt=0)
+            .order_by('user_id', 'date')
+            .values_list('user_id', 'date')
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        today = local_date()
+        batch = []
+        total = 0
+
+        for user_id, rows in groupby(self.active_days().iterator(chunk_size=batch_size), key=itemgetter(0)):
+            current, longest, last_active = streaks_from_dates((day for _, day in rows), today)
+            batch.append(UserStreak(
+                user_id=user_id,
+                current_streak=current,
+                longest_streak=longest,
+                last_active_date=last_active,
+            ))
+            if len(batch) >= batch_size:
+                total += self.flush(batch)
+                batch = []
+
+        total += self.flush(batch)
+
+        # Faol kuni qolmagan foydalanuvchilar - id lar ro'yxati o'rniga DailyActivity bo'yicha subquery
+        reset = (
+            UserStreak.objects
+            .exclude(Exists(self.active_days().filter(user_id=OuterRef('user_id'))))
+            .exclude(current_streak=0, longest_streak=0, last_active_date=None)
+            .update(current_streak=0, longest_streak=0, last_active_date=None)
+        )
+
+        self.stdout.write(self.style.SUCCESS(f"{total} ta streak yangilandi, {reset} ta tozalandi"))
+
+    def flush(self, batch):
+        if not batch:
+            return 0
+        UserStreak.objects.bulk_create(
+            batch,
+            update_conflicts=True,
+            unique_fields=['user'],
+            update_fields=['current_streak', 'longest_streak', 'last_active_date', 'updated_at'],
+        )
+        return len(batch)
@@ -0,0 +1,33 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from apps.click_client import get_click_client
+from apps.services.renewals import run_renewals
+
+
+class Command(BaseCommand):
+    help = "Muddati yaqinlashgan auto_renew obunalar uchun saqlangan kartalardan to'lov yechadi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Faqat hisobot - to'lov yechilmaydi")
+        parser.add_argument('--chunk-size', type=int, default=None)
+        parser.add_argument('--concurrency', type=int, default=None)
+
+    def handle(self, *args, **options):
+        totals = run_renewals(
+            chunk_size=options['chunk_size'],
+            concurrency=options['concurrency'],
+            dry_run=options['dry_run'],
+            on_chunk=self.log_chunk,
+        )
+        self.stdout.write(json.dumps(totals, indent=2, default=str))
+        if not options['dry_run']:
+            self.stdout.write(json.dumps(get_click_client().stats(), indent=2))
+
+    def log_chunk(self, outcomes, totals):
+        self.stdout.write(
+            f"chunk renewed={outcomes['renewed']} failed={outcomes['failed']} cancelled={outcomes['cancelled']} "
+            f"card_expired={outcomes['card_expired']} unresolved={outcomes['unresolved']} "
+            f"| jami renewed={totals['renewed']}"
+        )
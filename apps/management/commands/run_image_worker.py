@@ -0,0 +1,59 @@
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.services.images import claim_jobs, process_job
+
+
+class Command(BaseCommand):
+    help = "ImageDerivativeJob navbatidan WebP/JPEG derivative larni thread pool bilan yaratadi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--poll-interval', type=float, default=2.0)
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtaydi")
+
+    def handle(self, *args, **options):
+        workers = options['workers']
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        done = failed = 0
+        inflight = set()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='image-worker') as executor:
+            while not self.stopping or inflight:
+                for future in [future for future in inflight if future.done()]:
+                    inflight.discard(future)
+                    if future.result():
+                        done += 1
+                    else:
+                        failed += 1
+
+                claimed = []
+                if not self.stopping and len(inflight) < workers * 2:
+                    claimed = claim_jobs(workers * 2 - len(inflight))
+                    inflight.update(executor.submit(self.run_job, job) for job in claimed)
+
+                if options['once'] and not claimed and not inflight:
+                    break
+                if inflight:
+                    wait(list(inflight), timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                elif not claimed:
+                    time.sleep(options['poll_interval'])
+
+        self.stdout.write(f"Rasmlar: done={done} failed={failed}")
+
+    def stop(self, signum, frame):
+        self.stdout.write("To'xtatilmoqda: joriy rasmlar tugatiladi...")
+        self.stopping = True
+
+    @staticmethod
+    def run_job(job):
+        try:
+            return process_job(job)
+        finally:
+            close_old_connections()
@@ -0,0 +1,63 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+import apps.tasks  # noqa: F401 - @scheduled joblarni ro'yxatdan o'tkazadi
+from apps.scheduler import JOBS, due_jobs, minutes_after, run_job
+
+
+class Command(BaseCommand):
+    help = "apps/tasks.py dagi cron joblarini har daqiqa boshida ishga tushiradi (broker kerak emas)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help="Joriy daqiqa uchun joblarni bajarib to'xtaydi")
+        parser.add_argument('--run', metavar='JOB', help="Ko'rsatilgan jobni hozir bajaradi")
+        parser.add_argument('--list', action='store_true', help="Ro'yxatdan o'tgan joblar")
+
+    def handle(self, *args, **options):
+        if options['list']:
+            for job in JOBS.values():
+                self.stdout.write(f"{job.schedule.expression:<15} {job.name}")
+            return
+
+        if options['run']:
+            job = JOBS.get(options['run'])
+            if job is None:
+                raise CommandError(f"Job topilmadi: {options['run']}. Mavjud: {', '.join(JOBS)}")
+            self.report(job, run_job(job))
+            return
+
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        # Joblar uzoq ishlasa o'tib ketgan daqiqalar keyingi aylanishda bajariladi (JobRun slot bo'yicha unique)
+        last = None
+        while not self.stopping:
+            now = timezone.localtime().replace(second=0, microsecond=0)
+            for moment in [now] if last is None else minutes_after(last, now):
+                if self.stopping:
+                    break
+                for job in due_jobs(moment):
+                    self.report(job, run_job(job, moment))
+                last = moment
+            if options['once']:
+                break
+            self.sleep_until(now.timestamp() + 60)
+
+    def stop(self, signum, frame):
+        self.stopping = True
+
+    def sleep_until(self, deadline):
+        while not self.stopping and (remaining := deadline - time.time()) > 0:
+            time.sleep(min(remaining, 1))
+
+    def report(self, job, run):
+        if run is None:
+            self.stdout.write(f"{job.name}: slot boshqa scheduler tomonidan bajarilgan")
+            return
+        self.stdout.write(
+            f"{job.name}: {run.status} rows={run.rows_affected} {run.duration_ms:.1f}ms {run.error}".rstrip()
+        )
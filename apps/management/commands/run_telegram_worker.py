@@ -0,0 +1,113 @@
+import signal
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from apps.bot.queue import claim_updates, process_update, purge_processed, queue_stats, release_updates
+
+
+class Command(BaseCommand):
+    help = "TelegramUpdate navbatini thread pool bilan qayta ishlaydi (webhook faqat navbatga yozadi)"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=4)
+        parser.add_argument('--max-inflight', type=int, default=None,
+                            help="Bir vaqtda olingan update lar chegarasi (default: workers * 2)")
+        parser.add_argument('--poll-interval', type=float, default=1.0)
+        parser.add_argument('--metrics-interval', type=float, default=30.0)
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtaydi")
+
+    def handle(self, *args, **options):
+        from apps.bot import bot_view  # noqa: F401 - message handlerlar ro'yxatdan o'tadi
+        from apps.bot.bot import bot
+
+        # Handlerlar shu worker threadlarida bajariladi, xatolar qayta urinish uchun ko'tariladi
+        bot.threaded = False
+        self.bot = bot
+
+        workers = options['workers']
+        max_inflight = options['max_inflight'] or workers * 2
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        self.counters = defaultdict(int)
+        inflight = {}
+        started = last_metrics = time.monotonic()
+
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tg-worker') as executor:
+            while not self.stopping or inflight:
+                for future in [future for future in inflight if future.done()]:
+                    size = inflight.pop(future)
+                    processed, failed = future.result()
+                    self.counters['processed'] += processed
+                    self.counters['failed'] += failed
+                    self.counters['inflight_updates'] -= size
+
+                claimed = []
+                capacity = max_inflight - self.counters['inflight_updates']
+                if not self.stopping and capacity > 0:
+                    claimed = claim_updates(capacity)
+                    for group in self.group_by_chat(claimed):
+                        inflight[executor.submit(self.process_group, group)] = len(group)
+                        self.counters['inflight_updates'] += len(group)
+                elif not self.stopping:
+                    # Backpressure: pool to'la - yangi update olinmaydi
+                    self.counters['saturated'] += 1
+
+                if time.monotonic() - last_metrics >= options['metrics_interval']:
+                    self.report(max_inflight, time.monotonic() - started)
+                    last_metrics = time.monotonic()
+
+                if options['once'] and not claimed and not inflight:
+                    break
+                if inflight:
+                    wait(list(inflight), timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                elif not claimed:
+                    time.sleep(options['poll_interval'])
+
+        self.report(max_inflight, time.monotonic() - started)
+
+    def stop(self, signum, frame):
+        self.stdout.write("To'xtatilmoqda: joriy update lar tugatiladi...")
+        self.stopping = True
+
+    @staticmethod
+    def group_by_chat(updates):
+        groups = defaultdict(list)
+        for update in updates:
+            groups[update.chat_key or f'update:{update.update_id}'].append(update)
+        return groups.values()
+
+    def process_group(self, updates):
+        """
+        Bitta chat update lari ketma-ket. Qayta urinishga qaytgan update dan keyingilari navbatga qaytariladi -
+        claim_updates ularni u tugamaguncha bermaydi. Returns: (processed, failed)
+        """
+        processed = failed = 0
+        try:
+            for position, update in enumerate(updates):
+                if process_update(self.bot, update):
+                    processed += 1
+                    continue
+                failed += 1
+                if update.status == update.StatusChoices.PENDING:
+                    release_updates(updates[position + 1:])
+                    break
+        finally:
+            close_old_connections()
+        return processed, failed
+
+    def report(self, max_inflight, elapsed):
+        stats = queue_stats()
+        purged = purge_processed()
+        self.stdout.write(
+            f"queue pending={stats['pending']} processing={stats['processing']} failed={stats['failed']} "
+            f"lag={stats['lag_seconds']}s | inflight={self.counters['inflight_updates']}/{max_inflight} "
+            f"saturated={self.counters['saturated']} processed={self.counters['processed']} "
+            f"errors={self.counters['failed']} rate={self.counters['processed'] / max(elapsed, 1e-6):.1f}/s "
+            f"purged={purged}"
+        )
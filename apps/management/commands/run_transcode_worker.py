@@ -0,0 +1,86 @@
+import multiprocessing
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+import django
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+
+
+# spawn: bola jarayon shu modulni django.setup() dan oldin import qiladi - modellar funksiyalar
+# ichida import qilinadi
+
+
+def init_process():
+    # SIGINT ni asosiy jarayon boshqaradi
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    django.setup()
+
+
+def run_job(job_id):
+    from apps.services.transcoding import process_job
+
+    try:
+        return process_job(job_id)
+    finally:
+        close_old_connections()
+
+
+class Command(BaseCommand):
+    help = (
+        "TranscodeJob navbatini jarayonlar puli bilan bajaradi: ffmpeg CPU ni band qiladi, shuning uchun "
+        "web/bot jarayonlaridan alohida ishlaydi"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--processes', type=int, default=settings.TRANSCODE_PROCESSES)
+        parser.add_argument('--poll-interval', type=float, default=5.0)
+        parser.add_argument('--once', action='store_true', help="Navbat bo'shagach to'xtaydi")
+
+    def handle(self, *args, **options):
+        from apps.services.transcoding import claim_jobs
+
+        processes = options['processes']
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+
+        done = failed = 0
+        inflight = {}
+        # Ochiq DB ulanishlari bolalarga o'tmasligi uchun spawn
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=processes, mp_context=context, initializer=init_process) as executor:
+            while not self.stopping or inflight:
+                for future in [future for future in inflight if future.done()]:
+                    job_id = inflight.pop(future)
+                    try:
+                        ok = future.result()
+                    except Exception as exc:
+                        # Jarayon o'lgan - job VISIBILITY_TIMEOUT dan keyin qayta olinadi
+                        self.stderr.write(f"job {job_id}: {exc!r}")
+                        ok = False
+                    done += ok
+                    failed += not ok
+                    self.stdout.write(f"job {job_id}: {'done' if ok else 'failed'}")
+
+                claimed = []
+                if not self.stopping and len(inflight) < processes:
+                    claimed = claim_jobs(processes - len(inflight))
+                    for job in claimed:
+                        inflight[executor.submit(run_job, job.pk)] = job.pk
+
+                if options['once'] and not claimed and not inflight:
+                    break
+                if inflight:
+                    wait(list(inflight), timeout=options['poll_interval'], return_when=FIRST_COMPLETED)
+                elif not claimed:
+                    connections.close_all()
+                    time.sleep(options['poll_interval'])
+
+        self.stdout.write(f"Transcode: done={done} failed={failed}")
+
+    def stop(self, signum, frame):
+        self.stdout.write("To'xtatilmoqda: joriy transcode lar tugatiladi...")
+        self.stopping = True
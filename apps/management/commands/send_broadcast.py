@@ -0,0 +1,40 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.bot.broadcast import CHUNK_SIZE, run_broadcast
+from apps.models import Broadcast
+
+
+class Command(BaseCommand):
+    help = "Broadcast yuboradi yoki --resume bilan checkpointdan davom ettiradi va hisobot chiqaradi"
+
+    def add_arguments(self, parser):
+        parser.add_argument('--text', help="Yangi broadcast matni (HTML)")
+        parser.add_argument('--audience', default=Broadcast.AudienceChoices.ALL,
+                            choices=Broadcast.AudienceChoices.values)
+        parser.add_argument('--resume', type=int, help="Mavjud Broadcast id si")
+        parser.add_argument('--concurrency', type=int, default=None)
+        parser.add_argument('--rate', type=float, default=None, help="Sekundiga xabarlar")
+        parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if options['resume']:
+            broadcast = Broadcast.objects.filter(pk=options['resume']).first()
+            if broadcast is None:
+                raise CommandError(f"Broadcast #{options['resume']} topilmadi")
+            if broadcast.status == Broadcast.StatusChoices.COMPLETED:
+                raise CommandError(f"Broadcast #{broadcast.pk} allaqachon yakunlangan")
+        elif options['text']:
+            broadcast = Broadcast.objects.create(text=options['text'], audience=options['audience'])
+        else:
+            raise CommandError("--text yoki --resume kerak")
+
+        self.stdout.write(f"Broadcast #{broadcast.pk}: checkpoint {broadcast.last_profile_id} dan boshlanmoqda")
+        report = run_broadcast(
+            broadcast,
+            concurrency=options['concurrency'],
+            rate=options['rate'],
+            chunk_size=options['chunk_size'],
+        )
+        self.stdout.write(json.dumps(report, indent=2, ensure_ascii=False))
@@ -0,0 +1,37 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+# search_document - PostgreSQL o'zi yangilab turadigan saqlangan (generated) ustun, apps.services.search.postgres_search
+# shu ustun bo'yicha @@ filtrlaydi, shuning uchun GIN indeksi ishlatiladi
+STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS apps_exercise_name_trgm ON apps_exercise USING gin (name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS apps_exercise_name_uz_trgm ON apps_exercise USING gin (name_uz gin_trgm_ops)",
+    "ALTER TABLE apps_exercise ADD COLUMN IF NOT EXISTS search_document tsvector GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple'::regconfig, coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(name_uz, '')), 'A') || "
+    "setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'B')) STORED",
+    "CREATE INDEX IF NOT EXISTS apps_exercise_search_document ON apps_exercise USING gin (search_document)",
+    "ALTER TABLE apps_exerciseinstruction ADD COLUMN IF NOT EXISTS search_document tsvector GENERATED ALWAYS AS ("
+    "to_tsvector('simple'::regconfig, coalesce(text, '') || ' ' || coalesce(text_uz, ''))) STORED",
+    "CREATE INDEX IF NOT EXISTS apps_exerciseinstruction_search_document "
+    "ON apps_exerciseinstruction USING gin (search_document)",
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "PostgreSQL da mashq qidiruvi uchun pg_trgm kengaytmasi, saqlangan search_document ustunlari va GIN "
+        "indekslarini yaratadi. PostgreSQL qidiruvi shu ustunlarga tayanadi - deploydan keyin bir marta ishga tushiring"
+    )
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError("Bu buyruq faqat PostgreSQL uchun (boshqa bazalarda Python trigram indeksi ishlatiladi)")
+
+        with connection.cursor() as cursor:
+            for statement in STATEMENTS:
+                cursor.execute(statement)
+                self.stdout.write(statement)
+
+        self.stdout.write(self.style.SUCCESS("Qidiruv indekslari tayyor"))
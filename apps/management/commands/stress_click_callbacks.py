@@ -0,0 +1,99 @@
+import hashlib
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+
+from apps.models import Payment, Subscription, User
+from apps.models.payments import SubscriptionPlan
+
+
+def click_sign(params, secret_key):
+    """
+    Click imzosi hujjatdagi formula bo'yicha, ClickMerchant.generate_sign_string dan mustaqil -
+    formula noto'g'ri bo'lsa callbacklar -1 bilan qaytadi va sinov yiqiladi.
+    COMPLETE (action=1) imzosiga merchant_prepare_id ham kiradi.
+    """
+    prepare_id = params['merchant_prepare_id'] if str(params['action']) == '1' else ''
+    sign_string = (
+        f"{params['click_trans_id']}{params['service_id']}{secret_key}{params['merchant_trans_id']}"
+        f"{prepare_id}{params['amount']}{params['action']}{params['sign_time']}"
+    )
+    return hashlib.md5(sign_string.encode('utf-8')).hexdigest()
+
+
+class Command(BaseCommand):
+    help = (
+        "Bitta to'lov uchun bir vaqtda ko'plab takroriy Click COMPLETE callbacklarini yuboradi va "
+        "obuna aynan bir marta uzaytirilganini tekshiradi. Sinov ma'lumotlari oxirida o'chiriladi."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=300)
+        parser.add_argument('--workers', type=int, default=50)
+        parser.add_argument('--keep', action='store_true', help="Sinov ma'lumotlarini o'chirmaydi")
+
+    def handle(self, *args, **options):
+        user = User.objects.create_user(username=f'click-stress-{time.time_ns()}')
+        profile = user.profile
+        plan = SubscriptionPlan.objects.create(price=67000, period=SubscriptionPlan.PeriodChoices.MONTHLY)
+        subscription = Subscription.objects.create(user=profile, plan=plan)
+        expected_end = plan.get_expiry_date(subscription.end_date)
+        payment = Payment.objects.create(user=profile, plan=plan, amount=plan.price)
+
+        try:
+            outcomes, elapsed = self.fire(payment, options['requests'], options['workers'])
+            self.verify(payment, subscription, expected_end, outcomes)
+        finally:
+            if not options['keep']:
+                user.delete()
+                plan.delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['requests']} ta callback {elapsed:.2f}s da: {dict(outcomes)} - obuna bir marta uzaytirildi"
+        ))
+
+    def fire(self, payment, total, workers):
+        params = {
+            'click_trans_id': f'stress-{payment.pk}',
+            'service_id': settings.CLICK_SERVICE_ID,
+            'merchant_trans_id': str(payment.pk),
+            'merchant_prepare_id': str(payment.pk),
+            'amount': str(payment.amount),
+            'action': '1',
+            'error': '0',
+            'sign_time': timezone.now().strftime('%Y-%m-%d %H:%M:%S'),
+        }
+        params['sign_string'] = click_sign(params, settings.CLICK_SECRET_KEY)
+        url = reverse('click_complete')
+
+        def callback(_):
+            try:
+                response = Client(HTTP_HOST='localhost').post(url, params)
+                return response.json()['error']
+            finally:
+                connection.close()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            outcomes = Counter(executor.map(callback, range(total)))
+        return outcomes, time.perf_counter() - start
+
+    def verify(self, payment, subscription, expected_end, outcomes):
+        payment.refresh_from_db()
+        subscription.refresh_from_db()
+        errors = []
+        if set(outcomes) != {0}:
+            errors.append(f"kutilmagan javoblar: {dict(outcomes)}")
+        if payment.status != Payment.PaymentStatus.COMPLETED:
+            errors.append(f"to'lov holati {payment.status}")
+        if subscription.end_date != expected_end:
+            errors.append(f"end_date {subscription.end_date}, kutilgan {expected_end}")
+        if errors:
+            raise CommandError("; ".join(errors))
@@ -0,0 +1,75 @@
+import random
+import time
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
+from django.utils.functional import SimpleLazyObject
+
+from apps.models import RequestSample
+from apps.services.entitlements import get_entitlement
+from apps.services.profiling import add_sample, install_template_timer, start_profile, stop_profile
+
+
+class RequestProfilingMiddleware:
+    """
+    So'rov vaqti, SQL soni/vaqti, shablon render vaqti va kesh hit/miss larini
+    URL nomi (apps/urls.py) bilan RequestSample ga yozadi.
+
+    PROFILING_ENABLED - yoqish, PROFILING_SAMPLE_RATE - o'lchanadigan so'rovlar ulushi (0..1).
+    MIDDLEWARE ro'yxatining boshida turishi kerak.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'PROFILING_SAMPLE_RATE', 1.0)
+        self.skip_prefixes = tuple(prefix for prefix in (settings.STATIC_URL, settings.MEDIA_URL) if prefix)
+        install_template_timer()
+
+    def should_sample(self, request):
+        if request.path.startswith(self.skip_prefixes):
+            return False
+        return random.random() < self.sample_rate
+
+    def __call__(self, request):
+        if not self.should_sample(request):
+            return self.get_response(request)
+
+        profile, token = start_profile()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(profile):
+                response = self.get_response(request)
+        finally:
+            stop_profile(token)
+        duration_ms = (time.perf_counter() - start) * 1000
+
+        match = getattr(request, 'resolver_match', None)
+        add_sample(RequestSample(
+            url_name=(match.url_name if match and match.url_name else 'unresolved')[:100],
+            method=request.method,
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+            sql_count=profile.sql_count,
+            sql_ms=profile.sql_ms,
+            template_ms=profile.template_ms,
+            cache_hits=profile.cache_hits,
+            cache_misses=profile.cache_misses,
+        ))
+        return response
+
+
+class EntitlementMiddleware:
+    """
+    request.entitlement - foydalanuvchining premium/trial/expired holati.
+    Faqat birinchi murojaatda (keshdan) hisoblanadi. AuthenticationMiddleware dan keyin turishi kerak.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.entitlement = SimpleLazyObject(lambda: get_entitlement(request.user))
+        return self.get_response(request)
@@ -0,0 +1,73 @@
+import hashlib
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
+
+from apps.services.cache import namespace_version
+
+
+class CacheVersionMixin:
+    """
+    Shablondagi {% cache %} bo'laklari uchun namespace versiyasini kontekstga qo'shadi:
+    {% cache 3600 program_list cache_version LANGUAGE_CODE %}
+    Namespace versiyasi signal orqali oshirilganda bo'lak qayta render qilinadi.
+    """
+    cache_namespaces = ()
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context['cache_version'] = namespace_version(self.cache_namespaces)
+        return context
+
+
+class ConditionalGetMixin:
+    """
+    Sahifa bog'liq obyektlarning max(updated_at) qiymatidan Last-Modified va ETag hosil qiladi
+    va o'zgarmagan sahifa uchun shablon render qilinmasdan 304 qaytaradi.
+
+    get_conditional_querysets() - updated_at maydoni bor querysetlar;
+    updated_at bo'lmagan modellar (Edition, WorkoutExercise, ...) conditional_namespaces
+    versiyasi orqali hisobga olinadi;
+    get_conditional_user_state() - foydalanuvchiga bog'liq holat (masalan, sevimlilar).
+    """
+    conditional_namespaces = ()
+
+    def get_conditional_querysets(self):
+        return []
+
+    def get_conditional_user_state(self):
+        return ''
+
+    def get_validators(self):
+        """Returns: (last_modified, etag)"""
+        last_modified = None
+        parts = [
+            namespace_version(self.conditional_namespaces),
+            get_language() or '',
+            self.get_conditional_user_state(),
+        ]
+        for queryset in self.get_conditional_querysets():
+            state = queryset.order_by().aggregate(last=Max('updated_at'), count=Count('pk'))
+            parts.append(f"{state['count']}:{state['last'].timestamp() if state['last'] else 0}")
+            if state['last'] and (last_modified is None or state['last'] > last_modified):
+                last_modified = state['last']
+
+        etag = quote_etag(hashlib.md5('|'.join(str(part) for part in parts).encode()).hexdigest())
+        return last_modified, etag
+
+    def get(self, request, *args, **kwargs):
+        last_modified, etag = self.get_validators()
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+
+        response = get_conditional_response(request, etag=etag, last_modified=timestamp)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response['ETag'] = etag
+            if timestamp is not None:
+                response['Last-Modified'] = http_date(timestamp)
+            patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -1,6 +1,11 @@
-from apps.models.analytics import UserActivity
+from apps.models.analytics import DailyActivity, RequestSample, UserActivity
+from apps.models.cache import CacheNamespace
 from apps.models.exercises import Exercise, ExerciseInstruction
 from apps.models.favorites import Favorite
-from apps.models.payments import Payment, Subscription
+from apps.models.jobs import JobRun
+from apps.models.media import ImageDerivative, ImageDerivativeJob, TranscodeJob, VideoRendition
+from apps.models.my_trainer import UserStreak
+from apps.models.payments import Payment, PaymentMethod, Subscription
+from apps.models.telegram import Broadcast, OutboxMessage, TelegramUpdate
 from apps.models.users import User, UserMotivation, UserProfile
 from apps.models.workouts import Edition, Program, Workout
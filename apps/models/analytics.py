@@ -1,5 +1,19 @@
 from apps.models.base import CreatedBaseModel
-from django.db.models import CASCADE, CharField, ForeignKey, JSONField, TextChoices
+from django.db.models import (
+    CASCADE,
+    CharField,
+    DateField,
+    DateTimeField,
+    DecimalField,
+    FloatField,
+    ForeignKey,
+    Index,
+    IntegerField,
+    PositiveSmallIntegerField,
+    JSONField,
+    Model,
+    TextChoices,
+)
 from django.utils.translation import gettext_lazy as _
 
 
@@ -23,6 +37,49 @@ class UserActivity(CreatedBaseModel):
         verbose_name = _('UserActivity')
         verbose_name_plural = _('UserActivities')
         ordering = ['-created_at']
+        indexes = [Index(fields=['user', 'event', '-created_at'])]
 
     def __str__(self):
         return f"{self.user.telegram_id} - {self.get_event_display()}"
+
+
+class DailyActivity(Model):
+    user = ForeignKey('apps.UserProfile', CASCADE, related_name='daily_activities')
+    date = DateField(help_text="Asia/Tashkent bo'yicha kun")
+    sessions = IntegerField(default=0)
+    duration_seconds = IntegerField(default=0)
+    calories = DecimalField(max_digits=10, decimal_places=2, default=0)
+    reps = IntegerField(default=0)
+    volume = DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        verbose_name = _('Daily Activity')
+        verbose_name_plural = _('Daily Activities')
+        ordering = ['-date']
+        unique_together = ('user', 'date')
+
+    def __str__(self):
+        return f"{self.user.name} - {self.date}"
+
+
+class RequestSample(Model):
+    """RequestProfilingMiddleware yozib olgan bitta so'rov o'lchovi."""
+    url_name = CharField(max_length=100)
+    method = CharField(max_length=10)
+    status_code = PositiveSmallIntegerField()
+    duration_ms = FloatField()
+    sql_count = IntegerField(default=0)
+    sql_ms = FloatField(default=0)
+    template_ms = FloatField(default=0)
+    cache_hits = IntegerField(default=0)
+    cache_misses = IntegerField(default=0)
+    created_at = DateTimeField(auto_now_add=True, db_index=True)
+
+    class Meta:
+        verbose_name = _('Request Sample')
+        verbose_name_plural = _('Request Samples')
+        ordering = ['-created_at']
+        indexes = [Index(fields=['url_name', 'created_at'])]
+
+    def __str__(self):
+        return f"{self.method} {self.url_name} {self.duration_ms:.0f}ms"
@@ -0,0 +1,20 @@
+from django.db.models import CharField, DateTimeField, Model, PositiveBigIntegerField
+from django.utils.translation import gettext_lazy as _
+
+
+class CacheNamespace(Model):
+    """
+    Kesh namespace versiyasi (apps.services.cache). Bazada saqlanadi: kesh tozalanganda yoki process qayta
+    ishga tushganda versiya orqaga qaytmaydi, boshqa processlar ham oshirilgan versiyani ko'radi.
+    """
+
+    name = CharField(max_length=100, unique=True)
+    version = PositiveBigIntegerField(default=0)
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = _('Cache Namespace')
+        verbose_name_plural = _('Cache Namespaces')
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
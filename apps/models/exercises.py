@@ -1,23 +1,16 @@
-import io
-import os
-import subprocess
-import threading
-
-from PIL import Image
-from django.core.files.base import File
-from django.core.files.storage import default_storage
-from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.db.models import (
     CASCADE,
     CharField,
     FileField,
     ForeignKey,
     ImageField,
+    Index,
     IntegerField,
     Model,
     TextChoices,
     TextField,
 )
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
 from apps.models.base import CreatedBaseModel
@@ -64,88 +57,48 @@ class Exercise(CreatedBaseModel):
 
     class Meta:
         ordering = ['name']
+        # Mushak guruhi bo'yicha ro'yxat name tartibida - sort indeksdan o'qiladi
+        indexes = [Index(fields=['primary_body_part', 'name'])]
         verbose_name = _("Exercise")
         verbose_name_plural = _("Exercises")
 
-    def _convert_video_in_background(self, input_path, final_name):
-        try:
-            base, _ = os.path.splitext(input_path)
-            tmp_output = base + "_conv.mp4"
+    # Bazadan o'qilgan video nomi - yangi video yuklanganini aniqlash uchun
+    _loaded_video = None
 
-            cmd = [
-                "ffmpeg", "-y", "-i", input_path,
-                "-vcodec", "libx264", "-acodec", "aac",
-                tmp_output
-            ]
-            subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-
-            if os.path.exists(tmp_output):
-                with open(tmp_output, "rb") as f:
-                    storage_name = f"exercises/videos/{final_name}"
-
-                    default_storage.save(storage_name, File(f))
-
-                if os.path.exists(input_path):
-                    try:
-                        os.remove(input_path)
-                    except Exception:
-                        pass
-                try:
-                    os.remove(tmp_output)
-                except Exception:
-                    pass
-
-                from django.apps import apps
-                ExerciseModel = apps.get_model(self._meta.app_label, self.__class__.__name__)
-
-                ExerciseModel.objects.filter(pk=self.pk).update(video=storage_name)
-
-        except Exception as e:
-
-            print("Video convert error:", e)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_video = instance.__dict__.get('video')
+        return instance
 
     def save(self, *args, **kwargs):
-
-        try:
-            if self.thumbnail and hasattr(self.thumbnail, 'file.txt') and isinstance(self.thumbnail.file,
-                                                                                     InMemoryUploadedFile):
-                img = Image.open(self.thumbnail)
-                if img.mode != "RGB":
-                    img = img.convert("RGB")
-
-                buffer = io.BytesIO()
-                img.save(buffer, format="JPEG", quality=85)
-                buffer.seek(0)
-
-                new_name = os.path.splitext(self.thumbnail.name)[0] + ".jpg"
-                self.thumbnail = InMemoryUploadedFile(
-                    buffer,
-                    field_name='thumbnail',
-                    name=new_name,
-                    content_type='image/jpeg',
-                    size=buffer.getbuffer().nbytes,
-                    charset=None
-                )
-        except Exception as e:
-            print("Image convert error:", e)
-
+        # Thumbnail WebP/JPEG derivative lari signal orqali run_image_worker da yaratiladi
         super().save(*args, **kwargs)
 
-        try:
-            if self.video and not self.video.name.lower().endswith(".mp4"):
-                input_path = self.video.path
-
-                final_basename = f"exercise_{self.pk}.mp4"
-
-                t = threading.Thread(target=self._convert_video_in_background, args=(input_path, final_basename))
-                t.daemon = True
-                t.start()
-        except Exception as e:
-            print("Start video convert error:", e)
+        # Konvertatsiya run_transcode_worker da - so'rov va web jarayoni kutmaydi
+        if self.video and self.video.name != self._loaded_video:
+            self.transcode_jobs.filter(status='pending').delete()
+            self.transcode_jobs.create(source=self.video.name)
+        self._loaded_video = self.video.name
 
     def __str__(self):
         return self.name
 
+    @cached_property
+    def playback(self):
+        """
+        Shablon uchun: {'hls': master playlist, 'mp4': HLS ni qo'llamaydigan brauzer uchun 480p (yoki eng yaqin)
+        MP4, 'poster': poster} - VideoRendition lar yoki None. Renditionlar hali tayyor bo'lmasa bo'sh.
+        """
+        renditions = list(self.renditions.all())
+        by_kind = {rendition.kind: rendition for rendition in renditions if rendition.kind != 'mp4'}
+        mp4 = sorted((r for r in renditions if r.kind == 'mp4'), key=lambda r: (abs(r.height - 480), r.height))
+        return {
+            'hls': by_kind.get('master'),
+            'mp4': mp4[0] if mp4 else None,
+            'poster': by_kind.get('poster'),
+        }
+
 
 class ExerciseInstruction(Model):
     exercise = ForeignKey('apps.Exercise', CASCADE, related_name='instructions', verbose_name=_("Exercise"))
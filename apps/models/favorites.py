@@ -1,4 +1,4 @@
-from django.db.models import CASCADE, SET_NULL, CharField, ForeignKey, TextField
+from django.db.models import CASCADE, SET_NULL, CharField, ForeignKey, Index, TextField
 from django.utils.translation import gettext_lazy as _
 
 from apps.models.base import CreatedBaseModel
@@ -19,6 +19,8 @@ class FavoriteCollection(CreatedBaseModel):
 
     @property
     def exercise_count(self):
+        if hasattr(self, 'favorites_count'):
+            return self.favorites_count
         return self.favorites.count()
 
 
@@ -30,6 +32,8 @@ class Favorite(CreatedBaseModel):
     class Meta:
         ordering = ['-created_at']
         unique_together = ('user', 'exercise')
+        # Kolleksiya bo'yicha sevimlilar va favorite_ids: user, collection dan keyin created_at tartibi
+        indexes = [Index(fields=['user', 'collection', '-created_at'])]
         verbose_name = _("Favorite")
         verbose_name_plural = _("Favorites")
 
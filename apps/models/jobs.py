@@ -0,0 +1,29 @@
+from django.db.models import CharField, DateTimeField, FloatField, IntegerField, Model, TextChoices, TextField
+from django.utils.translation import gettext_lazy as _
+
+
+class JobRun(Model):
+    """run_scheduler bajargan har bir job: davomiyligi va ta'sir qilgan qatorlar soni."""
+
+    class StatusChoices(TextChoices):
+        RUNNING = 'running', _('Running')
+        SUCCESS = 'success', _('Success')
+        FAILED = 'failed', _('Failed')
+
+    name = CharField(max_length=100)
+    scheduled_for = DateTimeField()
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.RUNNING)
+    rows_affected = IntegerField(default=0)
+    duration_ms = FloatField(null=True, blank=True)
+    error = TextField(blank=True)
+    started_at = DateTimeField(auto_now_add=True)
+    finished_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Job Run')
+        verbose_name_plural = _('Job Runs')
+        ordering = ['-started_at']
+        unique_together = ('name', 'scheduled_for')
+
+    def __str__(self):
+        return f"{self.name} {self.scheduled_for:%Y-%m-%d %H:%M} ({self.status})"
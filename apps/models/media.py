@@ -0,0 +1,137 @@
+from django.core.files.storage import default_storage
+from django.db.models import (
+    CASCADE,
+    FloatField,
+    ForeignKey,
+    Index,
+    Model,
+    PositiveIntegerField,
+    PositiveSmallIntegerField,
+    TextChoices,
+)
+from django.db.models.fields import CharField, DateTimeField, TextField
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class TranscodeJob(Model):
+    """Exercise videosini faststart MP4 ga o'girish - run_transcode_worker tomonidan bajariladi."""
+
+    class StatusChoices(TextChoices):
+        PENDING = 'pending', _('Pending')
+        PROCESSING = 'processing', _('Processing')
+        DONE = 'done', _('Done')
+        FAILED = 'failed', _('Failed')
+
+    exercise = ForeignKey('apps.Exercise', CASCADE, related_name='transcode_jobs')
+    source = CharField(max_length=255, help_text="Storage dagi asl fayl nomi")
+    output = CharField(max_length=255, blank=True)
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    progress = FloatField(default=0, help_text="Foiz, 0-100")
+    attempts = PositiveSmallIntegerField(default=0)
+    last_error = TextField(blank=True)
+
+    available_at = DateTimeField(default=timezone.now)
+    locked_at = DateTimeField(null=True, blank=True, help_text="Worker har progress yozuvida yangilaydi")
+    created_at = DateTimeField(auto_now_add=True)
+    started_at = DateTimeField(null=True, blank=True)
+    finished_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Transcode Job')
+        verbose_name_plural = _('Transcode Jobs')
+        ordering = ['-created_at']
+        indexes = [Index(fields=['status', 'available_at'])]
+
+    def __str__(self):
+        return f"{self.exercise_id}: {self.source} ({self.status} {self.progress:.0f}%)"
+
+
+class VideoRendition(Model):
+    """TranscodeJob natijasi: har bir sifat uchun faststart MP4 va HLS playlist, umumiy master playlist va poster."""
+
+    class KindChoices(TextChoices):
+        MP4 = 'mp4', 'MP4'
+        HLS = 'hls', 'HLS'
+        MASTER = 'master', _('HLS master playlist')
+        POSTER = 'poster', _('Poster')
+
+    exercise = ForeignKey('apps.Exercise', CASCADE, related_name='renditions')
+    kind = CharField(max_length=10, choices=KindChoices.choices)
+    height = PositiveSmallIntegerField(null=True, blank=True)
+    width = PositiveSmallIntegerField(null=True, blank=True)
+    bitrate = PositiveIntegerField(null=True, blank=True, help_text="bit/s")
+    file = CharField(max_length=255, help_text="Storage dagi fayl nomi")
+    size = PositiveIntegerField(default=0, help_text="Bayt (HLS uchun segmentlar bilan)")
+    created_at = DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Video Rendition')
+        verbose_name_plural = _('Video Renditions')
+        ordering = ['kind', 'height']
+        unique_together = [('exercise', 'kind', 'height')]
+
+    def __str__(self):
+        return f"{self.exercise_id}: {self.kind} {self.height or ''}".strip()
+
+    @property
+    def url(self):
+        return default_storage.url(self.file)
+
+
+class ImageDerivativeJob(Model):
+    """Yuklangan rasm uchun derivative lar yaratish - run_image_worker tomonidan bajariladi."""
+
+    class StatusChoices(TextChoices):
+        PENDING = 'pending', _('Pending')
+        PROCESSING = 'processing', _('Processing')
+        DONE = 'done', _('Done')
+        FAILED = 'failed', _('Failed')
+
+    source = CharField(max_length=255, help_text="Storage dagi asl rasm nomi")
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    attempts = PositiveSmallIntegerField(default=0)
+    last_error = TextField(blank=True)
+
+    available_at = DateTimeField(default=timezone.now)
+    locked_at = DateTimeField(null=True, blank=True)
+    created_at = DateTimeField(auto_now_add=True)
+    finished_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Image Derivative Job')
+        verbose_name_plural = _('Image Derivative Jobs')
+        ordering = ['-created_at']
+        indexes = [Index(fields=['status', 'available_at'])]
+
+    def __str__(self):
+        return f"{self.source} ({self.status})"
+
+
+class ImageDerivative(Model):
+    """Asl rasmning bitta kenglik va formatdagi nusxasi. Fayl nomida kontent hash - URL o'zgarmas keshlanadi."""
+
+    class FormatChoices(TextChoices):
+        WEBP = 'webp', 'WebP'
+        JPEG = 'jpeg', 'JPEG'
+
+    source = CharField(max_length=255)
+    format = CharField(max_length=10, choices=FormatChoices.choices)
+    width = PositiveSmallIntegerField()
+    height = PositiveSmallIntegerField()
+    file = CharField(max_length=255)
+    size = PositiveIntegerField(default=0)
+    created_at = DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name = _('Image Derivative')
+        verbose_name_plural = _('Image Derivatives')
+        ordering = ['source', 'format', 'width']
+        unique_together = [('source', 'format', 'width')]
+
+    def __str__(self):
+        return f"{self.source} {self.width}w {self.format}"
+
+    @property
+    def url(self):
+        return default_storage.url(self.file)
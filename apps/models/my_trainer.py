@@ -1,6 +1,6 @@
-from django.db.models import CASCADE, FloatField, ForeignKey, Index, Model
+from django.db.models import CASCADE, FloatField, ForeignKey, Index, Model, OneToOneField
 from django.db.models.enums import TextChoices
-from django.db.models.fields import CharField, DateTimeField, DecimalField, IntegerField
+from django.db.models.fields import CharField, DateField, DateTimeField, DecimalField, IntegerField
 
 
 class WorkoutSession(Model):
@@ -37,6 +37,12 @@ class WorkoutSession(Model):
     def __str__(self):
         return f"{self.user.name} - {self.workout.title} ({self.status})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+
     @property
     def duration_minutes(self):
         return round(self.duration_seconds / 60, 1)
@@ -71,3 +77,17 @@ class ExerciseLog(Model):
     def __str__(self):
         return f"{self.session.user.name} - {self.exercise.name}"
 
+
+class UserStreak(Model):
+    user = OneToOneField('apps.UserProfile', CASCADE, related_name='streak')
+    current_streak = IntegerField(default=0)
+    longest_streak = IntegerField(default=0)
+    last_active_date = DateField(null=True, blank=True, help_text="Asia/Tashkent bo'yicha oxirgi faol kun")
+    updated_at = DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = 'User Streak'
+        verbose_name_plural = 'User Streaks'
+
+    def __str__(self):
+        return f"{self.user.name} - {self.current_streak}"
@@ -5,7 +5,9 @@ from django.db.models import (
     CASCADE,
     SET_NULL,
     ForeignKey,
+    Index,
     JSONField,
+    Q,
     Model,
     OneToOneField,
     TextChoices,
@@ -13,6 +15,7 @@ from django.db.models import (
 from django.db.models.fields import (
     BooleanField,
     CharField,
+    DateField,
     DateTimeField,
     DecimalField,
     IntegerField, )
@@ -63,6 +66,9 @@ class Subscription(Model):
     start_date = DateTimeField(_("Start Date"), auto_now_add=True)
     end_date = DateTimeField(_("End Date"))
     is_active = BooleanField(_("Is Active"), default=True)
+    auto_renew = BooleanField(_("Auto Renew"), default=False)
+    renewal_attempts = IntegerField(_("Renewal Attempts"), default=0)
+    next_renewal_at = DateTimeField(_("Next Renewal Attempt"), blank=True, null=True)
 
     def save(self, *args, **kwargs):
         if not self.end_date and self.plan:
@@ -89,11 +95,40 @@ class Subscription(Model):
         verbose_name = _("Subscription")
         verbose_name_plural = _("Subscriptions")
         ordering = ['-start_date']
+        # Partial indekslar: joblar faqat faol obunalarni end_date bo'yicha qidiradi,
+        # muddati o'tgan (ko'pchilik) qatorlar indeksga kirmaydi
+        indexes = [
+            Index(fields=['end_date'], condition=Q(is_active=True), name='subscription_active_end_idx'),
+            Index(
+                fields=['end_date', 'next_renewal_at'],
+                condition=Q(is_active=True, auto_renew=True),
+                name='subscription_renewal_idx',
+            ),
+        ]
 
     def __str__(self):
         return f"{self.user.name} - Premium"
 
 
+class PaymentMethod(CreatedBaseModel):
+    """Click card_token - avtomatik yangilash uchun saqlangan karta."""
+    user = OneToOneField('apps.UserProfile', CASCADE, related_name='payment_method', verbose_name=_("User"))
+    card_token = CharField(_("Card Token"), max_length=255)
+    card_last_four = CharField(_("Card Last Four"), max_length=4, blank=True)
+    expires_at = DateField(_("Card Expiry"), blank=True, null=True)
+    is_active = BooleanField(_("Is Active"), default=True)
+
+    class Meta:
+        verbose_name = _("Payment Method")
+        verbose_name_plural = _("Payment Methods")
+
+    def __str__(self):
+        return f"{self.user} - ****{self.card_last_four}"
+
+    def is_expired(self, today=None):
+        return bool(self.expires_at) and self.expires_at < (today or timezone.localdate())
+
+
 class Payment(CreatedBaseModel):
     class PaymentStatus(TextChoices):
         PENDING = 'pending', 'Kutilmoqda'
@@ -104,8 +139,11 @@ class Payment(CreatedBaseModel):
     user = ForeignKey("apps.UserProfile", CASCADE, related_name='payments', verbose_name=_("User"))
     subscription = ForeignKey('apps.Subscription', SET_NULL, null=True, related_name='payments',
                               verbose_name=_("Subscription"))
+    plan = ForeignKey('apps.SubscriptionPlan', SET_NULL, null=True, blank=True, related_name='payments',
+                      verbose_name=_("Plan"))
+    amount = DecimalField(_("Amount"), max_digits=10, decimal_places=2, default=0)
     status = CharField(_("Status"), max_length=20, choices=PaymentStatus.choices, default=PaymentStatus.PENDING)
-    click_trans_id = CharField(_("Click Transaction ID"), max_length=100, blank=True, null=True)
+    click_trans_id = CharField(_("Click Transaction ID"), max_length=100, unique=True, blank=True, null=True)
     transaction_id = CharField(_("Merchant Transaction ID"), max_length=100, unique=True, blank=True, null=True)
     is_auto_payment = BooleanField(_("Is Auto Payment"), default=False)
     auto_payment_attempt = IntegerField(_("Automatic payment attempt"), default=0)
@@ -115,6 +153,7 @@ class Payment(CreatedBaseModel):
     class Meta:
         verbose_name = _("Payment")
         verbose_name_plural = _("Payments")
+        indexes = [Index(fields=['user', 'status', '-created_at'])]
 
     def mark_as_completed(self):
         self.status = self.PaymentStatus.COMPLETED
@@ -0,0 +1,141 @@
+from django.db.models import (
+    BigIntegerField,
+    Index,
+    JSONField,
+    Model,
+    PositiveIntegerField,
+    PositiveSmallIntegerField,
+    TextChoices,
+)
+from django.db.models.fields import CharField, DateTimeField, TextField
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class TelegramUpdate(Model):
+    """Webhook orqali kelgan update - run_telegram_worker tomonidan qayta ishlanadi."""
+
+    class StatusChoices(TextChoices):
+        PENDING = 'pending', _('Pending')
+        PROCESSING = 'processing', _('Processing')
+        DONE = 'done', _('Done')
+        FAILED = 'failed', _('Failed')
+
+    update_id = BigIntegerField(unique=True)
+    payload = JSONField()
+    # apps.bot.queue.chat_key - bitta chat update lari update_id tartibida, bittadan qayta ishlanadi
+    chat_key = CharField(max_length=64, null=True, blank=True)
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    attempts = PositiveSmallIntegerField(default=0)
+    last_error = TextField(blank=True)
+
+    available_at = DateTimeField(default=timezone.now, help_text="Shu vaqtdan keyin qayta urinish mumkin")
+    locked_at = DateTimeField(null=True, blank=True)
+    received_at = DateTimeField(auto_now_add=True)
+    processed_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Telegram Update')
+        verbose_name_plural = _('Telegram Updates')
+        ordering = ['update_id']
+        indexes = [Index(fields=['status', 'available_at']), Index(fields=['chat_key', 'update_id'])]
+
+    def __str__(self):
+        return f"{self.update_id} ({self.status})"
+
+
+class Broadcast(Model):
+    """
+    Ko'p foydalanuvchiga xabar yuborish. Qabul qiluvchilar UserProfile.id tartibida o'tiladi,
+    last_profile_id - checkpoint: to'xtatilgan broadcast shu joydan davom etadi.
+    """
+
+    class StatusChoices(TextChoices):
+        DRAFT = 'draft', _('Draft')
+        RUNNING = 'running', _('Running')
+        COMPLETED = 'completed', _('Completed')
+        FAILED = 'failed', _('Failed')
+
+    class AudienceChoices(TextChoices):
+        ALL = 'all', _('All users')
+        PREMIUM = 'premium', _('Premium')
+        FREE = 'free', _('Free')
+
+    text = TextField()
+    parse_mode = CharField(max_length=20, default='HTML', blank=True)
+    audience = CharField(max_length=20, choices=AudienceChoices.choices, default=AudienceChoices.ALL)
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.DRAFT)
+
+    last_profile_id = BigIntegerField(default=0)
+    sent_count = PositiveIntegerField(default=0)
+    blocked_count = PositiveIntegerField(default=0)
+    failed_count = PositiveIntegerField(default=0)
+    retried_count = PositiveIntegerField(default=0)
+    errors = JSONField(default=dict, blank=True, help_text="Xato tavsifi -> soni")
+
+    created_at = DateTimeField(auto_now_add=True)
+    started_at = DateTimeField(null=True, blank=True)
+    finished_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Broadcast')
+        verbose_name_plural = _('Broadcasts')
+        ordering = ['-created_at']
+
+    def __str__(self):
+        return f"#{self.pk} {self.text[:40]} ({self.status})"
+
+    @property
+    def processed_count(self):
+        return self.sent_count + self.blocked_count + self.failed_count
+
+    def report(self):
+        duration = None
+        if self.started_at and self.finished_at:
+            duration = (self.finished_at - self.started_at).total_seconds()
+        return {
+            'id': self.pk,
+            'status': self.status,
+            'sent': self.sent_count,
+            'blocked': self.blocked_count,
+            'failed': self.failed_count,
+            'retried': self.retried_count,
+            'processed': self.processed_count,
+            'duration_seconds': round(duration, 1) if duration is not None else None,
+            'rate_per_second': round(self.processed_count / duration, 1) if duration else None,
+            'errors': self.errors,
+        }
+
+
+class OutboxMessage(Model):
+    """
+    Yuborilishi kerak bo'lgan bot xabari. View tranzaksiyasi ichida yoziladi, shuning uchun
+    drain_outbox uni faqat commit dan keyin ko'radi; rollback bo'lsa xabar ham yo'qoladi.
+    """
+
+    class StatusChoices(TextChoices):
+        PENDING = 'pending', _('Pending')
+        PROCESSING = 'processing', _('Processing')
+        SENT = 'sent', _('Sent')
+        FAILED = 'failed', _('Failed')
+
+    chat_id = BigIntegerField()
+    text = TextField()
+    parse_mode = CharField(max_length=20, default='HTML', blank=True)
+    status = CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    attempts = PositiveSmallIntegerField(default=0)
+    last_error = TextField(blank=True)
+
+    available_at = DateTimeField(default=timezone.now)
+    locked_at = DateTimeField(null=True, blank=True)
+    created_at = DateTimeField(auto_now_add=True)
+    sent_at = DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Outbox Message')
+        verbose_name_plural = _('Outbox Messages')
+        ordering = ['id']
+        indexes = [Index(fields=['status', 'available_at'])]
+
+    def __str__(self):
+        return f"{self.chat_id}: {self.text[:40]} ({self.status})"
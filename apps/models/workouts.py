@@ -8,6 +8,7 @@ from django.db.models import (
     FloatField,
     ForeignKey,
     ImageField,
+    Index,
     IntegerField,
     Model,
     Sum,
@@ -32,6 +33,8 @@ class Program(CreatedBaseModel):
 
     @property
     def exercises_count(self):
+        if hasattr(self, 'workouts_count'):
+            return self.workouts_count
         return self.editions.annotate(ex_count=Count('workouts')) \
             .aggregate(total=Sum('ex_count'))['total'] or 0
 
@@ -97,5 +100,8 @@ class WorkoutProgress(Model):
     exercises_completed = IntegerField(default=0)
     completed_at = DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [Index(fields=['user', '-completed_at'])]
+
     def __str__(self):
         return f"{self.user} - {self.workout} progress"
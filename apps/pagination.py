@@ -0,0 +1,53 @@
+import base64
+import binascii
+import json
+from bisect import bisect_right
+
+from rest_framework.exceptions import ValidationError
+
+
+class KeysetPagination:
+    """
+    Tartiblangan ro'yxat ustida (name, id) kaliti bo'yicha cursor pagination.
+    Cursor - oxirgi qaytarilgan element kaliti, base64 JSON ko'rinishida.
+    """
+    page_size = 20
+    max_page_size = 100
+    cursor_query_param = 'cursor'
+    page_size_query_param = 'limit'
+
+    def __init__(self, key):
+        self.key = key
+
+    def encode_cursor(self, key):
+        return base64.urlsafe_b64encode(json.dumps(list(key), ensure_ascii=False).encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            name, pk = json.loads(base64.urlsafe_b64decode(padded.encode()).decode())
+            return str(name), int(pk)
+        except (ValueError, TypeError, binascii.Error, UnicodeDecodeError):
+            raise ValidationError({'cursor': "Cursor noto'g'ri"})
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            raise ValidationError({self.page_size_query_param: "Butun son bo'lishi kerak"})
+        return min(max(size, 1), self.max_page_size)
+
+    def paginate(self, items, request):
+        """Returns: (page_items, next_cursor)"""
+        size = self.get_page_size(request)
+        cursor = request.query_params.get(self.cursor_query_param)
+
+        start = 0
+        if cursor:
+            after = self.decode_cursor(cursor)
+            start = bisect_right(items, after, key=self.key)
+
+        page = items[start:start + size]
+        has_next = start + size < len(items)
+        next_cursor = self.encode_cursor(self.key(page[-1])) if page and has_next else None
+        return page, next_cursor
@@ -0,0 +1,127 @@
+"""
+Tashqi broker siz crontab uslubidagi rejalashtiruvchi: `python manage.py run_scheduler`.
+Joblar apps/tasks.py da @scheduled("m h dom mon dow") bilan ro'yxatdan o'tadi va
+TIME_ZONE bo'yicha baholanadi. Har bir ishga tushish JobRun ga yoziladi.
+"""
+import logging
+import time
+from datetime import timedelta
+from datetime import timezone as dt_timezone
+
+from django.db import IntegrityError
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+JOBS = {}
+
+FIELD_RANGES = (
+    (0, 59),  # minute
+    (0, 23),  # hour
+    (1, 31),  # day of month
+    (1, 12),  # month
+    (0, 6),  # day of week (0 - yakshanba)
+)
+
+
+def parse_field(field, low, high):
+    """'*', '*/15', '1-5', '0,30', '8-18/2' -> ruxsat etilgan qiymatlar to'plami."""
+    values = set()
+    for part in field.split(','):
+        step = 1
+        if '/' in part:
+            part, step = part.split('/')
+            step = int(step)
+        if part == '*':
+            start, end = low, high
+        elif '-' in part:
+            start, end = (int(value) for value in part.split('-'))
+        else:
+            start = end = int(part)
+        if start < low or end > high or start > end:
+            raise ValueError(f"Cron qiymati chegaradan tashqarida: {field}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+class CronSchedule:
+    def __init__(self, expression):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron ifodasi 5 ta maydondan iborat bo'lishi kerak: {expression!r}")
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, self.weekdays = (
+            parse_field(field, low, high) for field, (low, high) in zip(fields, FIELD_RANGES)
+        )
+
+    def matches(self, moment):
+        return all((
+            moment.minute in self.minutes,
+            moment.hour in self.hours,
+            moment.day in self.days,
+            moment.month in self.months,
+            moment.isoweekday() % 7 in self.weekdays,
+        ))
+
+
+class Job:
+    def __init__(self, name, schedule, func):
+        self.name = name
+        self.schedule = CronSchedule(schedule)
+        self.func = func
+
+    def __repr__(self):
+        return f"<Job {self.name} '{self.schedule.expression}'>"
+
+
+def scheduled(schedule, name=None):
+    """Job funksiyasi ta'sir qilgan qatorlar sonini qaytaradi."""
+    def decorator(func):
+        job = Job(name or func.__name__, schedule, func)
+        JOBS[job.name] = job
+        return func
+    return decorator
+
+
+def due_jobs(moment):
+    return [job for job in JOBS.values() if job.schedule.matches(moment)]
+
+
+def minutes_after(last, now):
+    """
+    last dan keyingi daqiqadan now gacha (ikkalasi ham daqiqa boshi) har bir daqiqa, TIME_ZONE da.
+    UTC bo'yicha qadamlanadi - DST o'tishlarida daqiqa takrorlanmaydi va tushib qolmaydi.
+    """
+    moment = last.astimezone(dt_timezone.utc) + timedelta(minutes=1)
+    while moment <= now:
+        yield timezone.localtime(moment)
+        moment += timedelta(minutes=1)
+
+
+def run_job(job, scheduled_for=None):
+    """
+    Jobni bajaradi va JobRun yozadi. scheduled_for (daqiqa) bo'yicha unique -
+    bir nechta scheduler bir slotni ikki marta bajarmaydi.
+    Returns: JobRun yoki None (slot boshqa process tomonidan olingan)
+    """
+    from apps.models import JobRun
+
+    scheduled_for = (scheduled_for or timezone.now()).replace(second=0, microsecond=0)
+    try:
+        run = JobRun.objects.create(name=job.name, scheduled_for=scheduled_for)
+    except IntegrityError:
+        logger.info("%s %s slotida allaqachon bajarilgan", job.name, scheduled_for)
+        return None
+
+    start = time.perf_counter()
+    try:
+        run.rows_affected = job.func() or 0
+        run.status = JobRun.StatusChoices.SUCCESS
+    except Exception as exc:
+        logger.exception("Job %s xato bilan tugadi", job.name)
+        run.status = JobRun.StatusChoices.FAILED
+        run.error = repr(exc)[:2000]
+    run.duration_ms = (time.perf_counter() - start) * 1000
+    run.finished_at = timezone.now()
+    run.save(update_fields=['rows_affected', 'status', 'error', 'duration_ms', 'finished_at'])
+    return run
@@ -0,0 +1,34 @@
+from rest_framework import serializers
+
+from apps.models import Exercise
+
+
+class DynamicFieldsMixin:
+    """`fields` argumenti berilsa, faqat shu maydonlar qoldiriladi (?fields=id,name)."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class ExerciseSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    thumbnail = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Exercise
+        fields = (
+            'id', 'name', 'name_uz', 'primary_body_part', 'secondary_body_part',
+            'difficulty', 'calory', 'duration', 'thumbnail',
+        )
+
+    def get_thumbnail(self, obj):
+        return obj.thumbnail.url if obj.thumbnail else None
+
+
+class ExerciseSearchResultSerializer(ExerciseSerializer):
+    score = serializers.FloatField(read_only=True)
+
+    class Meta(ExerciseSerializer.Meta):
+        fields = ExerciseSerializer.Meta.fields + ('score',)
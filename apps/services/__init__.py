@@ -0,0 +1,3 @@
+from apps.services.streaks import compute_streak, get_current_streak, rebuild_streak, record_activity
+from apps.services.stats import chart_bars, get_user_stats, humanize_duration, humanize_number
+from apps.services.rollups import add_daily_activity, rebuild_daily_activity, record_progress, record_session
@@ -0,0 +1,118 @@
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from apps.models import CacheNamespace
+from apps.services.profiling import note_cache_lookup
+
+MAX_KEY_LENGTH = 200
+
+
+def _incr(key, delta=1):
+    try:
+        return cache.incr(key, delta)
+    except ValueError:
+        cache.add(key, 0, None)
+        return cache.incr(key, delta)
+
+
+def _as_tuple(namespace):
+    return (namespace,) if isinstance(namespace, str) else tuple(namespace)
+
+
+def _version_key(namespace):
+    return f'ns:{namespace}'
+
+
+def namespace_version(namespace) -> str:
+    """
+    Bir yoki bir nechta namespace versiyasi, masalan "3.1".
+    Namespace versiyasi oshirilganda unga bog'liq barcha kalitlar o'z-o'zidan eskiradi. Versiyalar bazada
+    (CacheNamespace), keshda esa CACHE_NAMESPACE_TTL sekund saqlanadi - shu vaqt ichida boshqa processlar ham
+    oshirilgan versiyani ko'radi, keshdan tushib qolgan versiya esa bazadan qayta o'qiladi.
+    """
+    namespaces = _as_tuple(namespace)
+    keys = {_version_key(ns): ns for ns in namespaces}
+    versions = {keys[key]: value for key, value in cache.get_many(list(keys)).items()}
+
+    missing = [ns for ns in namespaces if ns not in versions]
+    if missing:
+        stored = dict(CacheNamespace.objects.filter(name__in=missing).values_list('name', 'version'))
+        for ns in missing:
+            versions[ns] = stored.get(ns, 0)
+            # add: parallel bump dan keyingi yangiroq qiymat ustidan yozilmaydi
+            cache.add(_version_key(ns), versions[ns], settings.CACHE_NAMESPACE_TTL)
+    return '.'.join(str(versions[ns]) for ns in namespaces)
+
+
+def bump_namespace(namespace):
+    """Versiya bazada oshiriladi; keshdagi nusxa tranzaksiya commit bo'lgach o'chiriladi."""
+    updated = CacheNamespace.objects.filter(name=namespace).update(
+        version=F('version') + 1, updated_at=timezone.now(),
+    )
+    if not updated:
+        _, created = CacheNamespace.objects.get_or_create(name=namespace, defaults={'version': 1})
+        if not created:
+            CacheNamespace.objects.filter(name=namespace).update(
+                version=F('version') + 1, updated_at=timezone.now(),
+            )
+    transaction.on_commit(lambda: cache.delete(_version_key(namespace)))
+
+
+def make_key(namespace, *parts) -> str:
+    namespaces = _as_tuple(namespace)
+    key = f"{'+'.join(namespaces)}:v{namespace_version(namespaces)}:{':'.join(str(p) for p in parts)}"
+    if len(key) > MAX_KEY_LENGTH:
+        key = f"{'+'.join(namespaces)}:h:{hashlib.md5(key.encode()).hexdigest()}"
+    return key
+
+
+def record_lookup(name, hit):
+    note_cache_lookup(hit)
+    if getattr(settings, 'CACHE_STATS_ENABLED', True):
+        _incr(f'stats:{name}:{"hits" if hit else "misses"}')
+
+
+def lookup(namespace, parts, producer, timeout=DEFAULT_TIMEOUT, stat=None):
+    """
+    Keshdan o'qiydi, bo'lmasa producer() ni chaqirib saqlaydi.
+    Returns: (value, hit)
+    """
+    key = make_key(namespace, *parts)
+    value = cache.get(key)
+    hit = value is not None
+    if not hit:
+        value = producer()
+        cache.set(key, value, timeout)
+    record_lookup(stat or _as_tuple(namespace)[0], hit)
+    return value, hit
+
+
+def get_or_set(namespace, parts, producer, timeout=DEFAULT_TIMEOUT, stat=None):
+    return lookup(namespace, parts, producer, timeout, stat)[0]
+
+
+def cached_queryset(namespace, parts, queryset, timeout=DEFAULT_TIMEOUT):
+    """QuerySet natijasini (prefetch keshlari bilan birga) ro'yxat sifatida keshlaydi."""
+    return get_or_set(namespace, parts, lambda: list(queryset), timeout)
+
+
+def cached_fragment(namespace, parts, render, timeout=DEFAULT_TIMEOUT):
+    """Render qilingan HTML bo'lagini keshlaydi; render - satr qaytaruvchi funksiya."""
+    return get_or_set(namespace, parts, lambda: str(render()), timeout)
+
+
+def cache_stats(name):
+    counters = cache.get_many([f'stats:{name}:hits', f'stats:{name}:misses'])
+    hits, misses = counters.get(f'stats:{name}:hits', 0), counters.get(f'stats:{name}:misses', 0)
+    total = hits + misses
+    return {
+        'hits': hits,
+        'misses': misses,
+        'hit_ratio': round(hits / total, 3) if total else 0,
+    }
@@ -0,0 +1,83 @@
+import copy
+import threading
+from collections import defaultdict
+
+from apps.models import Exercise, Favorite
+from apps.services.cache import namespace_version
+
+_index = None
+_lock = threading.Lock()
+
+
+def sort_key(exercise):
+    """Katalog tartibi (name, id) - keyset pagination ham shu kalitga tayanadi."""
+    return exercise.name, exercise.id
+
+
+class CatalogIndex:
+    """
+    Process ichidagi mashqlar katalogi: MuscleGroup -> nom bo'yicha tartiblangan mashqlar.
+    secondary_body_part bo'yicha ham guruhga qo'shiladi.
+    """
+
+    def __init__(self, version, exercises):
+        self.version = version
+        self.by_id = {}
+        self.by_muscle = defaultdict(list)
+
+        for exercise in exercises:
+            self.by_id[exercise.id] = exercise
+            self.by_muscle[exercise.primary_body_part].append(exercise)
+            secondary = exercise.secondary_body_part
+            if secondary and secondary != exercise.primary_body_part:
+                self.by_muscle[secondary].append(exercise)
+
+        for exercises_list in self.by_muscle.values():
+            exercises_list.sort(key=sort_key)
+
+    def for_muscle(self, muscle):
+        return self.by_muscle.get(muscle.lower(), [])
+
+
+def build_catalog_index(version):
+    return CatalogIndex(version, Exercise.objects.order_by('name', 'id'))
+
+
+def get_catalog_index() -> CatalogIndex:
+    """
+    Katalog versiyasi ('catalog' namespace) o'zgarganda indeks qayta quriladi,
+    shuning uchun boshqa workerdagi o'zgarishlar ham ko'rinadi.
+    """
+    global _index
+    version = namespace_version('catalog')
+    index = _index
+    if index is not None and index.version == version:
+        return index
+
+    with _lock:
+        if _index is None or _index.version != version:
+            _index = build_catalog_index(version)
+        return _index
+
+
+def reset_catalog_index():
+    global _index
+    _index = None
+
+
+def exercises_for_muscle(muscle):
+    """Har bir so'rov o'z nusxasini oladi - is_favorited kabi atributlar umumiy indeksga yozilmaydi."""
+    return [copy.copy(exercise) for exercise in get_catalog_index().for_muscle(muscle)]
+
+
+def favorite_ids(request):
+    """Foydalanuvchining sevimli mashqlari id lari - so'rov davomida bir marta yuklanadi."""
+    if not hasattr(request, '_favorite_ids'):
+        profile = getattr(request.user, 'profile', None) if request.user.is_authenticated else None
+        if profile is None:
+            request._favorite_ids = frozenset()
+        else:
+            request._favorite_ids = frozenset(
+                Favorite.objects.filter(user=profile).order_by().values_list('exercise_id', flat=True)
+            )
+    return request._favorite_ids
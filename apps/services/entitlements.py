@@ -0,0 +1,108 @@
+"""
+Premium kirish huquqi Subscription dan aniqlanadi va obuna tugaguncha keshlanadi,
+shuning uchun UserProfile.is_premium flagiga tayanmaydi. Kesh to'lov yoki obuna
+o'zgarganda invalidate_entitlements() orqali tozalanadi.
+"""
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from apps.models import Program, UserProfile
+from apps.services.cache import record_lookup
+
+PREMIUM = 'premium'
+TRIAL = 'trial'
+EXPIRED = 'expired'
+
+# Muddatsiz holat (expired) uchun kesh muddati - to'lovda baribir tozalanadi
+EXPIRED_TIMEOUT = 60 * 60 * 24
+STATS_NAME = 'entitlement'
+
+
+class Entitlement:
+    def __init__(self, status, expires_at=None, trial_program_ids=()):
+        self.status = status
+        self.expires_at = expires_at
+        self.trial_program_ids = frozenset(trial_program_ids)
+
+    def __repr__(self):
+        return f"<Entitlement {self.status} {self.expires_at}>"
+
+    @property
+    def is_premium(self):
+        return self.status == PREMIUM and self.expires_at > timezone.now()
+
+    @property
+    def is_trial(self):
+        return self.status == TRIAL and self.expires_at > timezone.now()
+
+    def can_access(self, program_id, is_premium=True):
+        """Premium bo'lmagan edition hammaga ochiq; trialda faqat TRIAL_PROGRAMS_LIMIT ta dastur."""
+        if not is_premium or self.is_premium:
+            return True
+        return self.is_trial and program_id in self.trial_program_ids
+
+    def as_cache(self):
+        return self.status, self.expires_at, tuple(self.trial_program_ids)
+
+
+ANONYMOUS = Entitlement(EXPIRED)
+
+
+def _cache_key(user_id):
+    return f'entitlement:{user_id}'
+
+
+def resolve_entitlement(user_id) -> Entitlement:
+    """Profil va obuna - bitta JOIN so'rov."""
+    row = (
+        UserProfile.objects
+        .filter(user_id=user_id)
+        .values('created_at', 'subscription__is_active', 'subscription__end_date')
+        .first()
+    )
+    if row is None:
+        return ANONYMOUS
+
+    now = timezone.now()
+    end_date = row['subscription__end_date']
+    if row['subscription__is_active'] and end_date and end_date > now:
+        return Entitlement(PREMIUM, end_date)
+
+    trial_ends = row['created_at'] + timedelta(days=settings.TRIAL_DAYS)
+    if trial_ends > now:
+        program_ids = (
+            Program.objects
+            .filter(is_active=True)
+            .order_by('pk')
+            .values_list('pk', flat=True)[:settings.TRIAL_PROGRAMS_LIMIT]
+        )
+        return Entitlement(TRIAL, trial_ends, program_ids)
+    return Entitlement(EXPIRED)
+
+
+def get_entitlement(user) -> Entitlement:
+    """Keshdan o'qiladi; kesh muddati - obuna (yoki trial) tugash vaqti."""
+    if not user.is_authenticated:
+        return ANONYMOUS
+
+    key = _cache_key(user.pk)
+    cached = cache.get(key)
+    record_lookup(STATS_NAME, cached is not None)
+    if cached is not None:
+        return Entitlement(*cached)
+
+    entitlement = resolve_entitlement(user.pk)
+    if entitlement.expires_at:
+        timeout = max(int((entitlement.expires_at - timezone.now()).total_seconds()), 1)
+    else:
+        timeout = EXPIRED_TIMEOUT
+    cache.set(key, entitlement.as_cache(), timeout)
+    return entitlement
+
+
+def invalidate_entitlements(profile_ids):
+    user_ids = UserProfile.objects.filter(pk__in=profile_ids).values_list('user_id', flat=True)
+    cache.delete_many([_cache_key(user_id) for user_id in user_ids])
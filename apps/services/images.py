@@ -0,0 +1,182 @@
+"""
+Rasm derivative lari: Exercise.thumbnail, Program.image va UserProfile.avatar yuklanganda
+ImageDerivativeJob yaratiladi, run_image_worker esa IMAGE_DERIVATIVE_WIDTHS kengliklarda WebP va JPEG
+nusxalarni kontent hash li nomlar bilan saqlaydi. Shablon {% responsive_image %} tegi orqali srcset oladi.
+"""
+import hashlib
+import io
+import logging
+import os
+
+from PIL import Image, ImageOps
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from apps.bot.queue import MAX_ATTEMPTS, claim_rows, retry_delay
+from apps.models import ImageDerivative, ImageDerivativeJob
+from apps.services.cache import bump_namespace
+
+logger = logging.getLogger(__name__)
+
+# Derivative yaratiladigan rasm maydonlari: (model, maydon, rasm kiradigan fragment kesh/ETag namespace lari)
+IMAGE_FIELDS = (
+    ('apps.Exercise', 'thumbnail', ('catalog',)),
+    ('apps.Program', 'image', ('programs',)),
+    ('apps.UserProfile', 'avatar', ()),
+)
+DERIVED_DIR = 'derived'
+CACHE_TIMEOUT = 24 * 60 * 60
+# Derivative lari hali yo'q rasm: worker boshqa processda, uning cache.delete i web process locmem iga yetmaydi
+EMPTY_CACHE_TIMEOUT = 60
+
+
+def cache_key(source):
+    return f"img:{hashlib.md5(source.encode()).hexdigest()}"
+
+
+def image_namespaces(source):
+    """Rasmni ko'rsatadigan namespace lar - faqat shu rasm hozir ishlatilayotgan modellar bo'yicha."""
+    namespaces = []
+    for label, field, field_namespaces in IMAGE_FIELDS:
+        if field_namespaces and apps.get_model(label).objects.filter(**{field: source}).exists():
+            namespaces += field_namespaces
+    return list(dict.fromkeys(namespaces))
+
+
+def invalidate_image(source):
+    cache.delete(cache_key(source))
+    for namespace in image_namespaces(source):
+        bump_namespace(namespace)
+
+
+def enqueue_images(sources):
+    sources = [source for source in dict.fromkeys(sources) if source]
+    ImageDerivativeJob.objects.bulk_create([ImageDerivativeJob(source=source) for source in sources])
+    return len(sources)
+
+
+def claim_jobs(limit, now=None):
+    return claim_rows(ImageDerivativeJob, limit, now, order_by='available_at')
+
+
+def target_widths(width):
+    """Asl rasmdan katta kenglik yaratilmaydi; eng katta kenglikdan kichik rasm o'z kengligini ham oladi."""
+    largest = min(width, max(settings.IMAGE_DERIVATIVE_WIDTHS))
+    return [w for w in settings.IMAGE_DERIVATIVE_WIDTHS if w < largest] + [largest]
+
+
+def encode(image, fmt):
+    buffer = io.BytesIO()
+    if fmt == ImageDerivative.FormatChoices.WEBP:
+        image.save(buffer, 'WEBP', quality=settings.IMAGE_WEBP_QUALITY, method=4)
+    else:
+        if image.mode != 'RGB':
+            # JPEG da shaffoflik yo'q - oq fonga qo'yiladi
+            background = Image.new('RGB', image.size, 'white')
+            background.paste(image, mask=image.getchannel('A') if 'A' in image.getbands() else None)
+            image = background
+        image.save(buffer, 'JPEG', quality=settings.IMAGE_JPEG_QUALITY, optimize=True, progressive=True)
+    return buffer.getvalue()
+
+
+def derived_name(source, width, fmt, content):
+    stem = os.path.splitext(source)[0]
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    extension = 'jpg' if fmt == ImageDerivative.FormatChoices.JPEG else fmt
+    return f"{DERIVED_DIR}/{stem}-{width}w.{digest}.{extension}"
+
+
+def generate_derivatives(source):
+    """Returns: saqlangan ImageDerivative lar. Bir xil kontentli fayl qayta yuklanmaydi."""
+    with default_storage.open(source, 'rb') as f:
+        original = Image.open(f)
+        original.load()
+    original = ImageOps.exif_transpose(original)
+    if original.mode not in ('RGB', 'RGBA'):
+        original = original.convert('RGBA' if 'transparency' in original.info or 'A' in original.getbands() else 'RGB')
+
+    derivatives = []
+    for width in target_widths(original.width):
+        height = max(1, round(original.height * width / original.width))
+        resized = original if width == original.width else original.resize((width, height), Image.LANCZOS)
+        for fmt in ImageDerivative.FormatChoices.values:
+            content = encode(resized, fmt)
+            name = derived_name(source, width, fmt, content)
+            if not default_storage.exists(name):
+                name = default_storage.save(name, ContentFile(content))
+            derivatives.append(ImageDerivative(
+                source=source, format=fmt, width=width, height=height, file=name, size=len(content),
+            ))
+
+    with transaction.atomic():
+        ImageDerivative.objects.filter(source=source).delete()
+        ImageDerivative.objects.bulk_create(derivatives)
+        transaction.on_commit(lambda: invalidate_image(source))
+    return derivatives
+
+
+def process_job(job) -> bool:
+    try:
+        generate_derivatives(job.source)
+    except FileNotFoundError as exc:
+        # Asl rasm o'chirilgan - qayta urinish foydasiz
+        job.attempts = MAX_ATTEMPTS
+        mark_failed(job, exc)
+        return False
+    except Exception as exc:
+        mark_failed(job, exc)
+        return False
+
+    ImageDerivativeJob.objects.filter(pk=job.pk).update(
+        status=ImageDerivativeJob.StatusChoices.DONE,
+        locked_at=None,
+        last_error='',
+        finished_at=timezone.now(),
+    )
+    return True
+
+
+def mark_failed(job, exc):
+    now = timezone.now()
+    if job.attempts >= MAX_ATTEMPTS:
+        status, available_at, finished_at = ImageDerivativeJob.StatusChoices.FAILED, now, now
+        logger.error("Rasm %s %d urinishdan keyin failed: %s", job.source, job.attempts, exc)
+    else:
+        status, finished_at = ImageDerivativeJob.StatusChoices.PENDING, None
+        available_at = now + retry_delay(job.attempts)
+        logger.warning("Rasm %s xato (urinish %d): %s", job.source, job.attempts, exc)
+
+    ImageDerivativeJob.objects.filter(pk=job.pk).update(
+        status=status,
+        available_at=available_at,
+        locked_at=None,
+        finished_at=finished_at,
+        last_error=repr(exc)[:2000],
+    )
+
+
+def derivative_sets(sources):
+    """
+    Returns: {source: {'webp': [(kenglik, url), ...], 'jpeg': [...]}} - avval keshdan, qolganlari bitta so'rov bilan.
+    Derivative lari hali yo'q rasmlar ham (bo'sh lug'at bilan) EMPTY_CACHE_TIMEOUT ga keshlanadi.
+    """
+    sources = [source for source in dict.fromkeys(sources) if source]
+    keys = {cache_key(source): source for source in sources}
+    cached = cache.get_many(list(keys))
+    result = {keys[key]: value for key, value in cached.items()}
+
+    missing = [source for source in sources if source not in result]
+    if missing:
+        found = {source: {} for source in missing}
+        rows = ImageDerivative.objects.filter(source__in=missing).order_by('width')
+        for source, fmt, width, name in rows.values_list('source', 'format', 'width', 'file'):
+            found[source].setdefault(fmt, []).append((width, default_storage.url(name)))
+        cache.set_many({cache_key(source): value for source, value in found.items() if value}, CACHE_TIMEOUT)
+        cache.set_many({cache_key(source): value for source, value in found.items() if not value}, EMPTY_CACHE_TIMEOUT)
+        result.update(found)
+    return result
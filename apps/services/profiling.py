@@ -0,0 +1,188 @@
+import logging
+import threading
+import time
+from collections import defaultdict
+from contextvars import ContextVar
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import DatabaseError
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+_current = ContextVar('request_profile', default=None)
+_buffer = []
+_buffer_lock = threading.Lock()
+_last_flush = time.monotonic()
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class RequestProfile:
+    """Bitta so'rov davomidagi SQL, shablon va kesh o'lchovlari."""
+
+    def __init__(self):
+        self.sql_count = 0
+        self.sql_ms = 0.0
+        self.template_ms = 0.0
+        self.template_depth = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        """connection.execute_wrapper sifatida ishlatiladi."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_count += 1
+            self.sql_ms += (time.perf_counter() - start) * 1000
+
+
+def start_profile():
+    profile = RequestProfile()
+    return profile, _current.set(profile)
+
+
+def stop_profile(token):
+    _current.reset(token)
+
+
+def note_cache_lookup(hit):
+    """apps.services.cache.record_lookup dan chaqiriladi."""
+    profile = _current.get()
+    if profile is not None:
+        if hit:
+            profile.cache_hits += 1
+        else:
+            profile.cache_misses += 1
+
+
+def install_template_timer():
+    """
+    Django shablon backendining render() metodini o'lchaydi - TemplateResponse ham, render() shortcut ham.
+    Ichma-ich render (render_to_string shablon tegi ichida) ikki marta hisoblanmaydi.
+    """
+    from django.template.backends.django import Template
+
+    if getattr(Template.render, 'profiled', False):
+        return
+    original = Template.render
+
+    def render(self, context=None, request=None):
+        profile = _current.get()
+        if profile is None:
+            return original(self, context, request)
+
+        profile.template_depth += 1
+        start = time.perf_counter()
+        try:
+            return original(self, context, request)
+        finally:
+            profile.template_depth -= 1
+            if profile.template_depth == 0:
+                profile.template_ms += (time.perf_counter() - start) * 1000
+
+    render.profiled = True
+    Template.render = render
+
+
+def add_sample(sample):
+    """Namunalar buferda yig'iladi va bulk_create bilan yoziladi."""
+    global _last_flush
+    with _buffer_lock:
+        _buffer.append(sample)
+        due = time.monotonic() - _last_flush >= getattr(settings, 'PROFILING_FLUSH_SECONDS', 30)
+        if len(_buffer) < getattr(settings, 'PROFILING_BATCH_SIZE', 50) and not due:
+            return
+        samples = _buffer[:]
+        _buffer.clear()
+        _last_flush = time.monotonic()
+    _write(samples)
+
+
+def flush_samples():
+    global _last_flush
+    with _buffer_lock:
+        samples = _buffer[:]
+        _buffer.clear()
+        _last_flush = time.monotonic()
+    _write(samples)
+    return len(samples)
+
+
+def _write(samples):
+    from apps.models import RequestSample
+
+    if not samples:
+        return
+    try:
+        RequestSample.objects.bulk_create(samples)
+    except DatabaseError:
+        # Profiling hech qachon so'rovni buzmasligi kerak
+        logger.exception("RequestSample yozib bo'lmadi (%d ta namuna)", len(samples))
+
+
+def purge_samples(now=None):
+    """PROFILING_RETENTION_DAYS dan eski RequestSample larni o'chiradi. Returns: o'chirilganlar soni"""
+    from apps.models import RequestSample
+
+    now = now or timezone.now()
+    deleted, _ = RequestSample.objects.filter(
+        created_at__lt=now - timedelta(days=settings.PROFILING_RETENTION_DAYS),
+    ).delete()
+    return deleted
+
+
+def percentile(values, q):
+    """Tartiblangan ro'yxat uchun chiziqli interpolyatsiya bilan percentil."""
+    if not values:
+        return 0.0
+    position = (len(values) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(values) - 1)
+    return values[lower] + (values[upper] - values[lower]) * (position - lower)
+
+
+def endpoint_report(hours=24, url_name=None, order_by='p95'):
+    """
+    URL nomi bo'yicha agregatlangan percentillar (ms), eng sekinlari birinchi.
+    Returns: [{'url_name', 'requests', 'p50', 'p90', 'p95', 'p99', 'max', 'sql_count_avg', ...}]
+    """
+    from apps.models import RequestSample
+
+    samples = RequestSample.objects.filter(created_at__gte=timezone.now() - timedelta(hours=hours)).order_by()
+    if url_name:
+        samples = samples.filter(url_name=url_name)
+
+    groups = defaultdict(lambda: defaultdict(list))
+    rows = samples.values_list('url_name', 'duration_ms', 'sql_count', 'sql_ms', 'template_ms', 'cache_hits',
+                               'cache_misses')
+    for name, duration, sql_count, sql_ms, template_ms, hits, misses in rows.iterator(chunk_size=2000):
+        group = groups[name]
+        group['duration'].append(duration)
+        group['sql_count'].append(sql_count)
+        group['sql_ms'].append(sql_ms)
+        group['template_ms'].append(template_ms)
+        group['cache_hits'].append(hits)
+        group['cache_misses'].append(misses)
+
+    report = []
+    for name, group in groups.items():
+        durations = sorted(group['duration'])
+        hits, misses = sum(group['cache_hits']), sum(group['cache_misses'])
+        row = {'url_name': name, 'requests': len(durations)}
+        row.update({f'p{q}': round(percentile(durations, q), 2) for q in PERCENTILES})
+        row.update({
+            'max': round(durations[-1], 2),
+            'sql_count_avg': round(sum(group['sql_count']) / len(durations), 2),
+            'sql_count_p95': percentile(sorted(group['sql_count']), 95),
+            'sql_ms_p95': round(percentile(sorted(group['sql_ms']), 95), 2),
+            'template_ms_p95': round(percentile(sorted(group['template_ms']), 95), 2),
+            'cache_hit_ratio': round(hits / (hits + misses), 3) if hits + misses else None,
+        })
+        report.append(row)
+
+    report.sort(key=lambda row: -row[order_by])
+    return report
@@ -0,0 +1,252 @@
+"""
+Obunalarni avtomatik yangilash. Muddati yaqinlashgan auto_renew obunalar chunklab olinadi,
+har chunk uchun Payment qatorlari bitta bulk_create bilan yaratiladi, kartalar ClickAutoPayment
+orqali cheklangan parallellikda yechiladi va natijalar bulk_update bilan yoziladi.
+"""
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from apps.bot.outbox import enqueue_messages
+from apps.click_merchant import ClickAutoPayment
+from apps.models import Payment, Subscription
+from apps.services.entitlements import invalidate_entitlements
+
+logger = logging.getLogger(__name__)
+
+# Click: to'lov holati "o'tkazilgan" va merchant_trans_id bo'yicha to'lov topilmadi (yechilmagan)
+CLICK_PAYMENT_SUCCESSFUL = 2
+CLICK_PAYMENT_NOT_FOUND = -16
+
+
+def due_subscriptions(now, queryset=None):
+    """queryset - faqat shu obunalar orasidan (masalan benchmark ning sinov obunalari)."""
+    return (
+        (Subscription.objects if queryset is None else queryset)
+        .filter(
+            is_active=True,
+            auto_renew=True,
+            end_date__lte=now + timedelta(hours=settings.RENEWAL_LEAD_HOURS),
+            user__payment_method__is_active=True,
+        )
+        .filter(Q(next_renewal_at__isnull=True) | Q(next_renewal_at__lte=now))
+        .select_related('plan', 'user__payment_method')
+        .order_by('pk')
+    )
+
+
+def claim_chunk(now, after_id, chunk_size, queryset=None):
+    """
+    Chunkni qulflab oladi, Payment larni yaratadi va next_renewal_at ni suradi - jarayon
+    to'xtab qolsa ham shu obunalar RENEWAL_RETRY_HOURS o'tmaguncha qayta yechilmaydi.
+    Oldingi ishga tushishdan pending qolgan avto to'lovi bor obuna uchun yangi to'lov yaratilmaydi:
+    karta yechilgan-u natija yozilmay qolgan bo'lishi mumkin, avval uning holati tekshiriladi.
+    Returns: (obunalar, [(obuna, yangi payment), ...], [(obuna, pending payment), ...])
+    """
+    with transaction.atomic():
+        subscriptions = list(
+            due_subscriptions(now, queryset)
+            .filter(pk__gt=after_id)
+            .select_for_update(skip_locked=True, of=('self',))[:chunk_size]
+        )
+        unresolved = {}
+        for payment in Payment.objects.filter(
+            subscription__in=subscriptions, is_auto_payment=True, status=Payment.PaymentStatus.PENDING,
+        ).select_related('plan').order_by('-pk'):
+            unresolved[payment.subscription_id] = payment
+        chargeable = [
+            sub for sub in subscriptions
+            if sub.pk not in unresolved and not sub.user.payment_method.is_expired(timezone.localdate(now))
+        ]
+        payments = Payment.objects.bulk_create([
+            Payment(
+                user_id=sub.user_id,
+                subscription=sub,
+                plan=sub.plan,
+                amount=sub.plan.price,
+                is_auto_payment=True,
+                auto_payment_attempt=sub.renewal_attempts + 1,
+            )
+            for sub in chargeable
+        ])
+        Subscription.objects.filter(pk__in=[sub.pk for sub in subscriptions]).update(
+            next_renewal_at=now + timedelta(hours=settings.RENEWAL_RETRY_HOURS),
+        )
+    pending = [(sub, unresolved[sub.pk]) for sub in subscriptions if sub.pk in unresolved]
+    return subscriptions, list(zip(chargeable, payments)), pending
+
+
+def charge_status(charger, payment):
+    """
+    merchant_trans_id bo'yicha holat. Returns: (javob, muvaffaqiyatli) - None: holat noma'lum,
+    to'lov pending qoladi va keyingi ishga tushishda qayta tekshiriladi.
+    """
+    status = charger.payment_status(payment.pk, timezone.localdate(payment.created_at))
+    if status.get('error_code') == 0 and status.get('payment_status') == CLICK_PAYMENT_SUCCESSFUL:
+        return status, True
+    if status.get('error_code') == CLICK_PAYMENT_NOT_FOUND:
+        return status, False
+    return status, None
+
+
+def charge(charger, subscription, payment):
+    """Returns: (javob, muvaffaqiyatli). Javob kelmay qolsa holat merchant_trans_id bo'yicha tekshiriladi."""
+    response = charger.charge_card(subscription.user.payment_method, payment.amount, payment.pk)
+    if response.get('error_code') == 0:
+        return response, True
+    if 'error_code' not in response:
+        return charge_status(charger, payment)
+    return response, False
+
+
+def renewal_message(outcome, subscription, payment=None):
+    if outcome == 'renewed':
+        return (
+            f"✅ <b>To'lov muvaffaqiyatli!</b>\n\n"
+            f"💰 Summa: <b>{payment.amount:,.0f} UZS</b>\n"
+            f"📅 Obuna tugash sanasi: <b>{timezone.localtime(subscription.end_date):%d.%m.%Y}</b>\n\n"
+            "Rahmat! 🎉"
+        )
+    if outcome == 'failed':
+        return (
+            "⚠️ <b>To'lov amalga oshmadi!</b>\n\n"
+            f"🔄 Urinish: {subscription.renewal_attempts}/{settings.RENEWAL_MAX_ATTEMPTS}\n"
+            f"⏰ Keyingi urinish: {settings.RENEWAL_RETRY_HOURS} soatdan keyin\n\n"
+            "Kartangizda yetarli mablag' borligini tekshiring."
+        )
+    if outcome == 'card_expired':
+        return (
+            "⚠️ <b>Karta muddati tugagan!</b>\n\n"
+            f"💳 Karta: ****{subscription.user.payment_method.card_last_four}\n\n"
+            "Iltimos, yangi karta qo'shing: /start"
+        )
+    return (
+        "❌ <b>Avtomatik yangilash o'chirildi!</b>\n\n"
+        f"{settings.RENEWAL_MAX_ATTEMPTS} marta to'lov amalga oshmadi.\n"
+        "Obuna muddati tugagach premium funksiyalar yopiladi.\n\n"
+        "Qayta obuna bo'lish: /start"
+    )
+
+
+def apply_results(now, subscriptions, results):
+    """
+    results: [(obuna, payment, javob, muvaffaqiyatli), ...] - hammasi bitta tranzaksiyada yoziladi.
+    muvaffaqiyatli=None (holat noma'lum) bo'lsa to'lov pending, obuna esa o'zgarishsiz qoladi.
+    Karta yechilayotganda obuna qatorlari qulflanmagan: shu orada Click orqali to'lov (extend_subscription)
+    yoki auto_renew o'zgargan bo'lishi mumkin, shuning uchun qatorlar qayta o'qilib qulflanadi va
+    yangi qiymatlar shulardan hisoblanadi.
+    """
+    outcomes = Counter()
+    messages = []
+    renewed_profiles = []
+    charged = {sub.pk: (payment, response, success) for sub, payment, response, success in results}
+    payments = [payment for _, payment, _, success in results if success is not None]
+
+    with transaction.atomic():
+        fresh = list(
+            Subscription.objects
+            .select_for_update(of=('self',))
+            .filter(pk__in=[sub.pk for sub in subscriptions])
+            .select_related('plan', 'user__payment_method')
+            .order_by('pk')
+        )
+        for sub in fresh:
+            if sub.pk not in charged:
+                sub.auto_renew = False
+                outcomes['card_expired'] += 1
+                messages.append((sub, 'card_expired', None))
+                continue
+
+            payment, response, success = charged[sub.pk]
+            if success is None:
+                outcomes['unresolved'] += 1
+                continue
+            payment.metadata = response
+            payment.updated_at = now
+            if success:
+                payment.status = Payment.PaymentStatus.COMPLETED
+                payment.completed_at = now
+                start = sub.end_date if sub.is_active and sub.end_date > now else now
+                sub.end_date = payment.plan.get_expiry_date(start)
+                sub.renewal_attempts = 0
+                sub.next_renewal_at = None
+                outcome = 'renewed'
+                outcomes['amount'] += payment.amount
+                renewed_profiles.append(sub.user_id)
+            else:
+                payment.status = Payment.PaymentStatus.FAILED
+                sub.renewal_attempts += 1
+                if sub.renewal_attempts >= settings.RENEWAL_MAX_ATTEMPTS:
+                    sub.auto_renew = False
+                    outcome = 'cancelled'
+                else:
+                    sub.next_renewal_at = now + timedelta(hours=settings.RENEWAL_RETRY_HOURS)
+                    outcome = 'failed'
+            outcomes[outcome] += 1
+            messages.append((sub, outcome, payment))
+
+        Payment.objects.bulk_update(payments, ['status', 'completed_at', 'metadata', 'updated_at'])
+        Subscription.objects.bulk_update(fresh, ['end_date', 'auto_renew', 'renewal_attempts', 'next_renewal_at'])
+        enqueue_messages(
+            (sub.user.telegram_id, renewal_message(outcome, sub, payment))
+            for sub, outcome, payment in messages
+            if sub.user.telegram_id
+        )
+        transaction.on_commit(lambda: invalidate_entitlements(renewed_profiles))
+    return outcomes
+
+
+def preview(now, chunk_size, queryset=None):
+    """Dry-run: hech narsa yozilmaydi va karta yechilmaydi."""
+    outcomes = Counter()
+    for sub in due_subscriptions(now, queryset).iterator(chunk_size=chunk_size):
+        if sub.user.payment_method.is_expired(timezone.localdate(now)):
+            outcomes['card_expired'] += 1
+        else:
+            outcomes['due'] += 1
+            outcomes['amount'] += sub.plan.price
+    return outcomes
+
+
+def run_renewals(now=None, chunk_size=None, concurrency=None, dry_run=False, charger=None, on_chunk=None,
+                 queryset=None):
+    """
+    queryset - yangilanadigan obunalar doirasi (default: barchasi).
+    Returns: Counter(renewed, failed, cancelled, card_expired, unresolved, amount),
+    dry-run da Counter(due, card_expired, amount)
+    """
+    now = now or timezone.now()
+    chunk_size = chunk_size or settings.RENEWAL_CHUNK_SIZE
+    if dry_run:
+        return preview(now, chunk_size, queryset)
+
+    charger = charger or ClickAutoPayment()
+    totals = Counter()
+    after_id = 0
+    with ThreadPoolExecutor(max_workers=concurrency or settings.RENEWAL_CONCURRENCY,
+                            thread_name_prefix='renewal') as pool:
+        while True:
+            subscriptions, pairs, pending = claim_chunk(now, after_id, chunk_size, queryset)
+            if not subscriptions:
+                break
+            after_id = subscriptions[-1].pk
+
+            responses = pool.map(lambda pair: charge(charger, *pair), pairs)
+            statuses = pool.map(lambda pair: charge_status(charger, pair[1]), pending)
+            results = [
+                (sub, payment, response, success)
+                for (sub, payment), (response, success) in zip(pairs + pending, [*responses, *statuses])
+            ]
+            outcomes = apply_results(now, subscriptions, results)
+            totals.update(outcomes)
+            if on_chunk:
+                on_chunk(outcomes, totals)
+
+    logger.info("Avtomatik yangilash: %s", dict(totals))
+    return totals
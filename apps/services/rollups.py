@@ -0,0 +1,117 @@
+from collections import defaultdict
+from decimal import Decimal
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncDate
+
+from apps.models.analytics import DailyActivity
+from apps.models.my_trainer import ExerciseLog, WorkoutSession
+from apps.models.workouts import WorkoutProgress
+from apps.services.stats import VOLUME
+from apps.services.streaks import STREAK_TIMEZONE, local_date
+
+ROLLUP_FIELDS = ('sessions', 'duration_seconds', 'calories', 'reps', 'volume')
+
+
+def add_daily_activity(profile, when=None, sessions=1, duration_seconds=0, calories=0, reps=0, volume=0):
+    """Kunlik rollup qatorini inkremental oshiradi (UPDATE ... SET x = x + n, bo'lmasa INSERT)."""
+    day = local_date(when)
+    deltas = {
+        'sessions': sessions,
+        'duration_seconds': int(duration_seconds or 0),
+        'calories': Decimal(str(calories or 0)),
+        'reps': int(reps or 0),
+        'volume': Decimal(str(volume or 0)),
+    }
+    increments = {field: F(field) + value for field, value in deltas.items()}
+
+    rows = DailyActivity.objects.filter(user=profile, date=day).update(**increments)
+    if rows:
+        return
+
+    try:
+        with transaction.atomic():
+            DailyActivity.objects.create(user=profile, date=day, **deltas)
+    except IntegrityError:
+        DailyActivity.objects.filter(user=profile, date=day).update(**increments)
+
+
+def record_progress(profile, workout, total_duration_seconds=0, total_calories=0, exercises_completed=0):
+    """
+    WorkoutProgress yozuvini yaratadi. Rollupga qo'shilmaydi: DailyActivity (va streak) faqat yakunlangan
+    WorkoutSession larni sanaydi - bitta mashg'ulot ikki marta hisoblanmasligi uchun.
+    """
+    return WorkoutProgress.objects.create(
+        user=profile,
+        workout=workout,
+        total_duration_seconds=total_duration_seconds,
+        total_calories=total_calories,
+        exercises_completed=exercises_completed,
+    )
+
+
+def record_session(session):
+    """Yakunlangan WorkoutSession ni rollupga qo'shadi."""
+    add_daily_activity(
+        session.user,
+        session.started_at,
+        duration_seconds=session.duration_seconds,
+        calories=session.total_calories,
+        reps=session.total_reps,
+        volume=session.total_weight,
+    )
+
+
+def collect_daily_activity(user_ids=None):
+    """
+    Yakunlangan sessiyalardan (user, kun) bo'yicha yig'indilarni hisoblaydi.
+    Har bir manba uchun bitta GROUP BY so'rovi.
+    """
+    totals = defaultdict(lambda: dict.fromkeys(ROLLUP_FIELDS, 0))
+
+    sessions = WorkoutSession.objects.filter(status=WorkoutSession.StatusChoices.COMPLETED).order_by()
+    logs = ExerciseLog.objects.filter(session__status=WorkoutSession.StatusChoices.COMPLETED).order_by()
+    if user_ids is not None:
+        sessions = sessions.filter(user_id__in=user_ids)
+        logs = logs.filter(session__user_id__in=user_ids)
+
+    rows = sessions.annotate(day=TruncDate('started_at', tzinfo=STREAK_TIMEZONE)).values('user_id', 'day').annotate(
+        count=Count('id'), duration=Sum('duration_seconds'), kcal=Sum('total_calories'),
+        total_reps=Sum('total_reps'), total_volume=Sum('total_weight'),
+    )
+    for row in rows:
+        bucket = totals[row['user_id'], row['day']]
+        bucket['sessions'] += row['count']
+        bucket['duration_seconds'] += row['duration'] or 0
+        bucket['calories'] += row['kcal'] or 0
+        bucket['reps'] += row['total_reps'] or 0
+        bucket['volume'] += row['total_volume'] or 0
+
+    # Sessiyada jami ko'rsatkich saqlanmagan bo'lsa, ExerciseLog dan olinadi
+    rows = logs.annotate(day=TruncDate('session__started_at', tzinfo=STREAK_TIMEZONE)).values(
+        'session__user_id', 'day'
+    ).annotate(log_reps=Sum('reps_completed'), log_volume=Sum(VOLUME))
+    for row in rows:
+        bucket = totals[row['session__user_id'], row['day']]
+        bucket['reps'] = max(bucket['reps'], row['log_reps'] or 0)
+        bucket['volume'] = max(bucket['volume'], row['log_volume'] or 0)
+
+    return totals
+
+
+def rebuild_daily_activity(user_ids=None, batch_size=1000):
+    totals = collect_daily_activity(user_ids)
+    objs = [
+        DailyActivity(user_id=user_id, date=day, **values)
+        for (user_id, day), values in totals.items()
+    ]
+
+    with transaction.atomic():
+        existing = DailyActivity.objects.all()
+        if user_ids is not None:
+            existing = existing.filter(user_id__in=user_ids)
+        existing.delete()
+        DailyActivity.objects.bulk_create(objs, batch_size=batch_size)
+
+    return len(objs)
@@ -0,0 +1,220 @@
+import copy
+import re
+import threading
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Count, F, FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Coalesce, Greatest
+
+from apps.models import Exercise, ExerciseInstruction
+from apps.services.cache import namespace_version
+from apps.services.catalog import get_catalog_index
+
+SEARCH_CONFIG = 'simple'
+SIMILARITY_THRESHOLD = 0.3
+TITLE_WEIGHT = 1.0
+BODY_WEIGHT = 0.4
+WORD_RE = re.compile(r"[\w'ʻ‘’]+", re.UNICODE)
+
+_index = None
+_lock = threading.Lock()
+
+
+def tokenize(text):
+    return [word.strip("'ʻ‘’") for word in WORD_RE.findall((text or '').lower()) if word.strip("'ʻ‘’")]
+
+
+def trigrams(token):
+    """pg_trgm bilan bir xil: so'z boshiga ikki, oxiriga bitta bo'sh joy qo'shiladi."""
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    PostgreSQL bo'lmagan muhit (SQLite, testlar) uchun sof Python qidiruv indeksi.
+    Tokenlar bo'yicha inverted index va lug'at ustida trigram indeksi - xatolik bilan yozilgan so'zlar ham topiladi.
+    """
+
+    def __init__(self, version, exercises, instructions):
+        self.version = version
+        self.exercises = {exercise.id: exercise for exercise in exercises}
+        self.postings = defaultdict(dict)
+        self.token_trigrams = {}
+        self.trigram_tokens = defaultdict(set)
+
+        for exercise in exercises:
+            self._add(exercise.id, exercise.name, TITLE_WEIGHT)
+            self._add(exercise.id, exercise.name_uz, TITLE_WEIGHT)
+            self._add(exercise.id, exercise.description, BODY_WEIGHT)
+        for exercise_id, text, text_uz in instructions:
+            if exercise_id in self.exercises:
+                self._add(exercise_id, text, BODY_WEIGHT)
+                self._add(exercise_id, text_uz, BODY_WEIGHT)
+
+    def _add(self, exercise_id, text, weight):
+        for token in tokenize(text):
+            docs = self.postings[token]
+            docs[exercise_id] = max(docs.get(exercise_id, 0), weight)
+            if token not in self.token_trigrams:
+                grams = trigrams(token)
+                self.token_trigrams[token] = len(grams)
+                for gram in grams:
+                    self.trigram_tokens[gram].add(token)
+
+    def similar_tokens(self, query_token):
+        if query_token in self.postings:
+            yield query_token, 1.0
+
+        grams = trigrams(query_token)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.trigram_tokens.get(gram, ()))
+
+        for token, common in shared.items():
+            if token == query_token:
+                continue
+            similarity = common / (len(grams) + self.token_trigrams[token] - common)
+            if token.startswith(query_token):
+                similarity = max(similarity, 0.9)
+            if similarity >= SIMILARITY_THRESHOLD:
+                yield token, similarity
+
+    def search(self, query):
+        """Returns: [(exercise, score)] - score bo'yicha kamayish tartibida."""
+        scores = defaultdict(float)
+        for query_token in set(tokenize(query)):
+            best = {}
+            for token, similarity in self.similar_tokens(query_token):
+                for exercise_id, weight in self.postings[token].items():
+                    best[exercise_id] = max(best.get(exercise_id, 0), similarity * weight)
+            for exercise_id, score in best.items():
+                scores[exercise_id] += score
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], self.exercises[item[0]].name, item[0]))
+        return [(self.exercises[exercise_id], round(score, 4)) for exercise_id, score in ranked]
+
+
+def get_trigram_index() -> TrigramIndex:
+    global _index
+    version = namespace_version('catalog')
+    index = _index
+    if index is not None and index.version == version:
+        return index
+
+    with _lock:
+        if _index is None or _index.version != version:
+            catalog = get_catalog_index()
+            instructions = ExerciseInstruction.objects.order_by().values_list('exercise_id', 'text', 'text_uz')
+            _index = TrigramIndex(version, list(catalog.by_id.values()), list(instructions))
+        return _index
+
+
+def reset_trigram_index():
+    global _index
+    _index = None
+
+
+def use_postgres():
+    backend = getattr(settings, 'SEARCH_BACKEND', 'auto')
+    if backend == 'auto':
+        return connection.vendor == 'postgresql'
+    return backend == 'postgres'
+
+
+def postgres_search(query):
+    """
+    To'liq matnli qidiruv (tsvector) + xatoliklar uchun pg_trgm (% operatori).
+    Filtr faqat indekslangan ifodalardan iborat: setup_search_indexes yaratgan saqlangan search_document
+    ustunlari va name/name_uz trigram indekslari (GIN). % chegarasi pg_trgm.similarity_threshold (0.3).
+    rank/similarity faqat topilgan qatorlar uchun, saralashda hisoblanadi.
+    """
+    from django.contrib.postgres.lookups import TrigramSimilar
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField, TrigramSimilarity
+
+    search_query = SearchQuery(query, search_type='websearch', config=SEARCH_CONFIG)
+    document = RawSQL('search_document', [], output_field=SearchVectorField())
+    title_matches = (
+        Exercise.objects
+        .alias(document=document)
+        .filter(Q(document=search_query) | TrigramSimilar(F('name'), query) | TrigramSimilar(F('name_uz'), query))
+        .order_by()
+        .values('pk')
+    )
+    instruction_matches = (
+        ExerciseInstruction.objects
+        .alias(document=document)
+        .filter(document=search_query)
+        .order_by()
+        .values('exercise_id')
+    )
+
+    return (
+        Exercise.objects
+        .filter(pk__in=title_matches.union(instruction_matches))
+        .annotate(
+            rank=SearchRank(document, search_query),
+            similarity=Greatest(TrigramSimilarity('name', query), TrigramSimilarity('name_uz', query)),
+        )
+        .annotate(score=Coalesce(F('rank'), Value(0.0)) + F('similarity') * Value(BODY_WEIGHT, FloatField()))
+        .order_by('-score', 'name', 'id')
+    )
+
+
+def _facets_from_rows(rows):
+    muscles, difficulties = Counter(), Counter()
+    for muscle, difficulty in rows:
+        muscles[muscle] += 1
+        difficulties[difficulty] += 1
+    return {'muscle': dict(muscles), 'difficulty': dict(difficulties)}
+
+
+def search_exercises(query, muscle=None, difficulty=None, page=1, page_size=20):
+    """
+    Returns: {'count', 'page', 'page_size', 'results': [exercise, ...], 'facets'}
+    Facetlar filtrlar qo'llanishidan oldingi natijalar bo'yicha hisoblanadi.
+    Har bir natija mashqida .score atributi bo'ladi.
+    """
+    offset = (page - 1) * page_size
+
+    if use_postgres():
+        matches = postgres_search(query)
+        facets = {
+            'muscle': dict(matches.order_by().values_list('primary_body_part').annotate(n=Count('id'))),
+            'difficulty': dict(matches.order_by().values_list('difficulty').annotate(n=Count('id'))),
+        }
+        if muscle:
+            matches = matches.filter(primary_body_part=muscle)
+        if difficulty:
+            matches = matches.filter(difficulty=difficulty)
+        return {
+            'count': matches.count(),
+            'page': page,
+            'page_size': page_size,
+            'results': list(matches[offset:offset + page_size]),
+            'facets': facets,
+        }
+
+    ranked = get_trigram_index().search(query)
+    facets = _facets_from_rows((exercise.primary_body_part, exercise.difficulty) for exercise, _ in ranked)
+    if muscle:
+        ranked = [(exercise, score) for exercise, score in ranked if exercise.primary_body_part == muscle]
+    if difficulty:
+        ranked = [(exercise, score) for exercise, score in ranked if exercise.difficulty == difficulty]
+
+    results = []
+    for exercise, score in ranked[offset:offset + page_size]:
+        exercise = copy.copy(exercise)
+        exercise.score = score
+        results.append(exercise)
+
+    return {
+        'count': len(ranked),
+        'page': page,
+        'page_size': page_size,
+        'results': results,
+        'facets': facets,
+    }
@@ -0,0 +1,142 @@
+from datetime import datetime, time, timedelta
+
+from django.db.models import DecimalField, ExpressionWrapper, F, Max, Q, Sum
+from django.utils import timezone
+
+from apps.models.analytics import DailyActivity
+from apps.models.my_trainer import ExerciseLog, WorkoutSession
+from apps.models.workouts import WorkoutProgress
+from apps.services.streaks import STREAK_TIMEZONE, local_date
+
+VOLUME = ExpressionWrapper(
+    F('reps_completed') * F('weight_used'),
+    output_field=DecimalField(max_digits=14, decimal_places=2),
+)
+
+
+def day_start(day):
+    return datetime.combine(day, time.min, tzinfo=STREAK_TIMEZONE)
+
+
+def humanize_number(value) -> str:
+    value = float(value or 0)
+    if value >= 1000:
+        return f"{value / 1000:.1f}k"
+    return str(int(value))
+
+
+def humanize_duration(seconds) -> str:
+    hours = (seconds or 0) / 3600
+    if hours >= 1:
+        return f"{hours:.0f}h"
+    return f"{(seconds or 0) // 60}m"
+
+
+def chart_bars(values, labels):
+    """Grafik ustunlari: balandlik eng katta qiymatga nisbatan foizda."""
+    peak = max(values, default=0) or 1
+    return [{
+        'label': label,
+        'value': humanize_number(value),
+        'height': round(float(value) / peak * 100),
+    } for value, label in zip(values, labels)]
+
+
+def _week_days(today):
+    monday = today - timedelta(days=today.weekday())
+    return [monday + timedelta(days=i) for i in range(7)]
+
+
+def rollup_totals(profile, days, week_starts):
+    """
+    DailyActivity rolluplaridan jami, shu haftaning kunlari va haftalik hajm - bitta aggregate so'rovi.
+    Foydalanuvchi uchun kuniga bitta qator bo'lgani sabab o'qiladigan qatorlar soni kichik.
+    """
+    aggregates = {
+        'total_sessions': Sum('sessions'),
+        'total_duration': Sum('duration_seconds'),
+        'total_calories': Sum('calories'),
+        'total_reps': Sum('reps'),
+        'total_volume': Sum('volume'),
+    }
+    for i, day in enumerate(days):
+        aggregates[f"day_{i}"] = Sum('sessions', filter=Q(date=day))
+    for i, start in enumerate(week_starts):
+        aggregates[f"volume_{i}"] = Sum('volume', filter=Q(date__gte=start, date__lt=start + timedelta(days=7)))
+
+    return DailyActivity.objects.filter(user=profile).aggregate(**aggregates)
+
+
+def exercise_trends(profile, week_starts):
+    """ExerciseLog bo'yicha haftalik eng og'ir vazn - bitta aggregate so'rovi."""
+    aggregates = {}
+    for i, start in enumerate(week_starts):
+        in_week = Q(started_at__gte=day_start(start), started_at__lt=day_start(start + timedelta(days=7)))
+        aggregates[f"weight_{i}"] = Max('weight_used', filter=in_week)
+
+    result = ExerciseLog.objects.filter(session__user=profile).aggregate(**aggregates)
+    return [float(result[f"weight_{i}"] or 0) for i in range(len(week_starts))]
+
+
+def recent_workouts(profile, limit=10):
+    """Oxirgi mashg'ulotlar: sessiyalar va progress yozuvlari vaqt bo'yicha birlashtiriladi."""
+    sessions = (
+        WorkoutSession.objects
+        .filter(user=profile)
+        .select_related('workout', 'workout__edition')
+        .order_by('-started_at')[:limit]
+    )
+    progress = (
+        WorkoutProgress.objects
+        .filter(user=profile)
+        .select_related('workout')
+        .order_by('-completed_at')[:limit]
+    )
+
+    items = [{
+        'title': s.workout.title or str(s.workout),
+        'date': s.started_at,
+        'exercises': s.exercises_completed,
+        'duration': s.duration_seconds // 60,
+        'calories': int(s.total_calories),
+        'session': s,
+    } for s in sessions]
+    items += [{
+        'title': p.workout.title or str(p.workout),
+        'date': p.completed_at,
+        'exercises': p.exercises_completed,
+        'duration': p.total_duration_seconds // 60,
+        'calories': int(p.total_calories),
+        'session': None,
+    } for p in progress]
+
+    items.sort(key=lambda item: item['date'], reverse=True)
+    return items[:limit]
+
+
+def get_user_stats(profile, weeks=8, recent=10, today=None):
+    """
+    My Trainer va Progress sahifalari uchun umumiy statistika.
+    Jami va haftalik ko'rsatkichlar DailyActivity rollupidan, vazn trendi ExerciseLog dan olinadi -
+    tarix uzunligidan qat'i nazar so'rovlar soni o'zgarmaydi.
+    """
+    today = today or local_date()
+    days = _week_days(today)
+    this_monday = days[0]
+    week_starts = [this_monday - timedelta(weeks=i) for i in reversed(range(weeks))]
+
+    totals = rollup_totals(profile, days, week_starts)
+
+    return {
+        'total_workouts': totals['total_sessions'] or 0,
+        'total_duration_seconds': totals['total_duration'] or 0,
+        'total_calories': float(totals['total_calories'] or 0),
+        'total_reps': totals['total_reps'] or 0,
+        'total_volume': float(totals['total_volume'] or 0),
+        'weekly_activity': [totals[f"day_{i}"] or 0 for i in range(7)],
+        'week_starts': week_starts,
+        'volume_trend': [float(totals[f"volume_{i}"] or 0) for i in range(weeks)],
+        'weight_trend': exercise_trends(profile, week_starts),
+        'recent_workouts': recent_workouts(profile, recent),
+        'generated_at': timezone.now(),
+    }
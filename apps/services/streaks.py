@@ -0,0 +1,113 @@
+from datetime import date, timedelta
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from apps.models.analytics import DailyActivity
+from apps.models.my_trainer import UserStreak
+
+STREAK_TIMEZONE = ZoneInfo(settings.TIME_ZONE)
+
+
+def local_date(value=None) -> date:
+    """Berilgan vaqtni (yoki hozirgi vaqtni) Asia/Tashkent bo'yicha sanaga aylantiradi."""
+    return timezone.localtime(value or timezone.now(), STREAK_TIMEZONE).date()
+
+
+def active_dates_queryset(profile):
+    """Foydalanuvchi mashq qilgan kunlar - DailyActivity rollupidan bitta so'rov."""
+    return (
+        DailyActivity.objects
+        .filter(user=profile, sessions__gt=0)
+        .order_by('date')
+        .values_list('date', flat=True)
+    )
+
+
+def streaks_from_dates(dates, today=None):
+    """
+    Tartiblangan (o'suvchi) kunlar ro'yxatidan (current, longest, last_active_date) ni hisoblaydi.
+    Joriy streak bugun yoki kecha mashq qilingan bo'lsagina saqlanadi.
+    """
+    today = today or local_date()
+    current = longest = 0
+    previous = None
+
+    for day in dates:
+        if previous is not None and day == previous:
+            continue
+        if previous is not None and day == previous + timedelta(days=1):
+            current += 1
+        else:
+            current = 1
+        longest = max(longest, current)
+        previous = day
+
+    if previous is None or previous < today - timedelta(days=1):
+        current = 0
+
+    return current, longest, previous
+
+
+def compute_streak(profile, today=None):
+    """Bitta distinct-dates so'rovi orqali streakni noldan hisoblaydi (fallback)."""
+    dates = list(active_dates_queryset(profile))
+    return streaks_from_dates(dates, today)
+
+
+def rebuild_streak(profile, today=None) -> UserStreak:
+    current, longest, last_active = compute_streak(profile, today)
+    streak, _ = UserStreak.objects.update_or_create(
+        user=profile,
+        defaults={
+            'current_streak': current,
+            'longest_streak': longest,
+            'last_active_date': last_active,
+        }
+    )
+    return streak
+
+
+def record_activity(profile, when=None) -> UserStreak:
+    """
+    Sessiya yakunlanganda chaqiriladi - streak holatini inkremental yangilaydi.
+    Eski sanadagi (tartibsiz kelgan) faollik uchun holat qayta hisoblanadi.
+    """
+    day = local_date(when)
+
+    with transaction.atomic():
+        streak, created = UserStreak.objects.select_for_update().get_or_create(user=profile)
+        last = streak.last_active_date
+
+        if last is not None and day < last:
+            return rebuild_streak(profile)
+
+        if last is None:
+            streak.current_streak = 1
+        elif day == last:
+            return streak
+        elif day == last + timedelta(days=1):
+            streak.current_streak += 1
+        else:
+            streak.current_streak = 1
+
+        streak.last_active_date = day
+        streak.longest_streak = max(streak.longest_streak, streak.current_streak)
+        streak.save(update_fields=['current_streak', 'longest_streak', 'last_active_date', 'updated_at'])
+
+    return streak
+
+
+def get_current_streak(profile, today=None) -> int:
+    """My Trainer sahifasi uchun O(1) javob: saqlangan holatdan o'qiydi."""
+    today = today or local_date()
+    try:
+        streak = profile.streak
+    except UserStreak.DoesNotExist:
+        streak = rebuild_streak(profile, today)
+
+    if streak.last_active_date is None or streak.last_active_date < today - timedelta(days=1):
+        return 0
+    return streak.current_streak
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.utils import timezone
+
+from apps.models import Subscription, UserProfile
+
+
+def extend_subscription(profile_id, plan, now=None) -> Subscription:
+    """
+    Obunani plan davriga uzaytiradi: faol obuna tugash sanasidan, tugagani esa hozirdan boshlab.
+    Avval UserProfile qatori qulflanadi - obuna hali yo'q bo'lsa ham parallel uzaytirishlar navbat bilan bajariladi
+    va ikkinchisi OneToOne ga qayta create qilmaydi.
+    """
+    now = now or timezone.now()
+    with transaction.atomic():
+        list(UserProfile.objects.select_for_update().filter(pk=profile_id).values_list('pk', flat=True))
+        subscription = Subscription.objects.select_for_update().filter(user_id=profile_id).first()
+        if subscription is None:
+            subscription = Subscription.objects.create(
+                user_id=profile_id, plan=plan, end_date=plan.get_expiry_date(now),
+            )
+        else:
+            start = subscription.end_date if subscription.is_active and subscription.end_date > now else now
+            subscription.plan = plan
+            subscription.end_date = plan.get_expiry_date(start)
+            subscription.is_active = True
+            subscription.save(update_fields=['plan', 'end_date', 'is_active'])
+        UserProfile.objects.filter(pk=profile_id).update(is_premium=True)
+    return subscription
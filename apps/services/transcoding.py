@@ -0,0 +1,356 @@
+"""
+Exercise videolarini ffmpeg bilan 240p/480p/720p faststart MP4 (H.264/AAC), har biri uchun HLS
+segmentlar, master playlist va poster ga o'girish. Manba bir marta decode qilinadi (split filter),
+HLS segmentlar esa tayyor MP4 dan qayta kodlanmasdan kesiladi. Exercise.save faqat TranscodeJob
+yaratadi, ish run_transcode_worker jarayonlar pulida bajariladi: progress ffmpeg -progress
+chiqishidan o'qilib jadvalga yoziladi, xatoda backoff bilan qayta uriniladi.
+"""
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.utils import timezone
+
+from apps.bot.queue import claim_rows, retry_delay
+from apps.models import Exercise, TranscodeJob, VideoRendition
+from apps.services.cache import bump_namespace
+
+logger = logging.getLogger(__name__)
+
+# Progress jadvalga shu oraliqda yoziladi; locked_at ham yangilanadi - uzun transcode
+# claim_rows ning VISIBILITY_TIMEOUT i o'tib boshqa worker ga berilmaydi
+PROGRESS_INTERVAL = 2.0
+
+# (balandlik, video bitrate bit/s) - manbadan baland sifatlar yaratilmaydi
+LADDER = ((240, 400_000), (480, 1_000_000), (720, 2_500_000))
+AUDIO_BITRATE = 96_000
+HLS_SEGMENT_SECONDS = 4
+# Barcha sifatlarda keyframe lar bir vaqtda - player sifatni segment chegarasida almashtira oladi
+KEYFRAME_SECONDS = 2
+# Kodlash progressning shu qismi, qolgani HLS kesish va poster
+ENCODE_SHARE = 0.9
+RENDITIONS_DIR = 'exercises/renditions'
+
+
+class TranscodeError(Exception):
+    pass
+
+
+def claim_jobs(limit, now=None):
+    return claim_rows(TranscodeJob, limit, now, order_by='available_at')
+
+
+@contextmanager
+def local_copy(name):
+    """Storage faylining lokal yo'li. Lokal bo'lmagan storage uchun vaqtinchalik nusxa olinadi."""
+    try:
+        path = default_storage.path(name)
+    except NotImplementedError:
+        path = None
+    if path:
+        yield path
+        return
+    suffix = os.path.splitext(name)[1]
+    with tempfile.NamedTemporaryFile(suffix=suffix) as tmp, default_storage.open(name, 'rb') as source:
+        shutil.copyfileobj(source, tmp)
+        tmp.flush()
+        yield tmp.name
+
+
+def probe(path):
+    """Returns: {'duration': sekund yoki None, 'width', 'height', 'audio': bool}"""
+    result = subprocess.run(
+        [
+            settings.FFPROBE_BINARY, '-v', 'error',
+            '-show_entries', 'format=duration:stream=codec_type,width,height', '-of', 'json', path,
+        ],
+        capture_output=True, text=True, timeout=60,
+    )
+    if result.returncode != 0:
+        raise TranscodeError(f"ffprobe: {result.stderr.strip()[-500:]}")
+    data = json.loads(result.stdout or '{}')
+    streams = data.get('streams') or []
+    video = next((stream for stream in streams if stream.get('codec_type') == 'video'), None)
+    if video is None:
+        raise TranscodeError("video oqimi topilmadi")
+    try:
+        duration = float(data.get('format', {}).get('duration'))
+    except (TypeError, ValueError):
+        duration = None
+    return {
+        'duration': duration,
+        'width': video.get('width'),
+        'height': video.get('height'),
+        'audio': any(stream.get('codec_type') == 'audio' for stream in streams),
+    }
+
+
+def ladder_for(height):
+    """Manba balandligidan oshmaydigan sifatlar; juda kichik manba uchun eng pastki sifat."""
+    return [rung for rung in LADDER if height and rung[0] <= height] or [LADDER[0]]
+
+
+def encode_command(source, workdir, ladder):
+    """Bitta ffmpeg: manba bir marta decode qilinadi va har bir sifat alohida faststart MP4 ga yoziladi."""
+    splits = ''.join(f'[v{i}]' for i in range(len(ladder)))
+    scales = ';'.join(f'[v{i}]scale=-2:{height}[o{i}]' for i, (height, _) in enumerate(ladder))
+    command = [
+        settings.FFMPEG_BINARY, '-hide_banner', '-nostdin', '-y', '-progress', 'pipe:1', '-nostats',
+        '-i', source,
+        '-filter_complex', f'[0:v]split={len(ladder)}{splits};{scales}',
+    ]
+    for i, (height, bitrate) in enumerate(ladder):
+        command += [
+            '-map', f'[o{i}]', '-map', '0:a?',
+            '-c:v', 'libx264', '-preset', 'veryfast', '-profile:v', 'main', '-pix_fmt', 'yuv420p',
+            '-b:v', str(bitrate), '-maxrate', str(int(bitrate * 1.1)), '-bufsize', str(bitrate * 2),
+            '-force_key_frames', f'expr:gte(t,n_forced*{KEYFRAME_SECONDS})', '-sc_threshold', '0',
+            '-c:a', 'aac', '-b:a', str(AUDIO_BITRATE), '-ac', '2',
+            '-movflags', '+faststart',
+            os.path.join(workdir, f'{height}p.mp4'),
+        ]
+    return command
+
+
+def hls_command(mp4, playlist_dir):
+    """Tayyor MP4 ni qayta kodlamasdan HLS (VOD) segmentlarga kesadi."""
+    return [
+        settings.FFMPEG_BINARY, '-hide_banner', '-nostdin', '-y', '-i', mp4,
+        '-c', 'copy', '-f', 'hls', '-hls_time', str(HLS_SEGMENT_SECONDS), '-hls_playlist_type', 'vod',
+        '-hls_segment_filename', os.path.join(playlist_dir, 'segment_%03d.ts'),
+        os.path.join(playlist_dir, 'index.m3u8'),
+    ]
+
+
+def poster_command(source, output, height, duration):
+    offset = min(1.0, duration / 2) if duration else 0
+    return [
+        settings.FFMPEG_BINARY, '-hide_banner', '-nostdin', '-y', '-ss', f'{offset:.2f}', '-i', source,
+        '-frames:v', '1', '-vf', f'scale=-2:{height}', '-q:v', '3', output,
+    ]
+
+
+def master_playlist(variants):
+    """variants: [(balandlik, kenglik, bitrate), ...]"""
+    lines = ['#EXTM3U', '#EXT-X-VERSION:3']
+    for height, width, bitrate in variants:
+        lines.append(
+            f'#EXT-X-STREAM-INF:BANDWIDTH={bitrate},RESOLUTION={width}x{height},'
+            'CODECS="avc1.4d401f,mp4a.40.2"'
+        )
+        lines.append(f'{height}p/index.m3u8')
+    return '\n'.join(lines) + '\n'
+
+
+def parse_progress(line, duration):
+    """ffmpeg -progress satri (out_time_us=...) dan foiz. Boshqa satrlar uchun None."""
+    key, _, value = line.strip().partition('=')
+    if key == 'progress' and value == 'end':
+        return 100.0
+    if key not in ('out_time_us', 'out_time_ms') or not duration:
+        return None
+    try:
+        # ffmpeg out_time_ms ni ham mikrosekundda yozadi
+        seconds = int(value) / 1_000_000
+    except ValueError:
+        return None
+    return max(0.0, min(99.9, seconds / duration * 100))
+
+
+def run_ffmpeg(command, timeout, duration=None, on_progress=None):
+    """ffmpeg ni ishga tushiradi va progress ni o'qiydi. timeout dan oshsa jarayon o'ldiriladi."""
+    with tempfile.TemporaryFile() as stderr:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr, text=True)
+        timed_out = threading.Event()
+
+        def kill():
+            timed_out.set()
+            process.kill()
+
+        killer = threading.Timer(timeout, kill)
+        killer.start()
+        try:
+            for line in process.stdout:
+                percent = parse_progress(line, duration)
+                if percent is not None and on_progress:
+                    on_progress(percent)
+            returncode = process.wait()
+        finally:
+            killer.cancel()
+            if process.poll() is None:
+                process.kill()
+                process.wait()
+        if returncode != 0:
+            stderr.seek(0)
+            tail = stderr.read()[-2000:].decode(errors='replace').strip()
+            if timed_out.is_set():
+                raise TranscodeError(f"ffmpeg {timeout}s da tugamadi")
+            raise TranscodeError(f"ffmpeg {returncode}: {tail}")
+
+
+def progress_writer(job, share=1.0):
+    last = [0.0]
+
+    def write(percent):
+        percent *= share
+        now = time.monotonic()
+        if now - last[0] >= PROGRESS_INTERVAL or percent >= 100:
+            last[0] = now
+            TranscodeJob.objects.filter(pk=job.pk).update(progress=round(percent, 1), locked_at=timezone.now())
+
+    return write
+
+
+def directory_size(path):
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, files in os.walk(path) for name in files)
+
+
+def upload_tree(workdir, prefix):
+    """workdir dagi fayllarni nisbiy yo'llari bilan prefix ostiga yuklaydi - playlistlardagi havolalar nisbiy."""
+    for root, _, files in os.walk(workdir):
+        for name in files:
+            path = os.path.join(root, name)
+            target = f"{prefix}/{os.path.relpath(path, workdir).replace(os.sep, '/')}"
+            with open(path, 'rb') as f:
+                saved = default_storage.save(target, File(f))
+            if saved != target:
+                raise TranscodeError(f"storage fayl nomini o'zgartirdi: {saved}")
+
+
+def delete_tree(prefix):
+    try:
+        directories, files = default_storage.listdir(prefix)
+    except FileNotFoundError:
+        return
+    for name in files:
+        default_storage.delete(f'{prefix}/{name}')
+    for name in directories:
+        delete_tree(f'{prefix}/{name}')
+
+
+def transcode(job):
+    """Returns: saqlanmagan VideoRendition lar (fayllar storage ga yuklangan)"""
+    TranscodeJob.objects.filter(pk=job.pk).update(started_at=timezone.now(), progress=0)
+    prefix = f'{RENDITIONS_DIR}/{job.exercise_id}/{job.pk}'
+    timeout = settings.TRANSCODE_TIMEOUT
+    with local_copy(job.source) as source, tempfile.TemporaryDirectory(prefix='transcode-') as workdir:
+        info = probe(source)
+        ladder = ladder_for(info['height'])
+        run_ffmpeg(encode_command(source, workdir, ladder), timeout, info['duration'],
+                   progress_writer(job, ENCODE_SHARE))
+
+        renditions, variants = [], []
+        for height, video_bitrate in ladder:
+            mp4 = os.path.join(workdir, f'{height}p.mp4')
+            playlist_dir = os.path.join(workdir, f'{height}p')
+            os.mkdir(playlist_dir)
+            run_ffmpeg(hls_command(mp4, playlist_dir), timeout)
+            width = probe(mp4)['width']
+            bitrate = video_bitrate + AUDIO_BITRATE * info['audio']
+            variants.append((height, width, bitrate))
+            renditions += [
+                VideoRendition(kind=VideoRendition.KindChoices.MP4, height=height, width=width, bitrate=bitrate,
+                               file=f'{prefix}/{height}p.mp4', size=os.path.getsize(mp4)),
+                VideoRendition(kind=VideoRendition.KindChoices.HLS, height=height, width=width, bitrate=bitrate,
+                               file=f'{prefix}/{height}p/index.m3u8', size=directory_size(playlist_dir)),
+            ]
+
+        poster = os.path.join(workdir, 'poster.jpg')
+        run_ffmpeg(poster_command(source, poster, ladder[-1][0], info['duration']), timeout)
+        master = os.path.join(workdir, 'master.m3u8')
+        with open(master, 'w') as f:
+            f.write(master_playlist(variants))
+        renditions += [
+            VideoRendition(kind=VideoRendition.KindChoices.MASTER, file=f'{prefix}/master.m3u8',
+                           size=os.path.getsize(master)),
+            VideoRendition(kind=VideoRendition.KindChoices.POSTER, height=ladder[-1][0], file=f'{prefix}/poster.jpg',
+                           size=os.path.getsize(poster)),
+        ]
+        # Oldingi urinishdan qolgan qisman yuklangan fayllar
+        delete_tree(prefix)
+        upload_tree(workdir, prefix)
+
+    for rendition in renditions:
+        rendition.exercise_id = job.exercise_id
+    return renditions
+
+
+def publish(job, renditions):
+    """
+    Exercise.video eng yuqori sifatli MP4 ga almashtiriladi, eski renditionlar o'chiriladi.
+    Shu orada yangi video yuklangan bo'lsa natija tashlab yuboriladi. Returns: yangi video nomi yoki None
+    """
+    top = max((r for r in renditions if r.kind == VideoRendition.KindChoices.MP4), key=lambda r: r.height)
+    prefix = os.path.dirname(top.file)
+    old = VideoRendition.objects.filter(exercise_id=job.exercise_id)
+    with transaction.atomic():
+        replaced = Exercise.objects.filter(pk=job.exercise_id, video=job.source).update(
+            video=top.file, updated_at=timezone.now(),
+        )
+        if replaced:
+            old_prefixes = {os.path.dirname(name) for name in old.filter(kind=VideoRendition.KindChoices.MASTER)
+                            .values_list('file', flat=True)}
+            old.delete()
+            VideoRendition.objects.bulk_create(renditions)
+            transaction.on_commit(lambda: bump_namespace('catalog'))
+
+    if not replaced:
+        delete_tree(prefix)
+        return None
+    for old_prefix in old_prefixes - {prefix}:
+        delete_tree(old_prefix)
+    if not job.source.startswith(f'{RENDITIONS_DIR}/'):
+        default_storage.delete(job.source)
+    return top.file
+
+
+def process_job(job_id) -> bool:
+    """run_transcode_worker pulidagi jarayonda bajariladi."""
+    job = TranscodeJob.objects.get(pk=job_id)
+    if job.attempts > settings.TRANSCODE_MAX_ATTEMPTS:
+        # Worker o'lib qayta olingan job - cheksiz aylanmasligi uchun
+        mark_failed(job, TranscodeError("worker jarayoni to'xtab qoldi"))
+        return False
+    try:
+        output = publish(job, transcode(job))
+    except Exception as exc:
+        mark_failed(job, exc)
+        return False
+
+    TranscodeJob.objects.filter(pk=job.pk).update(
+        status=TranscodeJob.StatusChoices.DONE,
+        output=output or '',
+        progress=100,
+        locked_at=None,
+        last_error='',
+        finished_at=timezone.now(),
+    )
+    return True
+
+
+def mark_failed(job, exc):
+    now = timezone.now()
+    if job.attempts >= settings.TRANSCODE_MAX_ATTEMPTS:
+        status, available_at, finished_at = TranscodeJob.StatusChoices.FAILED, now, now
+        logger.error("Transcode job %s %d urinishdan keyin failed: %s", job.pk, job.attempts, exc)
+    else:
+        status, available_at, finished_at = TranscodeJob.StatusChoices.PENDING, now + retry_delay(job.attempts), None
+        logger.warning("Transcode job %s xato (urinish %d): %s", job.pk, job.attempts, exc)
+
+    TranscodeJob.objects.filter(pk=job.pk).update(
+        status=status,
+        available_at=available_at,
+        locked_at=None,
+        finished_at=finished_at,
+        last_error=str(exc)[:2000],
+    )
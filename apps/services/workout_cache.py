@@ -0,0 +1,76 @@
+from django.http import Http404
+
+from apps.models.workouts import Workout, WorkoutExercise
+from apps.services.cache import bump_namespace, cache_stats, lookup
+
+PAYLOAD_TIMEOUT = 60 * 60 * 24
+STATS_NAME = 'workout_payload'
+
+
+def payload_namespaces(workout_id):
+    """Payload katalog (mashqlar) va shu workout namespace lariga bog'liq."""
+    return ('catalog', f'workout:{workout_id}')
+
+
+def prepare_exercises_data(workout_exercises):
+    data = []
+    for wex in workout_exercises:
+        exercise = wex.exercise
+
+        is_strength = wex.sets > 0 or wex.reps > 0
+        is_cardio = (wex.minutes or 0) > 0
+        exercise_type = "cardio" if is_cardio and not is_strength else "strength"
+
+        data.append({
+            "exercise_id": exercise.id,
+            "name": exercise.name,
+            "image": exercise.thumbnail.url if exercise.thumbnail else None,
+            "sets": max(wex.sets, 1),
+            "reps": max(wex.reps, 10),
+            "duration_minutes": wex.minutes,
+            "rest_seconds": getattr(wex, 'rest_seconds', 60),
+            "calories_per_minute": max(exercise.calory, 10),
+            "type": exercise_type,
+        })
+    return data
+
+
+def build_workout_payload(workout_id):
+    workout = Workout.objects.filter(pk=workout_id).values('id', 'title', 'day_number').first()
+    if workout is None:
+        raise Http404("Workout topilmadi")
+
+    workout_exercises = (
+        WorkoutExercise.objects
+        .filter(workout_id=workout_id)
+        .select_related('exercise')
+        .order_by('order')
+    )
+    workout['pk'] = workout['id']
+    return {
+        'workout': workout,
+        'exercises': prepare_exercises_data(workout_exercises),
+    }
+
+
+def get_workout_payload(workout_id):
+    """
+    WorkoutStartView uchun tayyorlangan mashqlar ro'yxati.
+    Odatiy holatda keshdan qaytadi va DB ga murojaat qilinmaydi.
+    Returns: (payload, hit)
+    """
+    return lookup(
+        payload_namespaces(workout_id),
+        ('payload',),
+        lambda: build_workout_payload(workout_id),
+        PAYLOAD_TIMEOUT,
+        stat=STATS_NAME,
+    )
+
+
+def invalidate_workout(workout_id):
+    bump_namespace(f'workout:{workout_id}')
+
+
+def payload_cache_stats():
+    return cache_stats(STATS_NAME)
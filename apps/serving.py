@@ -0,0 +1,226 @@
+"""
+STATIC_ROOT va MEDIA_ROOT fayllarini Django dan oldin beradigan WSGI/ASGI qatlami (nginx siz ham ishlaydi):
+collectstatic yaratgan .br/.gz variantlar Accept-Encoding bo'yicha tanlanadi, kontent hash li nomlar
+(manifest static, derived/ rasmlar, video renditionlar) immutable sifatida bir yilga keshlanadi,
+ETag/Last-Modified bilan 304, videolar uchun Range (206) qo'llanadi.
+"""
+import asyncio
+import mimetypes
+import os
+import re
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote
+
+from django.conf import settings
+
+CHUNK_SIZE = 64 * 1024
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+# Manifest storage: name.<12 hex>.ext, derivative rasmlar: name-640w.<12 hex>.ext
+HASHED_NAME = re.compile(r'\.[0-9a-f]{12}\.[A-Za-z0-9]+$')
+RANGE = re.compile(r'^bytes=(\d*)-(\d*)$')
+# (Content-Encoding, fayl qo'shimchasi) - afzallik tartibida
+ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+mimetypes.add_type('application/vnd.apple.mpegurl', '.m3u8')
+mimetypes.add_type('video/mp2t', '.ts')
+mimetypes.add_type('image/webp', '.webp')
+mimetypes.add_type('text/javascript', '.js')
+
+
+class Response:
+    def __init__(self, status, headers=(), path=None, offset=0, length=0):
+        self.status = status
+        self.headers = list(headers)
+        self.path = path
+        self.offset = offset
+        self.length = length
+
+
+def url_prefix(url):
+    return '/' + url.strip('/') + '/'
+
+
+def parse_range(header, size):
+    """
+    Bitta "bytes=a-b" oraliq. Returns: (boshlanish, uzunlik), qanoatlantirib bo'lmasa None;
+    tushunarsiz yoki bir nechta oraliq uchun (0, size) - butun fayl 200 bilan beriladi.
+    """
+    match = RANGE.match(header.strip())
+    if not match or match.groups() == ('', ''):
+        return 0, size
+    start, end = match.groups()
+    if not start:
+        length = min(int(end), size)
+        return (size - length, length) if length else None
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or end < start:
+        return None
+    return start, end - start + 1
+
+
+def content_type(name):
+    value = mimetypes.guess_type(name)[0] or 'application/octet-stream'
+    if value.startswith('text/') or value == 'application/json':
+        value += '; charset=utf-8'
+    return value
+
+
+def choose_encoding(filename, headers):
+    """Oldindan siqilgan variant; Range faqat asl (siqilmagan) faylga qo'llanadi."""
+    if 'range' in headers:
+        return None
+    accepted = headers.get('accept-encoding', '')
+    return next((encoding for encoding, suffix in ENCODINGS
+                 if encoding in accepted and os.path.isfile(filename + suffix)), None)
+
+
+class StaticFiles:
+    """So'rovni fayl javobiga aylantiradi; WSGI/ASGI adapterlari uchun umumiy mantiq."""
+
+    def __init__(self, immutable_prefixes=()):
+        self.roots = [
+            (url_prefix(settings.STATIC_URL), settings.STATIC_ROOT, ()),
+            (url_prefix(settings.MEDIA_URL), settings.MEDIA_ROOT, tuple(immutable_prefixes)),
+        ]
+
+    def match(self, path):
+        for prefix, root, immutable_prefixes in self.roots:
+            if root and path.startswith(prefix):
+                return root, path[len(prefix):], immutable_prefixes
+        return None
+
+    def resolve(self, method, path, headers):
+        """headers: kichik harfli nomlar lug'ati. Returns: Response yoki None (Django ga o'tkaziladi)."""
+        matched = self.match(path)
+        if matched is None:
+            return None
+        root, name, immutable_prefixes = matched
+        if method not in ('GET', 'HEAD'):
+            return Response(405, [('Allow', 'GET, HEAD')])
+
+        name = unquote(name)
+        root = os.path.realpath(root)
+        filename = os.path.realpath(os.path.join(root, name))
+        if not filename.startswith(root + os.sep) or not os.path.isfile(filename):
+            return Response(404, [('Content-Type', 'text/plain')])
+
+        immutable = HASHED_NAME.search(name) or name.startswith(immutable_prefixes)
+
+        encoding = choose_encoding(filename, headers)
+        if encoding:
+            filename += dict(ENCODINGS)[encoding]
+
+        stat = os.stat(filename)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+        last_modified = formatdate(stat.st_mtime, usegmt=True)
+        cache_control = (f'public, max-age={IMMUTABLE_MAX_AGE}, immutable' if immutable
+                         else f'public, max-age={settings.STATIC_MAX_AGE}')
+        common = [
+            ('ETag', etag),
+            ('Last-Modified', last_modified),
+            ('Cache-Control', cache_control),
+            ('Vary', 'Accept-Encoding'),
+        ]
+        if self.not_modified(headers, etag, stat.st_mtime):
+            return Response(304, common)
+
+        common += [('Content-Type', content_type(name)), ('Accept-Ranges', 'bytes')]
+        if encoding:
+            common.append(('Content-Encoding', encoding))
+
+        start, length = 0, stat.st_size
+        if 'range' in headers and headers.get('if-range', etag) in (etag, last_modified):
+            byte_range = parse_range(headers['range'], stat.st_size)
+            if byte_range is None:
+                return Response(416, common + [('Content-Range', f'bytes */{stat.st_size}')])
+            start, length = byte_range
+        if (start, length) != (0, stat.st_size):
+            return Response(206, common + [
+                ('Content-Range', f'bytes {start}-{start + length - 1}/{stat.st_size}'),
+                ('Content-Length', str(length)),
+            ], filename, start, length)
+        return Response(200, common + [('Content-Length', str(length))], filename, 0, length)
+
+    @staticmethod
+    def not_modified(headers, etag, mtime):
+        if 'if-none-match' in headers:
+            tags = [tag.strip() for tag in headers['if-none-match'].split(',')]
+            return etag in tags or '*' in tags
+        if 'if-modified-since' in headers:
+            try:
+                return int(mtime) <= parsedate_to_datetime(headers['if-modified-since']).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+
+def read_chunks(path, offset, length):
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        while length > 0:
+            chunk = f.read(min(CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def immutable_media_prefixes():
+    from apps.services.images import DERIVED_DIR
+    from apps.services.transcoding import RENDITIONS_DIR
+
+    return f'{DERIVED_DIR}/', f'{RENDITIONS_DIR}/'
+
+
+STATUS_TEXT = {200: 'OK', 206: 'Partial Content', 304: 'Not Modified', 404: 'Not Found',
+               405: 'Method Not Allowed', 416: 'Range Not Satisfiable'}
+
+
+class ServeStaticWSGI:
+    def __init__(self, application):
+        self.application = application
+        self.files = StaticFiles(immutable_media_prefixes())
+
+    def __call__(self, environ, start_response):
+        headers = {key[5:].replace('_', '-').lower(): value for key, value in environ.items()
+                   if key.startswith('HTTP_')}
+        response = self.files.resolve(environ['REQUEST_METHOD'], environ.get('PATH_INFO', ''), headers)
+        if response is None:
+            return self.application(environ, start_response)
+
+        start_response(f'{response.status} {STATUS_TEXT[response.status]}', response.headers)
+        if response.path is None or environ['REQUEST_METHOD'] == 'HEAD':
+            return [b'']
+        file_wrapper = environ.get('wsgi.file_wrapper')
+        if file_wrapper and response.status == 200:
+            # Server sendfile ishlatishi mumkin
+            return file_wrapper(open(response.path, 'rb'), CHUNK_SIZE)
+        return read_chunks(response.path, response.offset, response.length)
+
+
+class ServeStaticASGI:
+    def __init__(self, application):
+        self.application = application
+        self.files = StaticFiles(immutable_media_prefixes())
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.application(scope, receive, send)
+        headers = {key.decode('latin-1').lower(): value.decode('latin-1') for key, value in scope['headers']}
+        response = self.files.resolve(scope['method'], scope['path'], headers)
+        if response is None:
+            return await self.application(scope, receive, send)
+
+        await send({
+            'type': 'http.response.start',
+            'status': response.status,
+            'headers': [(key.lower().encode(), value.encode('latin-1')) for key, value in response.headers],
+        })
+        if response.path is None or scope['method'] == 'HEAD':
+            return await send({'type': 'http.response.body', 'body': b''})
+        chunks = read_chunks(response.path, response.offset, response.length)
+        # Disk o'qish event loop ni to'xtatmasligi uchun thread da
+        while chunk := await asyncio.to_thread(next, chunks, None):
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        await send({'type': 'http.response.body', 'body': b''})
@@ -1,5 +1,16 @@
-from apps.models import UserProfile
-from django.db.models.signals import post_save
+from apps.models import Edition, Exercise, ExerciseInstruction, Payment, Program, Subscription, UserProfile, Workout
+from apps.models.my_trainer import WorkoutSession
+from apps.models.workouts import WorkoutExercise
+from apps.services import record_activity, record_session
+from apps.services.cache import bump_namespace
+from apps.services.catalog import reset_catalog_index
+from apps.services.entitlements import invalidate_entitlements
+from apps.services.images import IMAGE_FIELDS, enqueue_images
+from apps.services.search import reset_trigram_index
+from apps.services.workout_cache import invalidate_workout
+from django.db import transaction
+from django.apps import apps
+from django.db.models.signals import post_delete, post_init, post_save, pre_save
 from django.dispatch import receiver
 from root import settings
 
@@ -13,3 +24,87 @@ def create_user_profile(sender, instance, created, **kwargs):
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def save_user_profile(sender, instance, **kwargs):
     UserProfile.objects.get_or_create(user=instance)
+
+
+@receiver(post_save, sender=WorkoutSession)
+def update_streak_on_session(sender, instance, **kwargs):
+    if instance.status != WorkoutSession.StatusChoices.COMPLETED:
+        return
+    if getattr(instance, '_loaded_status', None) != instance.status:
+        record_session(instance)
+        instance._loaded_status = instance.status
+    record_activity(instance.user, instance.started_at)
+
+
+@receiver([post_save, post_delete], sender=Program)
+@receiver([post_save, post_delete], sender=Edition)
+def invalidate_programs(sender, instance, **kwargs):
+    bump_namespace('programs')
+
+
+@receiver([post_save, post_delete], sender=Workout)
+def invalidate_workout_payload(sender, instance, **kwargs):
+    invalidate_workout(instance.pk)
+    bump_namespace('programs')
+
+
+@receiver([post_save, post_delete], sender=WorkoutExercise)
+def invalidate_workout_exercise_payload(sender, instance, **kwargs):
+    invalidate_workout(instance.workout_id)
+
+
+@receiver([post_save, post_delete], sender=Exercise)
+@receiver([post_save, post_delete], sender=ExerciseInstruction)
+def invalidate_catalog(sender, instance, **kwargs):
+    bump_namespace('catalog')
+    reset_catalog_index()
+    reset_trigram_index()
+
+
+@receiver([post_save, post_delete], sender=Subscription)
+def invalidate_subscription_entitlement(sender, instance, **kwargs):
+    transaction.on_commit(lambda: invalidate_entitlements([instance.user_id]))
+
+
+@receiver(post_save, sender=Payment)
+def invalidate_payment_entitlement(sender, instance, **kwargs):
+    if instance.status == Payment.PaymentStatus.COMPLETED:
+        transaction.on_commit(lambda: invalidate_entitlements([instance.user_id]))
+
+
+def image_fields(sender):
+    return [field for label, field, _ in IMAGE_FIELDS if label == sender._meta.label]
+
+
+def remember_images(sender, instance, **kwargs):
+    # Bazadan o'qilgan nomlar: from_db da __dict__ da hali satr, saqlangandan keyin FieldFile
+    instance._loaded_images = {
+        field: getattr(instance.__dict__.get(field), 'name', instance.__dict__.get(field))
+        for field in image_fields(sender)
+    }
+
+
+def image_uploaded(sender, instance, **kwargs):
+    # Yangi yuklangan fayl FileField.pre_save gacha commit qilinmagan yoki nomi o'zgargan bo'ladi
+    loaded = getattr(instance, '_loaded_images', {})
+    instance._uploaded_images = []
+    for field in image_fields(sender):
+        if field not in instance.__dict__:
+            continue
+        image = getattr(instance, field)
+        if image and (not image._committed or image.name != loaded.get(field)):
+            instance._uploaded_images.append(field)
+
+
+def enqueue_uploaded_images(sender, instance, **kwargs):
+    sources = [getattr(instance, field).name for field in getattr(instance, '_uploaded_images', ())]
+    if sources:
+        transaction.on_commit(lambda: enqueue_images(sources))
+    remember_images(sender, instance)
+
+
+for model_label in dict.fromkeys(label for label, _, _ in IMAGE_FIELDS):
+    image_model = apps.get_model(model_label)
+    post_init.connect(remember_images, sender=image_model, dispatch_uid=f'image_loaded:{model_label}')
+    pre_save.connect(image_uploaded, sender=image_model, dispatch_uid=f'image_uploaded:{model_label}')
+    post_save.connect(enqueue_uploaded_images, sender=image_model, dispatch_uid=f'image_enqueue:{model_label}')
@@ -0,0 +1,48 @@
+"""
+collectstatic uchun storage: ManifestStaticFilesStorage kontent hash li nomlarni yozadi, keyin matnli
+fayllarning oldindan siqilgan .gz (va brotli o'rnatilgan bo'lsa .br) nusxalari yaratiladi - apps.serving
+ularni Accept-Encoding bo'yicha beradi, har so'rovda siqish kerak emas.
+"""
+import gzip
+import os
+
+from django.contrib.staticfiles.storage import ManifestStaticFilesStorage
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE = ('.css', '.js', '.mjs', '.json', '.svg', '.html', '.txt', '.xml', '.map', '.m3u8', '.ico')
+# Bundan kichik fayllarda siqish foyda bermaydi
+MIN_SIZE = 1024
+
+
+def compressors():
+    yield '.gz', lambda data: gzip.compress(data, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield '.br', lambda data: brotli.compress(data, quality=11)
+
+
+class CompressedManifestStaticFilesStorage(ManifestStaticFilesStorage):
+    def post_process(self, paths, dry_run=False, **options):
+        yield from super().post_process(paths, dry_run, **options)
+        if dry_run:
+            return
+        # Hash li nomlar ham, asl nomdagi nusxalar ham
+        for name in {*paths, *self.hashed_files.values()}:
+            path = self.path(name)
+            if name.endswith(COMPRESSIBLE) and os.path.isfile(path):
+                self.compress(path)
+
+    @staticmethod
+    def compress(path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if len(data) < MIN_SIZE:
+            return
+        for suffix, compress in compressors():
+            compressed = compress(data)
+            if len(compressed) < len(data):
+                with open(path + suffix, 'wb') as f:
+                    f.write(compressed)
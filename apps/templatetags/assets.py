@@ -0,0 +1,19 @@
+from django import template
+from django.templatetags.static import static
+from django.utils.html import format_html
+
+from apps.assets import bundle_path
+
+register = template.Library()
+
+
+@register.simple_tag
+def css_bundle(name):
+    """{% css_bundle 'exercises/exercise_list' %} -> assets/css/exercises/exercise_list.css ning hash li build i."""
+    return format_html('<link rel="stylesheet" href="{}">', static(bundle_path(name, 'css')))
+
+
+@register.simple_tag
+def js_bundle(name):
+    """Inline <script> o'rnida - bajarilish tartibi o'zgarmaydi (defer yo'q)."""
+    return format_html('<script src="{}"></script>', static(bundle_path(name, 'js')))
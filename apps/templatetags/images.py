@@ -0,0 +1,78 @@
+from django import template
+from django.utils.html import format_html, format_html_join
+
+from apps.services.images import derivative_sets
+
+register = template.Library()
+
+CONTEXT_KEY = 'image_derivatives'
+
+
+def resolve_images(obj, attrs):
+    """Nuqtali yo'l bo'yicha rasmlar; yo'ldagi related manager lar (prefetch qilingan) aylanib chiqiladi."""
+    if not attrs:
+        if obj:
+            yield obj
+        return
+    value = getattr(obj, attrs[0], None)
+    if hasattr(value, 'all'):
+        for item in value.all():
+            yield from resolve_images(item, attrs[1:])
+    else:
+        yield from resolve_images(value, attrs[1:])
+
+
+@register.simple_tag(takes_context=True)
+def preload_images(context, *pairs):
+    """
+    Ro'yxat sahifalarida: {% preload_images exercises 'thumbnail' collections 'favorites.exercise.thumbnail' %} -
+    barcha rasmlarning derivative lari bitta cache.get_many (va kerak bo'lsa bitta so'rov) bilan olinadi,
+    keyingi {% responsive_image %} lar ularni qayta so'ramaydi.
+    """
+    known = context.render_context.setdefault(CONTEXT_KEY, {})
+    sources = []
+    for objects, field in zip(pairs[::2], pairs[1::2]):
+        for obj in objects:
+            sources += [image.name for image in resolve_images(obj, field.split('.')) if image.name not in known]
+    known.update(derivative_sets(sources))
+    return ''
+
+
+def srcset(items):
+    return ', '.join(f'{url} {width}w' for width, url in items)
+
+
+@register.simple_tag(takes_context=True)
+def responsive_image(context, image, alt='', css_class='', sizes='100vw', loading='lazy', fallback='', **attrs):
+    """
+    <picture> da WebP va JPEG srcset; derivative lari hali tayyor bo'lmasa asl rasm.
+    {% responsive_image exercise.thumbnail alt=exercise.name css_class="exercise-image" sizes="50vw" %}
+    """
+    extra = format_html_join('', ' {}="{}"', ((key.replace('_', '-'), value) for key, value in attrs.items()))
+    if not image:
+        if not fallback:
+            return ''
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}"{}>', fallback, alt, css_class, loading, extra,
+        )
+
+    known = context.render_context.setdefault(CONTEXT_KEY, {})
+    if image.name not in known:
+        known.update(derivative_sets([image.name]))
+    variants = known[image.name]
+
+    jpeg = variants.get('jpeg')
+    if not jpeg:
+        return format_html(
+            '<img src="{}" alt="{}" class="{}" loading="{}" decoding="async"{}>',
+            image.url, alt, css_class, loading, extra,
+        )
+    webp = format_html(
+        '<source type="image/webp" srcset="{}" sizes="{}">', srcset(variants['webp']), sizes,
+    ) if variants.get('webp') else ''
+    # display: contents - <picture> o'rab olgani sahifa joylashuviga (flex/grid) ta'sir qilmaydi
+    return format_html(
+        '<picture style="display: contents">{}<img src="{}" srcset="{}" sizes="{}" alt="{}" class="{}" '
+        'loading="{}" decoding="async"{}></picture>',
+        webp, jpeg[-1][1], srcset(jpeg), sizes, alt, css_class, loading, extra,
+    )
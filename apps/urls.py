@@ -5,7 +5,9 @@ from apps.views import (
     AnimationView,
     EditionDetailView,
     ExerciseDetailView,
+    ExercisesByMuscleAPIView,
     ExercisesByMuscleView,
+    ExerciseSearchAPIView,
     FavoritesListView,
     MuscleGroupListView,
     MyTrainerDetailView,
@@ -24,11 +26,20 @@ from apps.views import (
     WorkoutStartView,
 )
 from apps.views.favorite import FavoriteToggleAPIView, CreateCollectionView
-from apps.views.payments import PaymentHistoryListView, ManageSubscriptionListView, PremiumPageView
+from apps.views.payments import (
+    ClickCompleteAPIView,
+    ClickPrepareAPIView,
+    ManageSubscriptionListView,
+    PaymentHistoryListView,
+    PremiumPageView,
+)
+from apps.views.profiling import ProfilingReportAPIView
 from apps.views.users import AdminPageView, ChangeLanguageView
 
 urlpatterns = [
     path('exercises/', MuscleGroupListView.as_view(), name='muscle_groups'),
+    path('api/exercises/search/', ExerciseSearchAPIView.as_view(), name='exercise_search'),
+    path('api/exercises/muscle/<str:muscle>/', ExercisesByMuscleAPIView.as_view(), name='api_exercises_by_muscle'),
     path('exercises/<str:muscle>/', ExercisesByMuscleView.as_view(), name='exercises_by_muscle'),
     path('exercises/detail/<int:exercise_id>/', ExerciseDetailView.as_view(), name='exercise_detail'),
     path('exercises/favorite/toggle/<int:exercise_id>/', ToggleFavoriteView.as_view(), name='toggle_favorite'),
@@ -68,4 +79,9 @@ urlpatterns = [
     path('payment/history/', PaymentHistoryListView.as_view(), name='payment_history'),
 
     path('premium/', PremiumPageView.as_view(), name='premium_page'),
+
+    path('payment/click/prepare/', ClickPrepareAPIView.as_view(), name='click_prepare'),
+    path('payment/click/complete/', ClickCompleteAPIView.as_view(), name='click_complete'),
+
+    path('api/profiling/', ProfilingReportAPIView.as_view(), name='profiling_report'),
 ]
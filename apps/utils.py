@@ -1,6 +1,7 @@
-from apps.bot.bot import bot
+from apps.bot.outbox import enqueue_message
 
 
 def bot_send_message(_id: str | int, msg: str) -> bool:
-    bot.send_message(_id, msg)
+    """Xabarni outboxga yozadi va darhol qaytadi - yuborishni drain_outbox bajaradi."""
+    enqueue_message(_id, msg)
     return True
@@ -1,4 +1,10 @@
-from apps.views.exercises import ExerciseDetailView, ExercisesByMuscleView, MuscleGroupListView
+from apps.views.exercises import (
+    ExerciseDetailView,
+    ExercisesByMuscleAPIView,
+    ExercisesByMuscleView,
+    ExerciseSearchAPIView,
+    MuscleGroupListView,
+)
 from apps.views.favorite import FavoritesListView, ToggleFavoriteView
 from apps.views.users import (
     OnboardingView,
@@ -1,7 +1,22 @@
-from apps.models import Exercise, Favorite
+import hashlib
+
+from apps.mixins import ConditionalGetMixin
+from apps.models import Exercise
 from apps.models.exercises import MuscleGroup
+from apps.pagination import KeysetPagination
+from apps.serializers import ExerciseSearchResultSerializer, ExerciseSerializer
+from apps.services.cache import namespace_version
+from apps.services.catalog import exercises_for_muscle, favorite_ids, get_catalog_index, sort_key
+from apps.services.search import search_exercises
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Count
+from django.utils.http import parse_etags, quote_etag
 from django.views.generic import DetailView, ListView, TemplateView
+from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 from apps.models.my_trainer import WorkoutSession
 
@@ -19,43 +34,43 @@ class MuscleGroupListView(TemplateView):
 
 
 class ExercisesByMuscleView(ListView):
-    queryset = Exercise.objects.order_by('name')
     template_name = 'exercises/exercise_list.html'
     context_object_name = 'exercises'
 
     def get_queryset(self):
-        qs = super().get_queryset()
-        muscle_name = self.kwargs['muscle']
-        qs = qs.filter(primary_body_part__iexact=muscle_name)
-        self.muscle = muscle_name
-        return qs
+        self.muscle = self.kwargs['muscle']
+        return exercises_for_muscle(self.muscle)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['muscle'] = self.muscle.capitalize()
+        favorites = favorite_ids(self.request)
+        for exercise in context['exercises']:
+            exercise.is_favorited = exercise.id in favorites
+
         user = self.request.user
         try:
             user_profile = user.profile
         except AttributeError:
             user_profile = None
         if user_profile:
-            exercise_ids = [exercise.id for exercise in context['exercises']]
-            favorite_ids = Favorite.objects.filter(user=user_profile, exercise_id__in=exercise_ids).values_list(
-                'exercise_id', flat=True)
-            for exercise in context['exercises']:
-                exercise.is_favorited = exercise.id in favorite_ids
-            context['collections'] = user_profile.favorite_collections.all()
-        else:
-            for exercise in context['exercises']:
-                exercise.is_favorited = False
+            context['collections'] = user_profile.favorite_collections.annotate(favorites_count=Count('favorites'))
         return context
 
 
-class ExerciseDetailView(LoginRequiredMixin, DetailView):
+class ExerciseDetailView(LoginRequiredMixin, ConditionalGetMixin, DetailView):
     model = Exercise
     template_name = 'exercises/exercise_detail.html'
     context_object_name = 'exercise'
     pk_url_kwarg = 'exercise_id'
+    conditional_namespaces = ('catalog',)
+
+    def get_conditional_querysets(self):
+        return [Exercise.objects.filter(pk=self.kwargs['exercise_id'])]
+
+    def get_conditional_user_state(self):
+        is_favorited = self.kwargs['exercise_id'] in favorite_ids(self.request)
+        return f"{self.request.user.pk}:{int(is_favorited)}"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -72,16 +87,81 @@ class ExerciseDetailView(LoginRequiredMixin, DetailView):
                     final_instructions_list.extend(lines)
 
         context['instructions_list'] = final_instructions_list
-        user = self.request.user
-        try:
-            user_profile = user.profile
-        except AttributeError:
-            user_profile = None
-        if user_profile:
-            context['is_favorited'] = Favorite.objects.filter(user=user_profile, exercise=self.object).exists()
-        else:
-            context['is_favorited'] = False
+        context['is_favorited'] = self.object.id in favorite_ids(self.request)
         return context
 
 
+class ExerciseSearchAPIView(APIView):
+    permission_classes = [AllowAny]
+    max_page_size = 50
+
+    def get(self, request):
+        query = request.query_params.get('q', '').strip()
+        if not query:
+            return Response({'success': False, 'error': "q parametri bo'sh"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            page = max(int(request.query_params.get('page', 1)), 1)
+            page_size = min(max(int(request.query_params.get('page_size', 20)), 1), self.max_page_size)
+        except ValueError:
+            return Response({'success': False, 'error': "page noto'g'ri"}, status=status.HTTP_400_BAD_REQUEST)
+
+        result = search_exercises(
+            query,
+            muscle=request.query_params.get('muscle'),
+            difficulty=request.query_params.get('difficulty'),
+            page=page,
+            page_size=page_size,
+        )
+        result['results'] = ExerciseSearchResultSerializer(result['results'], many=True).data
+        return Response(result)
+
+
+class ExercisesByMuscleAPIView(APIView):
+    """
+    Mushak guruhi bo'yicha mashqlar: (name, id) cursor pagination, ?fields= va ETag.
+    Sahifa faqat katalog versiyasi va so'rov parametrlariga bog'liq, shuning uchun
+    o'zgarmagan sahifa uchun 304 katalogni o'qimasdan qaytariladi.
+    """
+    permission_classes = [AllowAny]
+
+    def get_fields(self, request):
+        fields = request.query_params.get('fields')
+        if not fields:
+            return None
+        requested = [name.strip() for name in fields.split(',') if name.strip()]
+        unknown = set(requested) - set(ExerciseSerializer.Meta.fields)
+        if unknown:
+            raise ValidationError({'fields': f"Noma'lum maydonlar: {', '.join(sorted(unknown))}"})
+        return requested
+
+    def get_etag(self, muscle, request, fields):
+        pagination = KeysetPagination(sort_key)
+        raw = '|'.join((
+            namespace_version('catalog'),
+            muscle,
+            request.query_params.get(pagination.cursor_query_param, ''),
+            str(pagination.get_page_size(request)),
+            ','.join(fields or ()),
+        ))
+        return quote_etag(hashlib.md5(raw.encode()).hexdigest())
+
+    def get(self, request, muscle):
+        muscle = muscle.lower()
+        fields = self.get_fields(request)
+        etag = self.get_etag(muscle, request, fields)
+
+        if_none_match = request.headers.get('If-None-Match')
+        if if_none_match and (if_none_match.strip() == '*' or etag in parse_etags(if_none_match)):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            page, next_cursor = KeysetPagination(sort_key).paginate(get_catalog_index().for_muscle(muscle), request)
+            response = Response({
+                'muscle': muscle,
+                'next_cursor': next_cursor,
+                'results': ExerciseSerializer(page, many=True, fields=fields).data,
+            })
 
+        response['ETag'] = etag
+        response['Cache-Control'] = 'public, max-age=0, must-revalidate'
+        return response
@@ -1,5 +1,6 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import transaction
+from django.db.models import Count, Prefetch
 from django.http import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.views import View
@@ -23,7 +24,13 @@ class FavoritesListView(LoginRequiredMixin, ListView):
         context = super().get_context_data(**kwargs)
         user_profile = self.request.user.profile
         context['total_count'] = Favorite.objects.filter(user=user_profile).count()
-        context['favorite_collections'] = FavoriteCollection.objects.filter(user=user_profile).order_by('-created_at')
+        context['favorite_collections'] = (
+            FavoriteCollection.objects
+            .filter(user=user_profile)
+            .annotate(favorites_count=Count('favorites'))
+            .prefetch_related(Prefetch('favorites', queryset=Favorite.objects.select_related('exercise')))
+            .order_by('-created_at')
+        )
         context['collections_count'] = context['favorite_collections'].count()
         context['all_exercises'] = [fav.exercise for fav in self.get_queryset()]
         return context
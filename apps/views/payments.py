@@ -1,16 +1,43 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
 from django.views.generic import ListView, TemplateView
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from apps.click_merchant import ClickMerchant
 from apps.models import Payment
 
 
-class PaymentHistoryListView(ListView):
+class PaymentHistoryListView(LoginRequiredMixin, ListView):
     model = Payment
     template_name = 'users/payment_history.html'
     context_object_name = 'payment_history'
 
+    def get_queryset(self):
+        return Payment.objects.filter(user__user=self.request.user).order_by('-created_at')
+
 
 class ManageSubscriptionListView(TemplateView):
     template_name = 'users/manage_subscription.html'
 
 class PremiumPageView(TemplateView):
-    template_name = 'users/../../templates/premium.html'
\ No newline at end of file
+    template_name = 'users/../../templates/premium.html'
+
+
+class ClickCallbackAPIView(APIView):
+    """Click PREPARE (action=0) va COMPLETE (action=1) callbacklari - form-urlencoded POST."""
+    authentication_classes = []
+    permission_classes = [AllowAny]
+    handler = None
+
+    def post(self, request, *args, **kwargs):
+        params = request.data.dict() if hasattr(request.data, 'dict') else dict(request.data)
+        return Response(getattr(ClickMerchant(), self.handler)(params))
+
+
+class ClickPrepareAPIView(ClickCallbackAPIView):
+    handler = 'prepare'
+
+
+class ClickCompleteAPIView(ClickCallbackAPIView):
+    handler = 'complete'
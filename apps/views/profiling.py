@@ -0,0 +1,27 @@
+from rest_framework import status
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from apps.services.profiling import PERCENTILES, endpoint_report, flush_samples
+
+
+class ProfilingReportAPIView(APIView):
+    """RequestProfilingMiddleware namunalari bo'yicha endpointlar percentillari (faqat staff)."""
+    permission_classes = [IsAdminUser]
+    order_fields = tuple(f'p{q}' for q in PERCENTILES) + ('max', 'requests', 'sql_count_avg')
+
+    def get(self, request):
+        order_by = request.query_params.get('order', 'p95')
+        try:
+            hours = max(int(request.query_params.get('hours', 24)), 1)
+        except ValueError:
+            return Response({'success': False, 'error': "hours noto'g'ri"}, status=status.HTTP_400_BAD_REQUEST)
+        if order_by not in self.order_fields:
+            return Response({'success': False, 'error': "order noto'g'ri"}, status=status.HTTP_400_BAD_REQUEST)
+
+        flush_samples()
+        return Response({
+            'hours': hours,
+            'endpoints': endpoint_report(hours, request.query_params.get('url_name'), order_by),
+        })
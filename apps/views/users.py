@@ -3,12 +3,14 @@ import traceback
 import requests
 from apps.forms import UserProfileForm
 from apps.models import User, UserMotivation, UserProfile, Subscription
+from apps.services import chart_bars, get_user_stats, humanize_duration, humanize_number
 from apps.utils import bot_send_message
 from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.files.base import ContentFile
+from django.db import transaction
 from django.http import HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.urls import reverse, reverse_lazy
@@ -103,33 +105,35 @@ class QuestionnaireSubmitAPIView(APIView):
 
         try:
 
-            user, is_new = self.get_or_update_user(
-                telegram_id,
-                data.get('first_name', 'User'),
-                data.get('last_name', '')
-            )
-
-            profile = self.create_or_update_profile(user, data)
-
-            self.save_motivations(profile, data.get('motivation', []))
-
-            login(request, user)
-            bot_send_message(
-                telegram_id,
-                "🎉 **Ro‘yxatdan o‘tish muvaffaqiyatli yakunlandi!** 🎉\n\n"
-                "Sizning ma’lumotlaringiz saqlandi:\n"
-                "━━━━━━━━━━━━━━━━━━━\n"
-                f"👤 Foydalanuvchi: {self.request.user.profile.name}\n"
-                f"🆔 ID: {self.request.user.id}\n"
-                "━━━━━━━━━━━━━━━━━━━\n\n"
-                "💪 **Endi siz bizning Fitness Platformamizning to‘liq a’zosiz!**\n"
-                "Sizga quyidagilar ochildi:\n"
-                "• 🏋️‍♂️ Shaxsiy mashg‘ulotlar\n"
-                "• 📅 Kunlik darslar rejalari\n"
-                "• 🍎 Sog‘lom ovqatlanish bo‘yicha maslahatlar\n"
-                "• 📊 Progress kuzatuv statistikasi\n\n"
-                "🔥 *Bugun boshlang — ertangi kuningizni kuchliroq qiling!* 🏆"
-            )
+            # Xabar outboxga shu tranzaksiyada yoziladi - foydalanuvchi saqlanmasa yuborilmaydi
+            with transaction.atomic():
+                user, is_new = self.get_or_update_user(
+                    telegram_id,
+                    data.get('first_name', 'User'),
+                    data.get('last_name', '')
+                )
+
+                profile = self.create_or_update_profile(user, data)
+
+                self.save_motivations(profile, data.get('motivation', []))
+
+                login(request, user)
+                bot_send_message(
+                    telegram_id,
+                    "🎉 **Ro‘yxatdan o‘tish muvaffaqiyatli yakunlandi!** 🎉\n\n"
+                    "Sizning ma’lumotlaringiz saqlandi:\n"
+                    "━━━━━━━━━━━━━━━━━━━\n"
+                    f"👤 Foydalanuvchi: {self.request.user.profile.name}\n"
+                    f"🆔 ID: {self.request.user.id}\n"
+                    "━━━━━━━━━━━━━━━━━━━\n\n"
+                    "💪 **Endi siz bizning Fitness Platformamizning to‘liq a’zosiz!**\n"
+                    "Sizga quyidagilar ochildi:\n"
+                    "• 🏋️‍♂️ Shaxsiy mashg‘ulotlar\n"
+                    "• 📅 Kunlik darslar rejalari\n"
+                    "• 🍎 Sog‘lom ovqatlanish bo‘yicha maslahatlar\n"
+                    "• 📊 Progress kuzatuv statistikasi\n\n"
+                    "🔥 *Bugun boshlang — ertangi kuningizni kuchliroq qiling!* 🏆"
+                )
 
             return Response({
                 'success': True,
@@ -251,24 +255,24 @@ class ProgressView(LoginRequiredMixin, TemplateView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         profile, _ = UserProfile.objects.get_or_create(user=self.request.user)
+        stats = get_user_stats(profile)
+        weeks = [start.strftime('%d.%m') for start in stats['week_starts']]
         context.update({
             'profile': profile,
-            'total_workouts': 24,
-            'total_calories': "5.2k",
-            'total_weight': "8.5k",
-            'total_time': "18h",
-            'weekly_activity': [3, 5, 2, 6, 4, 7, 3],
+            'charts': [
+                ('Workouts', chart_bars(stats['weekly_activity'], ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun'])),
+                ('Volume', chart_bars(stats['volume_trend'], weeks)),
+                ('Max weight', chart_bars(stats['weight_trend'], weeks)),
+            ],
+            'total_workouts': stats['total_workouts'],
+            'total_calories': humanize_number(stats['total_calories']),
+            'total_weight': humanize_number(stats['total_volume']),
+            'total_time': humanize_duration(stats['total_duration_seconds']),
+            'weekly_activity': stats['weekly_activity'],
+            'volume_trend': stats['volume_trend'],
+            'weight_trend': stats['weight_trend'],
             'current_weight': profile.weight,
-            'weight_change': -2.5,
-            'muscle_mass': {'current': 45.2, 'change': 1.8},
-            'body_fat': {'current': 18.5, 'change': -2.1},
-            'recent_workouts': [
-                {'title': 'Upper Body Blast', 'date': 'Today, 10:30 AM', 'exercises': 12, 'duration': 45,
-                 'calories': 320},
-                {'title': 'Leg Day', 'date': 'Yesterday, 6:00 PM', 'exercises': 10, 'duration': 52, 'calories': 410},
-                {'title': 'Core & Cardio', 'date': '2 days ago, 7:30 AM', 'exercises': 8, 'duration': 38,
-                 'calories': 280},
-            ]
+            'recent_workouts': stats['recent_workouts'],
         })
         return context
 
@@ -1,13 +1,14 @@
-from datetime import timedelta
-
+from apps.mixins import CacheVersionMixin, ConditionalGetMixin
 from apps.models import Edition, Program
 from apps.models.my_trainer import WorkoutSession
-from apps.models.workouts import Workout, WorkoutExercise, WorkoutProgress
+from apps.models.workouts import Workout, WorkoutExercise
+from apps.services import get_current_streak, get_user_stats, record_progress
+from apps.services.cache import get_or_set
+from apps.services.workout_cache import get_workout_payload
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models.aggregates import Sum
+from django.db.models import Count
 from django.http import HttpResponseBadRequest
 from django.shortcuts import get_object_or_404, redirect, render
-from django.utils import timezone
 from django.views import View
 from django.views.generic import DetailView, ListView, TemplateView
 
@@ -16,10 +17,23 @@ class AnimationView(TemplateView):
     template_name = 'animation.html'
 
 
-class ProgramListView(ListView):
-    queryset = Program.objects.filter(is_active=True).prefetch_related('editions')
+class ProgramListView(ConditionalGetMixin, CacheVersionMixin, ListView):
+    queryset = (
+        Program.objects
+        .filter(is_active=True)
+        .annotate(workouts_count=Count('editions__workouts'))
+        .prefetch_related('editions')
+    )
     template_name = 'workouts/program_list.html'
     context_object_name = 'programs'
+    cache_namespaces = ('programs',)
+    conditional_namespaces = ('programs',)
+
+    def get_conditional_querysets(self):
+        return [
+            Program.objects.filter(is_active=True),
+            Workout.objects.filter(edition__program__is_active=True),
+        ]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -28,7 +42,7 @@ class ProgramListView(ListView):
 
         workouts = Workout.objects.filter(edition__in=editions).prefetch_related("workout_exercises")
 
-        total_days = workouts.values('day_number').distinct().count()
+        total_days = get_or_set('programs', ('total_days',), lambda: workouts.values('day_number').distinct().count())
 
         context['workouts'] = workouts
         context['total_days'] = total_days
@@ -39,10 +53,14 @@ class ProgramListView(ListView):
         return context
 
 
-class ProgramDetailView(DetailView):
+class ProgramDetailView(ConditionalGetMixin, DetailView):
     model = Program
     template_name = 'workouts/edition_list.html'
     context_object_name = 'program'
+    conditional_namespaces = ('programs',)
+
+    def get_conditional_querysets(self):
+        return [Program.objects.filter(pk=self.kwargs['pk'])]
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -50,14 +68,24 @@ class ProgramDetailView(DetailView):
         return context
 
 
-class EditionDetailView(DetailView):
+class EditionDetailView(ConditionalGetMixin, DetailView):
     model = Edition
     template_name = 'workouts/edition_detail.html'
     context_object_name = 'edition'
+    conditional_namespaces = ('programs', 'catalog')
+
+    def get_conditional_querysets(self):
+        return [
+            Program.objects.filter(editions=self.kwargs['pk']),
+            Workout.objects.filter(edition_id=self.kwargs['pk']),
+        ]
 
     def get(self, request, *args, **kwargs):
-        if not request.user.profile.is_premium:
-            return redirect('premium_page')
+        entitlement = request.entitlement
+        if not entitlement.is_premium:
+            edition = get_object_or_404(Edition.objects.values('program_id', 'is_premium'), pk=kwargs['pk'])
+            if not entitlement.can_access(edition['program_id'], edition['is_premium']):
+                return redirect('premium_page')
         return super().get(request, *args, **kwargs)
 
     def get_context_data(self, **kwargs):
@@ -80,26 +108,22 @@ class WorkoutStartView(LoginRequiredMixin, View):
     template_name = 'workouts/active_workout.html'
 
     def get(self, request, pk):
-        workout = get_object_or_404(Workout, pk=pk)
-        workout_exercises = (
-            WorkoutExercise.objects
-            .filter(workout=workout)
-            .select_related('exercise')
-            .order_by('order')
-        )
+        payload, hit = get_workout_payload(pk)
 
-        if not workout_exercises.exists():
+        if not payload['exercises']:
             return render(request, 'error_page.html', {
                 "error_message": "Ushbu workoutda mashqlar mavjud emas."
             })
 
-        exercises_data = self._prepare_exercises_data(workout_exercises)
+        exercises_data = payload['exercises']
 
-        return render(request, self.template_name, {
-            "workout": workout,
+        response = render(request, self.template_name, {
+            "workout": payload['workout'],
             "exercises": exercises_data,
             "total_exercises": len(exercises_data)
         })
+        response['X-Cache'] = 'HIT' if hit else 'MISS'
+        return response
 
     def post(self, request, pk):
         action = request.POST.get("action")
@@ -108,9 +132,9 @@ class WorkoutStartView(LoginRequiredMixin, View):
         workout = get_object_or_404(Workout, pk=pk)
 
         if action == "complete":
-            WorkoutProgress.objects.create(
-                user=request.user.profile,
-                workout=workout,
+            record_progress(
+                request.user.profile,
+                workout,
                 total_duration_seconds=int(request.POST.get("total_duration", 0)),
                 total_calories=float(request.POST.get("total_calories", 0)),
                 exercises_completed=int(request.POST.get("exercises_completed", 0))
@@ -118,9 +142,9 @@ class WorkoutStartView(LoginRequiredMixin, View):
             return redirect("workout_complete", pk)
 
         if action == "exit" and save:
-            WorkoutProgress.objects.create(
-                user=request.user.profile,
-                workout=workout,
+            record_progress(
+                request.user.profile,
+                workout,
                 total_duration_seconds=int(request.POST.get("total_duration", 0)),
                 total_calories=float(request.POST.get("total_calories", 0)),
                 exercises_completed=int(request.POST.get("exercises_completed", 0))
@@ -132,28 +156,6 @@ class WorkoutStartView(LoginRequiredMixin, View):
 
         return HttpResponseBadRequest("Invalid request")
 
-    def _prepare_exercises_data(self, workout_exercises):
-        data = []
-        for wex in workout_exercises:
-            exercise = wex.exercise
-
-            is_strength = wex.sets > 0 or wex.reps > 0
-            is_cardio = wex.minutes > 0
-            exercise_type = "cardio" if is_cardio and not is_strength else "strength"
-
-            data.append({
-                "exercise_id": exercise.id,
-                "name": exercise.name,
-                "image": exercise.thumbnail.url if exercise.thumbnail else None,
-                "sets": max(wex.sets, 1),
-                "reps": max(wex.reps, 10),
-                "duration_minutes": wex.minutes,
-                "rest_seconds": getattr(wex, 'rest_seconds', 60),
-                "calories_per_minute": max(exercise.calory, 10),
-                "type": exercise_type,
-            })
-        return data
-
 
 class WorkoutCompleteView(LoginRequiredMixin, View):
     template_name = "workouts/workout_complete.html"
@@ -168,9 +170,9 @@ class WorkoutCompleteView(LoginRequiredMixin, View):
         except (ValueError, TypeError):
             return HttpResponseBadRequest("Invalid input data")
 
-        WorkoutProgress.objects.create(
-            user=request.user.profile,
-            workout=workout,
+        record_progress(
+            request.user.profile,
+            workout,
             total_calories=total_calories,
             total_duration_seconds=total_duration,
             exercises_completed=exercises_completed
@@ -200,57 +202,22 @@ class MyTrainerView(LoginRequiredMixin, TemplateView):
         context = super().get_context_data(**kwargs)
         user = self.request.user.profile
 
-        sessions = WorkoutSession.objects.filter(user=user)
-        completed_sessions = sessions.filter(status='completed')
-
-        total_workouts = completed_sessions.count()
-
-        total_duration = completed_sessions.aggregate(
-            total=Sum('duration_seconds')
-        )['total'] or 0
-
-        total_calories = completed_sessions.aggregate(
-            total=Sum('total_calories')
-        )['total'] or 0
-
+        stats = get_user_stats(user, weeks=1, recent=10)
         current_streak = self.calculate_streak(user)
 
         context['user_stats'] = {
-            'total_workouts': total_workouts,
-            'total_duration_hours': round(total_duration / 3600, 1),
-            'total_calories': int(total_calories),
+            'total_workouts': stats['total_workouts'],
+            'total_duration_hours': round(stats['total_duration_seconds'] / 3600, 1),
+            'total_calories': int(stats['total_calories']),
             'current_streak': current_streak
         }
 
-        recent_workouts = sessions.select_related('workout', 'workout__edition').order_by('-started_at')[:10]
-
-        context['recent_workouts'] = recent_workouts
+        context['recent_workouts'] = stats['recent_workouts']
 
         return context
 
     def calculate_streak(self, user):
-
-        today = timezone.now().date()
-        streak = 0
-        current_date = today
-
-        for _ in range(100):
-            has_workout = WorkoutSession.objects.filter(
-                user=user,
-                started_at__date=current_date,
-                status='completed'
-            ).exists()
-
-            if has_workout:
-                streak += 1
-                current_date -= timedelta(days=1)
-            else:
-
-                if current_date != today:
-                    break
-                current_date -= timedelta(days=1)
-
-        return streak
+        return get_current_streak(user)
 
 
 class MyTrainerDetailView(LoginRequiredMixin, TemplateView):
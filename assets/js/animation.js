@@ -0,0 +1,4 @@
+// 5 soniya → workouts
+setTimeout(() => {
+    window.location.href = "/workout";
+}, 2000);
@@ -0,0 +1,31 @@
+// Telegram WebApp initialization
+const tg = window.Telegram.WebApp;
+tg.expand();
+const telegramId = tg.initDataUnsafe?.user?.id;
+if (telegramId) {
+    localStorage.setItem('telegram_id', telegramId);
+}
+function getTelegramId() {
+    return localStorage.getItem('telegram_id') || telegramId;
+}
+function goBack() {
+    window.history.back();
+}
+
+// ===== TOAST NOTIFICATION FUNCTION =====
+function showToast(message, type = 'success') {
+    const container = document.getElementById('toastContainer');
+    const toast = document.createElement('div');
+    toast.className = `toast ${type}`;
+    toast.textContent = message;
+    container.appendChild(toast);
+
+    setTimeout(() => {
+        toast.remove();
+    }, 3500);
+}
+window.showToast = showToast;
+
+function showSuccessMessage(text) {
+    showToast(text, 'success');
+}
@@ -0,0 +1,54 @@
+let showingFront = true;
+
+function rotateBody() {
+    const frontImg = document.getElementById('frontImage');
+    const backImg = document.getElementById('backImage');
+    const frontDots = document.querySelector('.front-dots');
+    const backDots = document.querySelector('.back-dots');
+
+    if (showingFront) {
+        // Show back
+        frontImg.style.opacity = '0';
+        frontImg.style.transform = 'rotateY(90deg)';
+
+        setTimeout(() => {
+            backImg.style.opacity = '1';
+            backImg.style.transform = 'rotateY(0deg)';
+        }, 300);
+
+        frontDots.style.opacity = '0';
+        setTimeout(() => {
+            frontDots.style.display = 'none';
+            backDots.style.display = 'block';
+            setTimeout(() => {
+                backDots.style.opacity = '1';
+            }, 50);
+        }, 300);
+    } else {
+        // Show front
+        backImg.style.opacity = '0';
+        backImg.style.transform = 'rotateY(-90deg)';
+
+        setTimeout(() => {
+            frontImg.style.opacity = '1';
+            frontImg.style.transform = 'rotateY(0deg)';
+        }, 300);
+
+        backDots.style.opacity = '0';
+        setTimeout(() => {
+            backDots.style.display = 'none';
+            frontDots.style.display = 'block';
+            setTimeout(() => {
+                frontDots.style.opacity = '1';
+            }, 50);
+        }, 300);
+    }
+
+    showingFront = !showingFront;
+}
+
+// Preload back image
+window.addEventListener('load', function() {
+    const backImg = new Image();
+    backImg.src = backImageUrl;
+});
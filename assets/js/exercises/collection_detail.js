@@ -0,0 +1,35 @@
+function addExercises() {
+    window.location.href = addExercisesUrl;
+}
+
+function removeFromCollection(exerciseId, button) {
+    if (confirm('Bu mashqni to\'plamdan o\'chirmoqchimisiz?')) {
+        fetch(`/favorites/collection/${collectionId}/remove/${exerciseId}/`, {
+            method: 'DELETE',
+            headers: {
+                'X-CSRFToken': getCookie('csrftoken')
+            }
+        })
+        .then(response => response.json())
+        .then(data => {
+            if (data.success) {
+                button.closest('.exercise-card').remove();
+            }
+        });
+    }
+}
+
+function getCookie(name) {
+    let cookieValue = null;
+    if (document.cookie && document.cookie !== '') {
+        const cookies = document.cookie.split(';');
+        for (let i = 0; i < cookies.length; i++) {
+            const cookie = cookies[i].trim();
+            if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                break;
+            }
+        }
+    }
+    return cookieValue;
+}
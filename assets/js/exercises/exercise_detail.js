@@ -0,0 +1,78 @@
+// Barcha kontent turlarini boshqaruvchi yagona funksiya
+function showContent(type) {
+    const video = document.getElementById('exerciseVideo');
+    const image = document.getElementById('exerciseImage');
+    const instructionsDisplay = document.getElementById('instructionsDisplay');
+
+    // Tugmalar
+    const imageBtn = document.getElementById('imageBtn');
+    const videoBtn = document.getElementById('videoBtn');
+    const instructionsBtn = document.getElementById('instructionsBtn');
+
+    // Barcha kontent elementlarini vaqtinchalik ro'yxatga olish
+    const allContent = [video, image, instructionsDisplay].filter(el => el !== null);
+    const allBtns = [imageBtn, videoBtn, instructionsBtn].filter(el => el !== null);
+
+    // Barcha elementlarni yashirish
+    allContent.forEach(el => el.classList.add('hidden'));
+    allBtns.forEach(btn => btn.classList.remove('active'));
+
+    // Videoni to'xtatish
+    if (video) video.pause();
+
+    // Tanlangan kontentni ko'rsatish
+    if (type === 'image' && image) {
+        image.classList.remove('hidden');
+        imageBtn.classList.add('active');
+    } else if (type === 'video' && video) {
+        video.classList.remove('hidden');
+        video.play();
+        videoBtn.classList.add('active');
+    } else if (type === 'instructions' && instructionsDisplay) {
+        instructionsDisplay.classList.remove('hidden');
+        instructionsBtn.classList.add('active');
+    }
+}
+
+// Ko'rsatmalarga o'tish funksiyasi
+function viewInstructions() {
+    showContent('instructions');
+}
+
+// Sevimli tugmasi mantig'i
+document.getElementById('favoriteBtn').addEventListener('click', function () {
+    const icon = document.getElementById('favoriteIcon');
+    const btn = document.getElementById('favoriteBtn');
+
+    fetch(toggleFavoriteUrl, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': csrfToken,
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({})
+    }).then(r => r.json()).then(data => {
+
+        if (data.status === 'added') {
+            icon.textContent = '★';
+            btn.classList.add('favorited');
+        } else if (data.status === 'removed') {
+            icon.textContent = '⭐';
+            btn.classList.remove('favorited');
+        } else if (data.message === 'Login required') {
+            alert("Iltimos, avval tizimga kiring.");
+        }
+    }).catch(err => console.error("Sevimli funksiyasi xatoligi:", err));
+});
+
+// Sahifa yuklanganda
+document.addEventListener('DOMContentLoaded', () => {
+    const video = document.getElementById('exerciseVideo');
+    const image = document.getElementById('exerciseImage');
+
+    if (video && (image && image.classList.contains('hidden') || !image)) {
+        showContent('video');
+    } else {
+        showContent('image');
+    }
+});
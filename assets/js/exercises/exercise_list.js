@@ -0,0 +1,299 @@
+// ==========================
+    // HELPERS
+    // ==========================
+    function getCookie(name) {
+        let cookieValue = null;
+        if (document.cookie && document.cookie !== '') {
+            const cookies = document.cookie.split(';');
+            for (let i = 0; i < cookies.length; i++) {
+                const cookie = cookies[i].trim();
+                if (cookie.substring(0, name.length + 1) === (name + '=')) {
+                    cookieValue = decodeURIComponent(cookie.substring(name.length + 1));
+                    break;
+                }
+            }
+        }
+        return cookieValue;
+    }
+
+    const csrftoken = getCookie('csrftoken');
+
+    function escapeHtml(text) {
+        const div = document.createElement('div');
+        div.textContent = text;
+        return div.innerHTML;
+    }
+
+    // ==========================
+    // STATE
+    // ==========================
+    const exerciseFavoriteState = {};
+    let currentExerciseId = null;
+
+    // ==========================
+    // DOM READY
+    // ==========================
+    document.addEventListener('DOMContentLoaded', function () {
+        document.querySelectorAll('.favorite-icon').forEach(icon => {
+            const exerciseId = icon.getAttribute('data-exercise-id');
+            const isFavorited = icon.classList.contains('favorited');
+            exerciseFavoriteState[exerciseId] = isFavorited;
+            icon.addEventListener('click', function (e) {
+                e.preventDefault();
+                e.stopPropagation();
+                handleFavoriteClick(exerciseId);
+            });
+        });
+
+        // Modal click outside
+        document.getElementById('saveOptionsModal').addEventListener('click', e => {
+            if (e.target === e.currentTarget) closeSaveOptions();
+        });
+        document.getElementById('collectionsModal').addEventListener('click', e => {
+            if (e.target === e.currentTarget) closeCollectionsModal();
+        });
+    });
+
+    // ==========================
+    // FAVORITE LOGIC
+    // ==========================
+    function handleFavoriteClick(exerciseId) {
+        const isFavorited = exerciseFavoriteState[exerciseId];
+        if (isFavorited) {
+            removeFromFavorites(exerciseId);
+        } else {
+            openSaveOptionsModal(exerciseId);
+        }
+    }
+
+    function openSaveOptionsModal(exerciseId) {
+        currentExerciseId = exerciseId;
+        document.getElementById('saveOptionsModal').classList.add('active');
+        document.body.style.overflow = 'hidden';
+    }
+
+    function closeSaveOptions() {
+        document.getElementById('saveOptionsModal').classList.remove('active');
+        document.body.style.overflow = '';
+    }
+
+    function saveToDefault(event) {
+        if (event) {
+            event.preventDefault();
+            event.stopPropagation();
+        }
+        const url = `/en/exercises/favorite/toggle/${currentExerciseId}/`;
+        fetch(url, {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrftoken, 'Content-Type': 'application/json'},
+            body: JSON.stringify({})
+        })
+            .then(r => r.json())
+            .then(data => {
+                if (data.status === 'success' || data.status === 'added') {
+                    updateFavoriteState(currentExerciseId, true);
+                    closeSaveOptions();
+                    showSuccessMessage('🌟 Sevimlilarga qo\'shildi!');
+                } else throw new Error(data.error || 'Server xatosi');
+            })
+            .catch(err => {
+                console.error('Save default error:', err);
+                alert('Xatolik yuz berdi!');
+            });
+    }
+
+    function removeFromFavorites(exerciseId) {
+        const url = `/en/exercises/favorite/toggle/${exerciseId}/`;
+        fetch(url, {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrftoken, 'Content-Type': 'application/json'},
+            body: JSON.stringify({})
+        })
+            .then(r => r.json())
+            .then(data => {
+                if (data.status === 'success' || data.status === 'removed') {
+                    updateFavoriteState(exerciseId, false);
+                    showSuccessMessage('☆ Sevimlilardan o\'chirildi!');
+                } else throw new Error(data.error);
+            })
+            .catch(err => {
+                console.error('Remove favorite error:', err);
+                alert('Xatolik yuz berdi!');
+            });
+    }
+
+    function updateFavoriteState(exerciseId, isFavorited) {
+        exerciseFavoriteState[exerciseId] = isFavorited;
+        const favIcon = document.querySelector(`[data-exercise-id="${exerciseId}"]`);
+        if (favIcon) {
+            const span = favIcon.querySelector('span');
+            if (isFavorited) {
+                favIcon.classList.add('favorited');
+                if (span) span.textContent = '🌟';
+            } else {
+                favIcon.classList.remove('favorited');
+                if (span) span.textContent = '☆';
+            }
+        }
+    }
+
+    // ==========================
+    // COLLECTIONS — NO AJAX, only HTML
+    // ==========================
+    function showCollections(event) {
+        if (event) {
+            event.preventDefault();
+            event.stopPropagation();
+        }
+        closeSaveOptions();
+        const modal = document.getElementById('collectionsModal');
+        modal.classList.add('active');
+        document.body.style.overflow = 'hidden';
+    }
+
+    function closeCollectionsModal() {
+        document.getElementById('collectionsModal').classList.remove('active');
+        document.body.style.overflow = '';
+    }
+
+    function saveToCollection(collectionId, event) {
+        if (event) {
+            event.preventDefault();
+            event.stopPropagation();
+        }
+        const url = `/en/favorites/collection/${collectionId}/toggle/`;
+        fetch(url, {
+            method: 'POST',
+            headers: {'X-CSRFToken': csrftoken, 'Content-Type': 'application/json'},
+            body: JSON.stringify({exercise_id: currentExerciseId})
+        })
+            .then(r => r.json())
+            .then(data => {
+                if (data.success) {
+                    updateFavoriteState(currentExerciseId, true);
+                    closeCollectionsModal();
+                    showSuccessMessage('✅ To\'plamga qo\'shildi!');
+                } else throw new Error(data.error || 'Noma\'lum xato');
+            })
+            .catch(err => {
+                console.error('Save to collection error:', err);
+                alert('Xatolik yuz berdi!');
+            });
+    }
+
+    // ==========================
+    // CREATE COLLECTION (MODAL)
+    // ==========================
+    function createCollection(event) {
+        if (event) {
+            event.preventDefault();
+            event.stopPropagation();
+        }
+        closeSaveOptions();
+        document.getElementById('newCollectionName').value = '';
+        document.getElementById('createCollectionModal').style.display = 'flex';
+    }
+
+    function closeCreateCollectionModal() {
+        document.getElementById('createCollectionModal').style.display = 'none';
+    }
+
+    function submitCreateCollection() {
+        const input = document.getElementById('newCollectionName');
+        const name = input.value.trim();
+
+        if (!name) {
+            input.style.borderColor = '#e74c3c';
+            setTimeout(() => input.style.borderColor = '', 500);
+            return;
+        }
+
+        fetch('/en/create/collection/', {
+            method: 'POST',
+            headers: {
+                'X-CSRFToken': csrftoken,
+                'Content-Type': 'application/x-www-form-urlencoded'
+            },
+            body: new URLSearchParams({
+                name: name,
+                exercise_id: currentExerciseId
+            })
+        })
+            .then(r => r.json())
+            .then(data => {
+                if (data.success || data.id) {
+                    showSuccessMessage("📁 Yangi to'plam yaratildi!");
+                    updateFavoriteState(currentExerciseId, true);
+
+                    const modal = document.getElementById('collectionsModal');
+                    if (modal.classList.contains('active')) {
+                        const body = document.getElementById('collectionsBody');
+                        const empty = body.querySelector('.empty-state');
+                        if (empty) empty.remove();
+
+                        const newItem = document.createElement('div');
+                        newItem.className = 'collection-item';
+                        newItem.onclick = (e) => saveToCollection(data.id, e);
+                        newItem.innerHTML = `
+                <div class="collection-item-name">${escapeHtml(name)}</div>
+                <div class="collection-item-count">0 ta mashq</div>
+            `;
+                        body.prepend(newItem);
+                    }
+
+                    closeCreateCollectionModal();
+                } else {
+                    throw new Error(data.error || 'Xatolik');
+                }
+            })
+            .catch(err => {
+                console.error('Create collection error:', err);
+                alert('Xatolik yuz berdi!');
+            });
+    }
+
+    // ==========================
+    // MISC
+    // ==========================
+    function showSuccessMessage(text) {
+        const toast = document.createElement('div');
+        toast.textContent = text;
+        toast.style.cssText = `
+        position: fixed; bottom: 100px; left: 50%; transform: translateX(-50%);
+        background: linear-gradient(135deg, #4caf50 0%, #45a049 100%);
+        color: white; padding: 14px 28px; border-radius: 50px;
+        font-weight: 700; font-size: 14px; z-index: 99999;
+        box-shadow: 0 8px 32px rgba(76,175,80,0.4);
+        animation: toastSlideIn 0.3s ease;
+    `;
+        document.body.appendChild(toast);
+        setTimeout(() => {
+            toast.style.animation = 'toastSlideOut 0.3s ease';
+            setTimeout(() => toast.remove(), 300);
+        }, 2000);
+    }
+
+    const style = document.createElement('style');
+    style.textContent = `
+    @keyframes toastSlideIn {
+        from { opacity:0; transform: translateX(-50%) translateY(20px); }
+        to { opacity:1; transform: translateX(-50%) translateY(0); }
+    }
+    @keyframes toastSlideOut {
+        from { opacity:1; transform: translateX(-50%) translateY(0); }
+        to { opacity:0; transform: translateX(-50%) translateY(-20px); }
+    }
+`;
+    document.head.appendChild(style);
+
+    // Search
+    document.addEventListener('DOMContentLoaded', () => {
+        const input = document.getElementById('searchInput');
+        input?.addEventListener('input', e => {
+            const term = e.target.value.toLowerCase().trim();
+            document.querySelectorAll('.exercise-card').forEach(card => {
+                const name = card.querySelector('.exercise-name').textContent.toLowerCase();
+                card.style.display = name.includes(term) ? 'block' : 'none';
+            });
+        });
+    });
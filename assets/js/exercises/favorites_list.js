@@ -0,0 +1,141 @@
+// CSRF token — Django AJAX uchun majburiy
+const csrfToken = document.querySelector('[name=csrfmiddlewaretoken]').value;
+
+// Tab switching
+function showTab(button, tabName) {
+    document.querySelectorAll('.tab-btn').forEach(btn => btn.classList.remove('active'));
+    button.classList.add('active');
+
+    document.getElementById('favoritesList').style.display = (tabName === 'all' || tabName === 'exercise') ? 'flex' : 'none';
+    document.getElementById('collectionsContainer').style.display = tabName === 'collections' ? 'flex' : 'none';
+    document.getElementById('editionsContainer').style.display = tabName === 'editions' ? 'flex' : 'none';
+}
+
+// Modal ochish/yopish
+function openCollectionModal() {
+    document.getElementById('collectionModal').classList.add('active');
+    document.getElementById('modalTitle').textContent = '📁 New Collection';
+    document.getElementById('collectionName').value = '';
+    // Barcha mashqlarni unselected qilish
+    document.querySelectorAll('.exercise-select-item').forEach(item => {
+        item.classList.remove('selected');
+    });
+}
+
+function closeCollectionModal() {
+    document.getElementById('collectionModal').classList.remove('active');
+}
+
+// Mashqni tanlash
+document.querySelectorAll('.exercise-select-item').forEach(item => {
+    item.addEventListener('click', function () {
+        this.classList.toggle('selected');
+    });
+});
+
+function saveCollection() {
+    const name = document.getElementById('collectionName').value.trim();
+    if (!name) {
+        alert('Collection nomini kiriting');
+        return;
+    }
+
+    const selectedItems = document.querySelectorAll('.exercise-select-item.selected');
+    const exerciseIds = Array.from(selectedItems).map(i => i.dataset.exerciseId);
+
+    const formData = new FormData();
+    formData.append("name", name);
+
+    exerciseIds.forEach(id => {
+        formData.append("exercise_ids[]", id);
+    });
+
+    fetch("/en/create/collection/", {
+        method: "POST",
+        headers: {
+            "X-CSRFToken": csrfToken
+        },
+        body: formData
+    })
+        .then(r => r.json())
+        .then(data => {
+            if (data.success) {
+                closeCollectionModal();
+                location.reload();
+            } else {
+                alert(data.error);
+            }
+        })
+        .catch(err => {
+            console.error(err);
+            alert("Xatolik yuz berdi");
+        });
+}
+
+
+// Sevimlilardan o'chirish
+function unfavorite(favId, btn) {
+    if (!confirm('Remove from favorites?')) return;
+
+    fetch(`/en/favorites/remove/${favId}/`, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': csrfToken
+        }
+    })
+        .then(() => {
+            const item = btn.closest('.favorite-item');
+            item.style.animation = 'slideOutRight 0.5s forwards';
+            setTimeout(() => item.remove(), 500);
+            // Count yangilash
+            let countEl = document.getElementById('total-favorites-count');
+            let count = parseInt(countEl.textContent);
+            countEl.textContent = Math.max(0, count - 1);
+        })
+        .catch(err => {
+            alert('Failed to remove. Please try again.');
+        });
+}
+
+// Collection o'chirish
+function deleteCollection(collectionId, name) {
+    if (!confirm(`Delete collection "${name}"? This cannot be undone.`)) return;
+
+    fetch(`/collections/delete/${collectionId}/`, {
+        method: 'POST',
+        headers: {
+            'X-CSRFToken': csrfToken
+        }
+    })
+        .then(() => {
+            location.reload();
+        })
+        .catch(err => {
+            alert('Failed to delete collection.');
+        });
+}
+
+// Placeholder funksiyalar (premium uchun)
+
+function editCollection(id) {
+    alert('Edit feature coming soon!');
+}
+
+function purchaseEdition(id) {
+    alert('Purchase flow will be implemented soon.');
+}
+
+function startWorkout(id) {
+    window.location.href = `/editions/${id}/start/`;
+}
+
+function viewEditionDetails(id) {
+    window.location.href = `/editions/${id}/`;
+}
+
+// Modal ESC tugmasi bilan yopish
+document.addEventListener('keydown', (e) => {
+    if (e.key === 'Escape' && document.getElementById('collectionModal').classList.contains('active')) {
+        closeCollectionModal();
+    }
+});
@@ -0,0 +1,244 @@
+// -- Telegram WebApp init ------------------------------------------------
+const tg = (window.Telegram && window.Telegram.WebApp) ? window.Telegram.WebApp : null;
+
+// Graceful fallback if not in Telegram WebApp environment
+if (!tg) {
+    console.warn('Telegram WebApp object not found. Running in fallback mode (for dev/testing).');
+} else {
+    // Try to expand the WebApp to full height
+    try {
+        tg.expand();
+    } catch (e) { /* ignore */
+    }
+}
+
+// -- Form state and initialization ---------------------------------------
+const telegramUser = tg?.initDataUnsafe?.user || null;
+
+const formData = {
+    telegram_id: telegramUser?.id || null,
+    first_name: telegramUser?.first_name || '',
+    last_name: telegramUser?.last_name || '',
+    username: telegramUser?.username || '',
+    photo_url: telegramUser?.photo_url || '',
+    gender: '',
+    experience: '',
+    goal: '',
+    motivation: [],
+    days: '',
+    weight: Number(document.getElementById('weightInput')?.value || 63)
+};
+
+// DOM refs
+const totalSteps = 7;
+let currentStep = 1;
+
+// -- Progress handling ---------------------------------------------------
+function updateProgress() {
+    const pct = Math.round((currentStep / totalSteps) * 100);
+    const fill = document.getElementById('progress');
+    if (fill) fill.style.width = pct + '%';
+}
+
+function showStep(step) {
+    const prev = document.querySelector('.question.active');
+    if (prev) prev.classList.remove('active');
+
+    const next = document.querySelector(`.question[data-step="${step}"]`);
+    if (next) next.classList.add('active');
+
+    currentStep = step;
+    updateProgress();
+}
+
+function nextStep() {
+    if (currentStep >= totalSteps) return;
+    showStep(currentStep + 1);
+}
+
+// -- Helpers for option selection ---------------------------------------
+// single group selection: clears other buttons in that group
+function singleSelect(groupRoot, value) {
+    const buttons = groupRoot.querySelectorAll('.option-btn');
+    buttons.forEach(btn => {
+        if (btn.dataset.value === value) btn.classList.add('selected');
+        else btn.classList.remove('selected');
+    });
+}
+
+// wire up single-choice groups
+function wireSingleGroup(containerId, fieldName, autoNext = true) {
+    const root = document.getElementById(containerId);
+    if (!root) return;
+    root.addEventListener('click', (e) => {
+        const btn = e.target.closest('.option-btn');
+        if (!btn) return;
+        const value = btn.dataset.value;
+        if (!value) return;
+
+        // set data
+        formData[fieldName] = value;
+        singleSelect(root, value);
+
+        // reflect goal in final badge if needed
+        if (fieldName === 'goal') {
+            document.getElementById('finalGoal').innerHTML = value.replace(/_/g, ' ').toUpperCase();
+        }
+
+        if (autoNext) {
+            // tiny delay so UI shows selected state
+            setTimeout(nextStep, 180);
+        }
+    });
+}
+
+// wire single-choice groups used in app
+wireSingleGroup('genderOptions', 'gender', true);
+wireSingleGroup('expOptions', 'experience', true);
+wireSingleGroup('goalOptions', 'goal', true);
+wireSingleGroup('daysOptions', 'days', true);
+
+// -- Multi-select (motivation) ------------------------------------------
+(function wireMultiMotivation() {
+    const root = document.getElementById('motivationOptions');
+    if (!root) return;
+    root.addEventListener('click', (e) => {
+        const btn = e.target.closest('.option-btn');
+        if (!btn) return;
+        const value = btn.dataset.value;
+        if (!value) return;
+
+        const idx = formData.motivation.indexOf(value);
+        if (idx === -1) {
+            formData.motivation.push(value);
+            btn.classList.add('selected');
+        } else {
+            formData.motivation.splice(idx, 1);
+            btn.classList.remove('selected');
+        }
+    });
+
+    document.getElementById('motivationContinue').addEventListener('click', () => {
+        if (!formData.motivation.length) {
+            if (tg && tg.showAlert) tg.showAlert('Please select at least one option');
+            else alert('Please select at least one option');
+            return;
+        }
+        nextStep();
+    });
+})();
+
+// -- Weight input handling ----------------------------------------------
+const weightInput = document.getElementById('weightInput');
+if (weightInput) {
+    weightInput.addEventListener('input', (e) => {
+        const v = Number(e.target.value || 0);
+        if (!isNaN(v)) formData.weight = v;
+    });
+
+    document.getElementById('weightNext').addEventListener('click', () => {
+        // basic validation
+        const w = Number(weightInput.value || 0);
+        if (!w || w < 30 || w > 300) {
+            if (tg && tg.showAlert) tg.showAlert('Please enter a valid weight (30 - 300 kg).');
+            else alert('Please enter a valid weight (30 - 300 kg).');
+            return;
+        }
+        formData.weight = w;
+        nextStep();
+    });
+}
+
+// -- Submit handler -----------------------------------------------------
+async function submitQuestionnaire() {
+    // minimal validation before submit
+    if (!formData.telegram_id) {
+        if (tg && tg.showAlert) tg.showAlert('Error: Telegram ID not found. Please restart the bot.');
+        else alert('Error: Telegram ID not found. Please restart the bot.');
+        return;
+    }
+
+    // Provide user feedback using MainButton when available
+    try {
+        if (tg && tg.MainButton) {
+            tg.MainButton.setText('Submitting...');
+            try {
+                tg.MainButton.showProgress();
+            } catch (err) { /* ignore if not available */
+            }
+            try {
+                tg.MainButton.show();
+            } catch (err) { /* ignore */
+            }
+        }
+    } catch (e) { /* ignore */
+    }
+
+    try {
+        const res = await fetch(submitUrl, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify(formData)
+        });
+
+        const data = await res.json().catch(() => ({success: false}));
+
+        // hide progress
+        try {
+            if (tg && tg.MainButton && tg.MainButton.hideProgress) tg.MainButton.hideProgress();
+        } catch (e) {
+        }
+
+        if (data && data.success) {
+            // success — redirect or show success message
+            if (data.redirect_url) {
+                window.location.href = data.redirect_url;
+            } else {
+                if (tg && tg.showAlert) {
+                    tg.showAlert('Success! Your plan is being prepared.');
+                    // Redirect to workouts page
+                    window.location.href = '';
+                } else {
+                    alert('Success! Your plan is being prepared.');
+                }
+                // Optionally close WebApp: tg.close(); (only if appropriate)
+            }
+        } else {
+            const errMsg = data && data.error ? data.error : 'Unknown error from server';
+            if (tg && tg.showAlert) tg.showAlert('Error: ' + errMsg);
+            else alert('Error: ' + errMsg);
+        }
+    } catch (err) {
+        try {
+            if (tg && tg.MainButton && tg.MainButton.hideProgress) tg.MainButton.hideProgress();
+        } catch (e) {
+        }
+        if (tg && tg.showAlert) tg.showAlert('Network error. Please try again.');
+        else alert('Network error. Please try again.');
+        console.error('Network error submitting questionnaire:', err);
+    }
+}
+
+// wire final submit button
+document.getElementById('submitBtn').addEventListener('click', submitQuestionnaire);
+
+// initial UI update
+updateProgress();
+
+// If you want, pre-fill some UI from existing formData (e.g., highlight selected if loaded)
+(function initialHighlight() {
+    // highlight gender if known
+    if (formData.gender) singleSelect(document.getElementById('genderOptions'), formData.gender);
+    if (formData.experience) singleSelect(document.getElementById('expOptions'), formData.experience);
+    if (formData.goal) singleSelect(document.getElementById('goalOptions'), formData.goal);
+    if (formData.days) singleSelect(document.getElementById('daysOptions'), formData.days);
+    // motivations
+    if (Array.isArray(formData.motivation) && formData.motivation.length) {
+        formData.motivation.forEach(val => {
+            const b = document.querySelector(`#motivationOptions .option-btn[data-value="${val}"]`);
+            if (b) b.classList.add('selected');
+        });
+    }
+    // finalGoal badge
+    if (formData.goal) document.getElementById('finalGoal').innerHTML = formData.goal.replace(/_/g, ' ').toUpperCase();
+})();
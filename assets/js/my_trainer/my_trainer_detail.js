@@ -0,0 +1,112 @@
+let currentDay = 0;
+let totalDays = 16;
+let startX = 0;
+let currentX = 0;
+let isDragging = false;
+
+const wrapper = document.getElementById('workoutDaysWrapper');
+const workoutDays = document.querySelectorAll('.workout-day');
+const prevBtn = document.getElementById('prevDay');
+const nextBtn = document.getElementById('nextDay');
+const indicatorsContainer = document.getElementById('dayIndicators');
+const dayTitle = document.getElementById('dayTitle');
+const daySubtitle = document.getElementById('daySubtitle');
+
+function initIndicators() {
+    // Faqat 2 ta indicator - current va next day
+    indicatorsContainer.innerHTML = '';
+
+    // Current day indicator
+    const currentDot = document.createElement('div');
+    currentDot.className = 'day-dot active';
+    indicatorsContainer.appendChild(currentDot);
+
+    // Next day indicator (agar mavjud bo'lsa)
+    if (currentDay < totalDays - 1) {
+        const nextDot = document.createElement('div');
+        nextDot.className = 'day-dot';
+        indicatorsContainer.appendChild(nextDot);
+    }
+}
+
+function updateView() {
+    wrapper.style.transform = `translateX(-${currentDay * 100}%)`;
+
+    workoutDays.forEach((day, index) => {
+        day.classList.toggle('active', index === currentDay);
+    });
+
+    // Indicators ni yangilash
+    initIndicators();
+
+    const activeDay = workoutDays[currentDay];
+    if (activeDay) {
+        dayTitle.textContent = activeDay.dataset.title;
+        daySubtitle.textContent = activeDay.dataset.subtitle;
+    }
+
+    prevBtn.classList.toggle('disabled', currentDay === 0);
+    nextBtn.classList.toggle('disabled', currentDay === totalDays - 1);
+}
+
+function previousDay() {
+    if (currentDay > 0) {
+        currentDay--;
+        updateView();
+    }
+}
+
+function nextDay() {
+    if (currentDay < totalDays - 1) {
+        currentDay++;
+        updateView();
+    }
+}
+
+function goToDay(dayIndex) {
+    currentDay = dayIndex;
+    updateView();
+}
+
+// Touch/Swipe - telefon ekranida surganda ishlaydi
+let touchStartTime = 0;
+
+wrapper.addEventListener('touchstart', (e) => {
+    startX = e.touches[0].clientX;
+    touchStartTime = Date.now();
+    isDragging = true;
+}, { passive: true });
+
+wrapper.addEventListener('touchmove', (e) => {
+    if (!isDragging) return;
+    currentX = e.touches[0].clientX;
+}, { passive: true });
+
+wrapper.addEventListener('touchend', () => {
+    if (!isDragging) return;
+    isDragging = false;
+
+    const diff = startX - currentX;
+    const touchDuration = Date.now() - touchStartTime;
+    const threshold = 50; // minimum swipe distance
+    const velocityThreshold = 300; // ms for quick swipe
+
+    // Agar tez swipe qilsa yoki yetarli masofaga siljisa
+    if (Math.abs(diff) > threshold || touchDuration < velocityThreshold) {
+        if (diff > 30 && currentDay < totalDays - 1) {
+            nextDay();
+        } else if (diff < -30 && currentDay > 0) {
+            previousDay();
+        }
+    }
+});
+
+function startWorkout() {
+    const dayId = workoutDays[currentDay].getAttribute('data-day');
+    window.location.href = `` + dayId;
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    initIndicators();
+    updateView();
+});
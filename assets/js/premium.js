@@ -0,0 +1,35 @@
+function choosePlan(btn) {
+    document.querySelectorAll(".plan-btn").forEach(b => b.classList.remove("selected"));
+    btn.classList.add("selected");
+
+    const plan = btn.dataset.plan;
+
+    // redirect to payment page
+    redirectTo(`/payment?plan=${plan}`);
+}
+
+function redirectTo(url) {
+    window.location.href = url;
+}
+
+function closePremium() {
+    const modal = document.getElementById("premiumModal");
+    modal.style.opacity = "0";
+    modal.style.pointerEvents = "none";
+
+    setTimeout(() => {
+        modal.remove();
+        window.history.back();
+    }, 300);
+}
+
+
+// close if click outside
+document.getElementById("premiumModal").addEventListener("click", function(e){
+    if (e.target === this) closePremium();
+});
+
+// close on ESC
+document.addEventListener("keydown", e => {
+    if (e.key === "Escape") closePremium();
+});
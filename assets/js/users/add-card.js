@@ -0,0 +1,29 @@
+function onlyDigits(input) {
+    input.value = input.value.replace(/\D/g, "");
+}
+
+function formatCard(input) {
+    input.value = input.value
+        .replace(/\D/g, "")
+        .replace(/(.{4})/g, "$1 ")
+        .trim();
+}
+
+function formatExpire(input) {
+    input.value = input.value
+        .replace(/\D/g, "")
+        .replace(/(\d{2})(\d{0,2})/, "$1/$2");
+}
+
+function purchase() {
+    const card = document.getElementById("cardNumber").value.replace(/\s/g, "");
+    const exp = document.getElementById("expire").value;
+    const cvc = document.getElementById("cvc").value;
+
+    if (card.length !== 16) return alert("Karta raqami noto‘g‘ri!");
+    if (exp.length !== 5) return alert("Amal qilish muddati xato!");
+    if (cvc.length !== 3) return alert("CVC noto‘g‘ri!");
+
+    alert("To‘lov serverga yuborildi!");
+    // fetch("/api/payment", {method:"POST", body: JSON.stringify(...)})
+}
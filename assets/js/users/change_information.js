@@ -0,0 +1,94 @@
+const modal = document.getElementById('cardModal');
+const cardNumberInput = document.getElementById('cardNumber');
+const expiryDateInput = document.getElementById('expiryDate');
+const cvvInput = document.getElementById('cvv');
+const errorMessage = document.getElementById('errorMessage');
+const cardUpdateForm = document.getElementById('cardUpdateForm');
+
+function openModal() {
+    modal.classList.add('active');
+    document.body.style.overflow = 'hidden';
+}
+
+function closeModal() {
+    modal.classList.remove('active');
+    document.body.style.overflow = '';
+    errorMessage.classList.remove('show');
+}
+
+// Close modal when clicking outside
+modal.addEventListener('click', function(e) {
+    if (e.target === modal) {
+        closeModal();
+    }
+});
+
+// Card number formatting
+cardNumberInput.addEventListener('input', function(e) {
+    let value = e.target.value.replace(/\s/g, '');
+    let formattedValue = value.match(/.{1,4}/g)?.join(' ') || value;
+    e.target.value = formattedValue;
+});
+
+// Expiry date formatting
+expiryDateInput.addEventListener('input', function(e) {
+    let value = e.target.value.replace(/\D/g, '');
+    if (value.length >= 2) {
+        value = value.slice(0, 2) + '/' + value.slice(2, 4);
+    }
+    e.target.value = value;
+});
+
+// CVV - only numbers
+cvvInput.addEventListener('input', function(e) {
+    e.target.value = e.target.value.replace(/\D/g, '');
+});
+
+// Form submission
+cardUpdateForm.addEventListener('submit', function(e) {
+    e.preventDefault();
+
+    const cardNumber = cardNumberInput.value.replace(/\s/g, '');
+    const expiryDate = expiryDateInput.value;
+    const cvv = cvvInput.value;
+
+    // Basic validation
+    if (cardNumber.length !== 16) {
+        showError('Karta raqami 16 ta raqamdan iborat bo\'lishi kerak');
+        return;
+    }
+
+    if (expiryDate.length !== 5 || !expiryDate.includes('/')) {
+        showError('Amal qilish muddati noto\'g\'ri formatda');
+        return;
+    }
+
+    if (cvv.length !== 3) {
+        showError('CVV 3 ta raqamdan iborat bo\'lishi kerak');
+        return;
+    }
+
+    // Simulate card validation
+    if (cardNumber.startsWith('6782')) {
+        showError('Неизвестный тип карты');
+    } else {
+        // Success
+        document.getElementById('currentCard').textContent =
+            '**** **** **** ' + cardNumber.slice(-4);
+
+        setTimeout(() => {
+            alert('Karta muvaffaqiyatli yangilandi! ✅');
+            closeModal();
+            cardUpdateForm.reset();
+        }, 500);
+    }
+});
+
+function showError(message) {
+    errorMessage.textContent = message;
+    errorMessage.classList.add('show');
+
+    setTimeout(() => {
+        errorMessage.classList.remove('show');
+    }, 4000);
+}
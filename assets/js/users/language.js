@@ -0,0 +1,30 @@
+// Handle language selection with smooth animations
+document.querySelectorAll('input[name="language"]').forEach(radio => {
+    radio.addEventListener('change', function() {
+        document.querySelectorAll('.language-item').forEach(item => {
+            item.classList.remove('active');
+        });
+        this.closest('.language-item').classList.add('active');
+    });
+});
+
+// Handle label clicks
+document.querySelectorAll('.language-item').forEach(item => {
+    item.addEventListener('click', function(e) {
+        const radio = this.querySelector('input[type="radio"]');
+        if (radio) {
+            radio.checked = true;
+            radio.dispatchEvent(new Event('change'));
+        }
+    });
+});
+
+// Auto-hide alerts after 5 seconds
+setTimeout(() => {
+    document.querySelectorAll('.alert').forEach(alert => {
+        alert.style.transition = 'all 0.3s ease';
+        alert.style.opacity = '0';
+        alert.style.transform = 'translateY(-20px)';
+        setTimeout(() => alert.remove(), 300);
+    });
+}, 5000);
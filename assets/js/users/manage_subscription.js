@@ -0,0 +1,46 @@
+// Edit button functionality
+document.querySelector('.edit-btn').addEventListener('click', function(e) {
+    e.stopPropagation();
+    this.style.transform = 'rotate(360deg) scale(1.2)';
+    setTimeout(() => {
+        this.style.transform = '';
+    }, 300);
+    alert('Tahrirlash sahifasiga o\'tish...');
+});
+
+// Action cards functionality
+const actionCards = document.querySelectorAll('.action-card');
+actionCards.forEach(card => {
+    card.addEventListener('click', function() {
+        const title = this.querySelector('.action-title').textContent;
+
+        if (title.includes('bekor qilish')) {
+            if (confirm('Obunani bekor qilishni xohlaysizmi?\n\nObuna 2025-yil 11-Oktabr da yakunlanadi.')) {
+                alert('Obuna bekor qilindi');
+            }
+        } else if (title.includes('qaytarish')) {
+            if (confirm('Obunani qayta faollashtirishni xohlaysizmi?')) {
+                alert('Obuna qayta faollashtirildi');
+            }
+        }
+    });
+});
+
+// Bottom button
+function goBack() {
+    history.back();
+}
+
+// Animation on scroll
+const observer = new IntersectionObserver((entries) => {
+    entries.forEach(entry => {
+        if (entry.isIntersecting) {
+            entry.target.style.opacity = '1';
+            entry.target.style.transform = 'translateY(0)';
+        }
+    });
+});
+
+document.querySelectorAll('.action-card').forEach(card => {
+    observer.observe(card);
+});
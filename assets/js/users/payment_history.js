@@ -0,0 +1,38 @@
+// Filter functionality
+const filterTabs = document.querySelectorAll('.filter-tab');
+const paymentItems = document.querySelectorAll('.payment-item');
+
+filterTabs.forEach(tab => {
+    tab.addEventListener('click', function() {
+        // Remove active class from all tabs
+        filterTabs.forEach(t => t.classList.remove('active'));
+        // Add active class to clicked tab
+        this.classList.add('active');
+
+        const filter = this.textContent.trim();
+
+        paymentItems.forEach(item => {
+            if (filter === 'Hammasi') {
+                item.style.display = 'block';
+            } else if (filter === 'Muvaffaqiyatli' && item.classList.contains('success')) {
+                item.style.display = 'block';
+            } else if (filter === 'Kutilmoqda' && item.classList.contains('pending')) {
+                item.style.display = 'block';
+            } else if (filter === 'Bekor qilingan' && item.classList.contains('failed')) {
+                item.style.display = 'block';
+            } else {
+                item.style.display = 'none';
+            }
+        });
+    });
+});
+
+// Add click animation to payment items
+paymentItems.forEach(item => {
+    item.addEventListener('click', function() {
+        this.style.transform = 'scale(0.98)';
+        setTimeout(() => {
+            this.style.transform = '';
+        }, 200);
+    });
+});
@@ -0,0 +1,48 @@
+// Period selector
+document.querySelectorAll('.period-btn').forEach(btn => {
+    btn.addEventListener('click', function() {
+        document.querySelectorAll('.period-btn').forEach(b => b.classList.remove('active'));
+        this.classList.add('active');
+        // Here you can add AJAX call to load data for selected period
+    });
+});
+
+// Chart filter: Workouts (hafta kunlari) -> Volume -> Max weight (haftalar)
+document.querySelector('.chart-filter').addEventListener('click', function() {
+    const series = Array.from(document.querySelectorAll('.chart-series'));
+    const current = series.findIndex(item => !item.hidden);
+    const next = series[(current + 1) % series.length];
+    series.forEach(item => { item.hidden = item !== next; });
+    this.textContent = next.dataset.metric;
+});
+
+// Achievement badges
+document.querySelectorAll('.achievement-badge:not(.locked)').forEach(badge => {
+    badge.addEventListener('click', function() {
+        // Show achievement details modal
+        const name = this.querySelector('.achievement-name').textContent;
+        alert(`Achievement: ${name}\n\nCongratulations! You've earned this badge!`);
+    });
+});
+
+// History items
+document.querySelectorAll('.history-item').forEach(item => {
+    item.addEventListener('click', function() {
+        const title = this.querySelector('.history-title').textContent;
+        // Navigate to workout detail page
+        console.log('View workout:', title);
+    });
+});
+
+// Animate stats on load
+document.addEventListener('DOMContentLoaded', function() {
+    const statValues = document.querySelectorAll('.stat-value');
+    statValues.forEach((stat, index) => {
+        setTimeout(() => {
+            stat.style.transform = 'scale(1.1)';
+            setTimeout(() => {
+                stat.style.transform = 'scale(1)';
+            }, 300);
+        }, index * 100);
+    });
+});
@@ -0,0 +1,14 @@
+function logout() {
+    if(confirm('Haqiqatan ham chiqmoqchimisiz?')) {
+        window.location.href = '#';
+    }
+}
+
+document.addEventListener('DOMContentLoaded', function () {
+    const progressBar = document.querySelector('.progress-bar');
+    if (progressBar) {
+        const targetWidth = progressBar.style.width;
+        progressBar.style.width = '0%';
+        setTimeout(() => progressBar.style.width = targetWidth, 300);
+    }
+});
@@ -0,0 +1,13 @@
+function goBack() {
+    window.history.back();
+}
+
+// Touch feedback
+document.querySelectorAll('.edition-card').forEach(card => {
+    card.addEventListener('touchstart', function() {
+        this.style.transform = 'scale(0.98)';
+    });
+    card.addEventListener('touchend', function() {
+        this.style.transform = '';
+    });
+});
@@ -0,0 +1,9 @@
+// Smooth scroll behavior
+document.querySelectorAll('.program-card').forEach(card => {
+    card.addEventListener('touchstart', function() {
+        this.style.transform = 'scale(0.98)';
+    });
+    card.addEventListener('touchend', function() {
+        this.style.transform = '';
+    });
+});
@@ -1,6 +1,7 @@
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
 load_dotenv('.env')
@@ -33,6 +34,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'apps.middleware.RequestProfilingMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -40,6 +42,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'apps.middleware.EntitlementMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -77,6 +80,68 @@ DATABASES = {
     }
 }
 
+# DB_ENGINE=sqlite - PostgreSQL siz lokal ishga tushirish va check_query_budgets uchun
+if os.getenv('DB_ENGINE') == 'sqlite':
+    DATABASES = {
+        "default": {
+            "ENGINE": "django.db.backends.sqlite3",
+            "NAME": BASE_DIR / 'db.sqlite3',
+            # Workerlar threadlaridan parallel yozish uchun
+            "OPTIONS": {"transaction_mode": "IMMEDIATE", "timeout": 20},
+        }
+    }
+
+# Cache
+# CACHE_BACKEND: locmem - har bir process uchun LRU + TTL, file - workerlar orasida umumiy fayl keshi,
+# redis - Redis protokoliga mos server (lokal muqobil server bilan almashtirish mumkin, redis-py talab qilinadi)
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'locmem')
+CACHE_TIMEOUT = int(os.getenv('CACHE_TIMEOUT', 300))
+CACHE_STATS_ENABLED = True
+# Namespace versiyalari bazada (CacheNamespace); keshdagi nusxa shuncha sekund ishlatiladi
+CACHE_NAMESPACE_TTL = int(os.getenv('CACHE_NAMESPACE_TTL', 5))
+
+CACHE_BACKENDS = {
+    'locmem': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'fitness',
+        'OPTIONS': {'MAX_ENTRIES': 5000, 'CULL_FREQUENCY': 4},
+    },
+    'file': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', os.path.join(BASE_DIR, '.cache')),
+        'OPTIONS': {'MAX_ENTRIES': 20000},
+    },
+    'redis': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': os.getenv('CACHE_LOCATION', 'redis://127.0.0.1:6379/1'),
+    },
+}
+
+CACHES = {
+    'default': {
+        **CACHE_BACKENDS[CACHE_BACKEND],
+        'TIMEOUT': CACHE_TIMEOUT,
+        'KEY_PREFIX': 'fitness',
+    }
+}
+# gunicorn/uvicorn worker soni. locmem har process uchun alohida - bir nechta worker da fragment va
+# ma'lumot keshlari bir-biridan bexabar qoladi
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 1))
+if CACHE_BACKEND == 'locmem' and WEB_CONCURRENCY > 1:
+    raise ImproperlyConfigured("WEB_CONCURRENCY > 1 uchun CACHE_BACKEND=file yoki redis kerak (locmem process ichida)")
+
+# Request profiling (apps.middleware.RequestProfilingMiddleware) - natijalar: /api/profiling/ va profiling_report
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', 0.1))
+PROFILING_BATCH_SIZE = 50
+PROFILING_FLUSH_SECONDS = 30
+# Eski namunalar apps.tasks.purge_request_samples tomonidan har kuni o'chiriladi
+PROFILING_RETENTION_DAYS = int(os.getenv('PROFILING_RETENTION_DAYS', 14))
+
+# Exercise search: auto - PostgreSQL da full-text + pg_trgm (avval: manage.py setup_search_indexes),
+# boshqa bazalarda sof Python trigram indeksi
+SEARCH_BACKEND = os.getenv('SEARCH_BACKEND', 'auto')
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -112,6 +177,22 @@ STATIC_ROOT = os.path.join(BASE_DIR, 'static')
 MEDIA_URL = 'media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
 
+# collectstatic: kontent hash li nomlar + .gz/.br variantlar (DEBUG da runserver asl fayllarni beradi)
+STORAGES = {
+    'default': {'BACKEND': 'django.core.files.storage.FileSystemStorage'},
+    'staticfiles': {
+        'BACKEND': ('django.contrib.staticfiles.storage.StaticFilesStorage' if DEBUG
+                    else 'apps.storage.CompressedManifestStaticFilesStorage'),
+    },
+}
+# Shablonlardan ajratilgan CSS/JS manbalari va build_assets natijasi (static 'bundles/' ostida, gitda yo'q)
+ASSETS_SOURCE_DIR = BASE_DIR / 'assets'
+ASSETS_BUILD_DIR = BASE_DIR / 'apps' / 'static' / 'bundles'
+# STATIC_ROOT/MEDIA_ROOT ni wsgi/asgi ichida beradi (apps.serving) - nginx bo'lsa o'chiriladi
+SERVE_STATIC = os.getenv('SERVE_STATIC', 'true').lower() == 'true'
+# Hash siz fayllar uchun Cache-Control max-age (sekund); hash lilar bir yil immutable
+STATIC_MAX_AGE = int(os.getenv('STATIC_MAX_AGE', 60 * 60))
+
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
@@ -128,18 +209,53 @@ CORS_ALLOW_ALL_ORIGINS = True
 # Telegram Bot Settings
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 TELEGRAM_WEBHOOK_URL = os.getenv('TELEGRAM_WEBHOOK_URL', default='')
+# setWebhook secret_token - webhook X-Telegram-Bot-Api-Secret-Token headerini tekshiradi
+TELEGRAM_WEBHOOK_SECRET = os.getenv('TELEGRAM_WEBHOOK_SECRET', default='')
+# Bot API manzili - lokal sinov uchun fake server: python manage.py fake_telegram_api
+TELEGRAM_API_URL = os.getenv('TELEGRAM_API_URL', default='https://api.telegram.org')
+# Broadcast: bir vaqtdagi so'rovlar va sekundiga xabarlar (Telegram limiti ~30/s)
+BROADCAST_CONCURRENCY = int(os.getenv('BROADCAST_CONCURRENCY', 20))
+BROADCAST_RATE = float(os.getenv('BROADCAST_RATE', 25))
+
+# Video transcoding (run_transcode_worker)
+FFMPEG_BINARY = os.getenv('FFMPEG_BINARY', default='ffmpeg')
+FFPROBE_BINARY = os.getenv('FFPROBE_BINARY', default='ffprobe')
+TRANSCODE_PROCESSES = int(os.getenv('TRANSCODE_PROCESSES', 2))
+TRANSCODE_TIMEOUT = 30 * 60  # sekund
+TRANSCODE_MAX_ATTEMPTS = 3
+
+# Rasm derivative lari (run_image_worker): shu kengliklarda WebP va JPEG
+IMAGE_DERIVATIVE_WIDTHS = (320, 640, 960, 1280)
+IMAGE_WEBP_QUALITY = 80
+IMAGE_JPEG_QUALITY = 82
 
 # Click Merchant Settings
 CLICK_MERCHANT_ID = os.getenv('CLICK_MERCHANT_ID', default='')
 CLICK_SERVICE_ID = os.getenv('CLICK_SERVICE_ID', default='')
 CLICK_SECRET_KEY = os.getenv('CLICK_SECRET_KEY', default='')
 CLICK_MERCHANT_USER_ID = os.getenv('CLICK_MERCHANT_USER_ID', default='')
+CLICK_RETURN_URL = os.getenv('CLICK_RETURN_URL', default='')
+CLICK_API_URL = os.getenv('CLICK_API_URL', default='https://api.click.uz/v2')
+CLICK_POOL_SIZE = 20
+CLICK_CONNECT_TIMEOUT = float(os.getenv('CLICK_CONNECT_TIMEOUT', 3.05))
+CLICK_READ_TIMEOUT = float(os.getenv('CLICK_READ_TIMEOUT', 15))
+CLICK_RETRIES = 2
+CLICK_BREAKER_THRESHOLD = 5
+CLICK_BREAKER_RESET = 30  # sekund
 
 # Subscription Settings
 SUBSCRIPTION_MONTHLY_PRICE = 67000  # UZS
 TRIAL_DAYS = 1
 TRIAL_PROGRAMS_LIMIT = 1
 
+# Avtomatik yangilash: obuna tugashidan RENEWAL_LEAD_HOURS oldin, muvaffaqiyatsizlikda
+# RENEWAL_RETRY_HOURS dan keyin qayta, ko'pi bilan RENEWAL_MAX_ATTEMPTS marta
+RENEWAL_LEAD_HOURS = 24
+RENEWAL_RETRY_HOURS = 8
+RENEWAL_MAX_ATTEMPTS = 3
+RENEWAL_CHUNK_SIZE = 200
+RENEWAL_CONCURRENCY = int(os.getenv('RENEWAL_CONCURRENCY', 10))
+
 ADMIN_ID = os.getenv('ADMIN_ID')
 
 JAZZMIN_SETTINGS = {
@@ -14,3 +14,11 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'root.settings')
 
 application = get_wsgi_application()
+
+from django.conf import settings  # noqa: E402
+
+if settings.SERVE_STATIC:
+    # Static/media fayllar Django dan oldin: hash li nomlar immutable, .br/.gz, Range
+    from apps.serving import ServeStaticWSGI  # noqa: E402
+
+    application = ServeStaticWSGI(application)